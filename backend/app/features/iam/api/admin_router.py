@@ -1,19 +1,51 @@
 import uuid
-from fastapi import APIRouter, Depends, HTTPException, status
-from app.shared.web.deps import get_current_active_superuser, get_uow
+from typing import Optional, Tuple
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from app.shared.web.deps import (
+    get_current_active_superuser,
+    get_cursor_params,
+    get_page_params,
+    get_read_uow,
+    get_uow,
+)
+from app.shared.web.fields import IDENTITY_FIELDS, sparse_fields, sparse_response
+from app.shared.web.conditional import (
+    PRECONDITION_FAILED_RESPONSES,
+    if_match_version,
+    resource_etag,
+    set_validators,
+)
 from app.shared.infrastructure.uow import IUnitOfWork
 from app.features.iam.application.admin.queries.get_user_list import (
     GetUserListAdminHandler,
     GetUserListAdminQuery,
+    GetUserListByCursorAdminHandler,
+    GetUserListByCursorAdminQuery,
 )
 from app.features.iam.application.admin.queries.get_user_by_id import (
     GetUserByIdAdminHandler,
     GetUserByIdAdminQuery,
 )
 from app.shared.application.exceptions import ResourceNotFoundError
-from app.shared.schemas import PageParams, Paginated
+from app.shared.schemas import CursorPaginated, CursorParams, PageParams, Paginated
 from ..domain.user import User
-from ..schemas import UserInDBAdmin, UserUpdateAdmin, UserPublic
+from ..schemas import (
+    UserImportFormat,
+    UserImportResult,
+    UserInDBAdmin,
+    UserUpdateAdmin,
+    UserPublic,
+)
 from ..application.admin.commands.update_user import (
     UpdateUserAdminCommand,
     UpdateUserAdminHandler,
@@ -22,57 +54,105 @@ from ..application.admin.commands.delete_user import (
     DeleteUserAdminCommand,
     DeleteUserAdminHandler,
 )
+from ..application.admin.commands.import_users import (
+    ImportUsersAdminCommand,
+    ImportUsersAdminHandler,
+)
 
 router = APIRouter()
 
+user_fields = sparse_fields(UserInDBAdmin)
+# Keyset pages also need their sort key, to make the next cursor of.
+user_cursor_fields = sparse_fields(UserInDBAdmin, (*IDENTITY_FIELDS, "username"))
+
 
 @router.get("", response_model=Paginated[UserInDBAdmin])
 async def read_users_admin(
-    pagination: PageParams = Depends(),  # <-- 使用分页依赖
-    uow: IUnitOfWork = Depends(get_uow),
+    response: Response,
+    pagination: PageParams = Depends(get_page_params),  # <-- 使用分页依赖
+    fields: Optional[Tuple[str, ...]] = Depends(user_fields),
+    uow: IUnitOfWork = Depends(get_read_uow),
     current_user: User = Depends(get_current_active_superuser),
 ):
     """
     Retrieve a paginated list of all users. (Admin access required)
+    With `fields`, only those fields of each user are read and returned.
     """
-    query = GetUserListAdminQuery(page_params=pagination)
+    query = GetUserListAdminQuery(page_params=pagination, fields=fields)
     handler = GetUserListAdminHandler(uow)
-    return await handler.handle(query)
+    page = await handler.handle(query)
+    return page if fields is None else sparse_response(page, response)
+
+
+@router.get("/cursor", response_model=CursorPaginated[UserInDBAdmin])
+async def read_users_by_cursor_admin(
+    response: Response,
+    pagination: CursorParams = Depends(get_cursor_params),
+    fields: Optional[Tuple[str, ...]] = Depends(user_cursor_fields),
+    uow: IUnitOfWork = Depends(get_read_uow),
+    current_user: User = Depends(get_current_active_superuser),
+):
+    """
+    Retrieve all users ordered by username, using keyset pagination.
+    (Admin access required) With `fields`, only those fields of each user
+    are read and returned.
+    """
+    query = GetUserListByCursorAdminQuery(cursor_params=pagination, fields=fields)
+    handler = GetUserListByCursorAdminHandler(uow)
+    page = await handler.handle(query)
+    return page if fields is None else sparse_response(page, response)
 
 
 @router.get("/{user_id}", response_model=UserInDBAdmin)
 async def read_user_by_id_admin(
     user_id: uuid.UUID,
-    uow: IUnitOfWork = Depends(get_uow),
+    response: Response,
+    fields: Optional[Tuple[str, ...]] = Depends(user_fields),
+    uow: IUnitOfWork = Depends(get_read_uow),
     current_user: User = Depends(get_current_active_superuser),
 ):
     """
-    Get a specific user by ID (for admins).
+    Get a specific user by ID (for admins). With `fields`, only those fields
+    are read from the database and returned.
     """
-    query = GetUserByIdAdminQuery(user_id=user_id)
+    query = GetUserByIdAdminQuery(user_id=user_id, fields=fields)
     handler = GetUserByIdAdminHandler(uow)
     try:
-        return await handler.handle(query)
+        user = await handler.handle(query)
     except ResourceNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    return user if fields is None else sparse_response(user, response)
 
 
-@router.put("/{user_id}", response_model=UserPublic)
+@router.put(
+    "/{user_id}", response_model=UserPublic, responses=PRECONDITION_FAILED_RESPONSES
+)
 async def update_user_admin(
     user_id: uuid.UUID,
     user_in: UserUpdateAdmin,
+    request: Request,
+    response: Response,
     uow: IUnitOfWork = Depends(get_uow),
     current_user: User = Depends(get_current_active_superuser),
 ):
     """
     Update a user's information by admin.
+
+    Send the user's `ETag` in `If-Match` to update it only if nobody changed
+    it in the meantime; otherwise the response is 412 and nothing changes.
     """
-    command = UpdateUserAdminCommand(user_id_to_update=user_id, update_data=user_in)
+    command = UpdateUserAdminCommand(
+        user_id_to_update=user_id,
+        update_data=user_in,
+        expected_version=if_match_version(request, user_id),
+    )
     handler = UpdateUserAdminHandler(uow)
     try:
-        return await handler.handle(command)
-    except Exception as e:
+        user = await handler.handle(command)
+    except ResourceNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    set_validators(response, resource_etag(user.id, user.version), user.updated_at)
+    return user
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -93,3 +173,32 @@ async def delete_user_admin(
         await handler.handle(command)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@router.post("/import", response_model=UserImportResult)
+async def import_users_admin(
+    file: UploadFile = File(
+        ..., description="NDJSON or CSV file with username, email and password."
+    ),
+    format: Optional[UserImportFormat] = Query(
+        None, description="File format. Inferred from the file name if omitted."
+    ),
+    uow: IUnitOfWork = Depends(get_uow),
+    current_user: User = Depends(get_current_active_superuser),
+):
+    """
+    Bulk-create users from an uploaded file. (Admin access required)
+    Rows that are invalid or conflict with existing users are reported
+    individually and do not abort the import.
+    """
+    if format is None:
+        filename = (file.filename or "").lower()
+        format = (
+            UserImportFormat.CSV
+            if filename.endswith(".csv")
+            else UserImportFormat.NDJSON
+        )
+
+    command = ImportUsersAdminCommand(file=file, format=format)
+    handler = ImportUsersAdminHandler(uow)
+    return await handler.handle(command)
@@ -5,6 +5,7 @@ from app.features.iam.application.auth.commands.register import (
     RegisterUserHandler,
 )
 from app.features.iam.application.auth.commands.login import LoginCommand, LoginHandler
+from app.shared.application.exceptions import AuthorizationError
 from app.shared.infrastructure.uow import IUnitOfWork
 from app.shared.web.deps import get_uow
 from ..schemas import Token, UserCreate, UserPublic
@@ -21,7 +22,9 @@ async def login_for_access_token(
     handler = LoginHandler(uow)
     try:
         return await handler.handle(command)
-    except Exception as e:
+    except AuthorizationError as e:
+        # Anything else, e.g. a saturated CPU executor (503), is mapped by the
+        # exception middleware.
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
 
 
@@ -1,10 +1,30 @@
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
 from app.shared.web.deps import get_current_active_user, get_file_storage, get_uow
+from app.shared.web.conditional import (
+    NOT_MODIFIED_RESPONSES,
+    PRECONDITION_FAILED_RESPONSES,
+    if_match_version,
+    is_not_modified,
+    not_modified,
+    resource_etag,
+    set_validators,
+)
 from app.features.iam.application.user.commands.update_profile import (
     UpdateProfileCommand,
     UpdateProfileHandler,
 )
 from app.shared.infrastructure.uow import IUnitOfWork
+from app.shared.application.exceptions import ResourceNotFoundError
+from app.shared.domain.exceptions import BusinessRuleViolationError
 from app.features.iam.application.user.commands.upload_avatar import (
     UploadAvatarCommand,
     UploadAvatarHandler,
@@ -16,28 +36,59 @@ from ..domain.user import User
 router = APIRouter()
 
 
-@router.get("/me", response_model=UserPublic)
-async def read_users_me(current_user: User = Depends(get_current_active_user)):
+@router.get("/me", response_model=UserPublic, responses=NOT_MODIFIED_RESPONSES)
+async def read_users_me(
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Get the current user's profile.
+
+    Supports conditional requests with `If-None-Match` (the `ETag`) and
+    `If-Modified-Since` (the `Last-Modified` date), answered with a 304.
+    """
+    # The principal is already loaded (or cached), so the check is free.
+    etag = resource_etag(current_user.id, current_user.version)
+    if is_not_modified(request, etag, current_user.updated_at):
+        return not_modified(etag, current_user.updated_at)
+
+    set_validators(response, etag, current_user.updated_at)
     return current_user
 
 
-@router.put("/me", response_model=UserPublic)
+@router.put("/me", response_model=UserPublic, responses=PRECONDITION_FAILED_RESPONSES)
 async def update_user_me(
     profile_data: UserUpdateProfile,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_active_user),
     uow: IUnitOfWork = Depends(get_uow),
 ):
     """
     Update current user's profile.
+
+    Send the profile's `ETag` in `If-Match` to update it only if it was not
+    changed in the meantime (e.g. from another device); otherwise the
+    response is 412 and nothing changes.
     """
-    command = UpdateProfileCommand(user_id=current_user.id, profile_data=profile_data)
+    command = UpdateProfileCommand(
+        user_id=current_user.id,
+        profile_data=profile_data,
+        expected_version=if_match_version(request, current_user.id),
+    )
     handler = UpdateProfileHandler(uow)
     try:
         updated_user = await handler.handle(command)
-        return updated_user
-    except Exception as e:
+    except (ResourceNotFoundError, BusinessRuleViolationError) as e:
         # This can be handled by a global exception middleware
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    set_validators(
+        response,
+        resource_etag(updated_user.id, updated_user.version),
+        updated_user.updated_at,
+    )
+    return updated_user
 
 
 @router.put("/me/avatar", response_model=UserPublic)
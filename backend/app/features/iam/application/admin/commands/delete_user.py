@@ -3,6 +3,7 @@ from pydantic import BaseModel
 from app.shared.application.exceptions import ResourceNotFoundError
 from app.shared.domain.exceptions import BusinessRuleViolationError
 from app.features.iam.infra.user_repository import UserRepository
+from app.features.iam.infra.principal_cache import principal_cache
 from app.shared.infrastructure.uow import IUnitOfWork
 
 
@@ -26,3 +27,5 @@ class DeleteUserAdminHandler:
                 raise ResourceNotFoundError("User not found.")
 
             await repo.remove(db_user=db_user)
+
+        principal_cache.invalidate(command.user_id_to_delete)
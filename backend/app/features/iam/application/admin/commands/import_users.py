@@ -0,0 +1,127 @@
+import asyncio
+import time
+from typing import List, Tuple
+from fastapi import UploadFile
+from pydantic import BaseModel, ValidationError
+from app.config import settings
+from app.shared.infrastructure.concurrency.cpu_executor import cpu_executor
+from app.shared.infrastructure.uow import IUnitOfWork
+from app.features.iam.domain.user import User
+from app.features.iam.infra.user_repository import UserRepository
+from app.features.iam.infra.security import get_password_hash_async, is_password_hash
+from app.features.iam.infra.user_import_parser import iter_import_records
+from app.features.iam.schemas import (
+    UserImportFormat,
+    UserImportResult,
+    UserImportRow,
+    UserImportRowError,
+)
+
+
+class ImportUsersAdminCommand(BaseModel):
+    file: UploadFile
+    format: UserImportFormat
+
+
+class ImportUsersAdminHandler:
+    """
+    Streams user records from an NDJSON or CSV upload and creates them in
+    batches. Each batch is hashed in parallel on the CPU executor and written
+    in its own transaction; invalid or conflicting rows are reported per line
+    without aborting the rest of the import.
+    """
+
+    def __init__(self, uow: IUnitOfWork, batch_size: int | None = None):
+        self.uow = uow
+        self.batch_size = batch_size or settings.USER_IMPORT_BATCH_SIZE
+
+    async def handle(self, command: ImportUsersAdminCommand) -> UserImportResult:
+        started_at = time.perf_counter()
+        total = 0
+        created = 0
+        errors: List[UserImportRowError] = []
+        batch: List[Tuple[int, UserImportRow]] = []
+
+        async for record in iter_import_records(command.file, command.format):
+            total += 1
+            if record.error:
+                errors.append(UserImportRowError(line=record.line, detail=record.error))
+                continue
+            try:
+                row = UserImportRow.model_validate(record.data)
+            except ValidationError as e:
+                errors.append(
+                    UserImportRowError(line=record.line, detail=_format_errors(e))
+                )
+                continue
+
+            batch.append((record.line, row))
+            if len(batch) >= self.batch_size:
+                created += await self._import_batch(batch, errors)
+                batch = []
+
+        if batch:
+            created += await self._import_batch(batch, errors)
+
+        elapsed = time.perf_counter() - started_at
+        errors.sort(key=lambda error: error.line)
+        return UserImportResult(
+            total=total,
+            created=created,
+            failed=total - created,
+            errors=errors,
+            elapsed_seconds=round(elapsed, 3),
+            rows_per_second=round(total / elapsed, 1) if elapsed > 0 else 0.0,
+        )
+
+    async def _import_batch(
+        self, batch: List[Tuple[int, UserImportRow]], errors: List[UserImportRowError]
+    ) -> int:
+        hashes = await self._hash_passwords([row for _, row in batch])
+
+        users: List[Tuple[int, User, str]] = []
+        for (line, row), hashed_password in zip(batch, hashes):
+            if hashed_password is None:
+                errors.append(
+                    UserImportRowError(line=line, detail="Unrecognized password hash.")
+                )
+                continue
+            user = User(username=row.username, email=row.email)
+            users.append((line, user, hashed_password))
+
+        async with self.uow:
+            repo = self.uow.get_repository(UserRepository)
+            created_ids = await repo.bulk_create_with_password_identities(
+                [(user, hashed_password) for _, user, hashed_password in users]
+            )
+
+        for line, user, _ in users:
+            if user.id not in created_ids:
+                errors.append(
+                    UserImportRowError(
+                        line=line, detail="Email or username already exists."
+                    )
+                )
+        return len(created_ids)
+
+    async def _hash_passwords(self, rows: List[UserImportRow]) -> List[str | None]:
+        # Keep at most one hash per worker in flight, so an import never fills
+        # the executor queue that interactive logins depend on.
+        semaphore = asyncio.Semaphore(cpu_executor.max_workers)
+
+        async def hash_one(row: UserImportRow) -> str | None:
+            if row.password_hash:
+                return (
+                    row.password_hash if is_password_hash(row.password_hash) else None
+                )
+            async with semaphore:
+                return await get_password_hash_async(row.password)
+
+        return await asyncio.gather(*(hash_one(row) for row in rows))
+
+
+def _format_errors(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in e['loc']) or 'row'}: {e['msg']}"
+        for e in error.errors()
+    )
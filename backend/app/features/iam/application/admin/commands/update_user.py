@@ -1,14 +1,27 @@
 import uuid
+from typing import Optional
 from pydantic import BaseModel
-from app.shared.application.exceptions import ResourceNotFoundError
+from sqlalchemy.exc import IntegrityError
+from app.shared.application.exceptions import (
+    ConcurrencyConflictError,
+    ResourceNotFoundError,
+)
+from app.shared.domain.exceptions import BusinessRuleViolationError
+from app.shared.infrastructure.db.errors import get_violated_constraint
+from app.features.iam.application.exceptions import DUPLICATE_USER_MESSAGES
 from app.features.iam.schemas import UserUpdateAdmin, UserPublic
+from app.features.iam.infra.identity_repository import IdentityRepository
+from app.features.iam.infra.security import get_password_hash_async
 from app.features.iam.infra.user_repository import UserRepository
+from app.features.iam.infra.principal_cache import principal_cache
 from app.shared.infrastructure.uow import IUnitOfWork
 
 
 class UpdateUserAdminCommand(BaseModel):
     user_id_to_update: uuid.UUID
     update_data: UserUpdateAdmin
+    # When set, the update only applies if the user is still at this version.
+    expected_version: Optional[int] = None
 
 
 class UpdateUserAdminHandler:
@@ -16,15 +29,39 @@ class UpdateUserAdminHandler:
         self.uow = uow
 
     async def handle(self, command: UpdateUserAdminCommand) -> UserPublic:
+        # Hash before the transaction starts, so it is not held open meanwhile.
+        hashed_password = None
+        if command.update_data.password:
+            hashed_password = await get_password_hash_async(
+                command.update_data.password
+            )
+
         async with self.uow:
             repo = self.uow.get_repository(UserRepository)
 
-            db_user = await repo.get(command.user_id_to_update)
-            if not db_user:
+            try:
+                updated_user = await repo.update_by_admin(
+                    user_id=command.user_id_to_update,
+                    user_in=command.update_data,
+                    expected_version=command.expected_version,
+                )
+            except IntegrityError as e:
+                message = DUPLICATE_USER_MESSAGES.get(get_violated_constraint(e))
+                if message is None:
+                    raise
+                raise BusinessRuleViolationError(message) from e
+            if not updated_user:
+                # Only a failed update pays for telling the cases apart.
+                if await repo.get_version(command.user_id_to_update):
+                    raise ConcurrencyConflictError(
+                        "The user was modified by someone else."
+                    )
                 raise ResourceNotFoundError("User not found.")
+            if hashed_password is not None:
+                identity_repo = self.uow.get_repository(IdentityRepository)
+                await identity_repo.set_password_credentials(
+                    updated_user.id, hashed_password
+                )
 
-            # 注意：密码更新逻辑应该更复杂，需要操作IdentityRepository，这里是简化版
-            updated_user = await repo.update_by_admin(
-                db_user=db_user, user_in=command.update_data
-            )
+        principal_cache.invalidate(command.user_id_to_update)
         return UserPublic.model_validate(updated_user)
@@ -1,6 +1,8 @@
 import uuid
+from typing import Optional, Tuple
 from pydantic import BaseModel
 from app.shared.infrastructure.uow import IUnitOfWork
+from app.shared.schemas import dto_from
 from app.shared.application.exceptions import ResourceNotFoundError
 from app.features.iam.schemas import UserInDBAdmin
 from app.features.iam.infra.user_repository import UserRepository
@@ -8,6 +10,8 @@ from app.features.iam.infra.user_repository import UserRepository
 
 class GetUserByIdAdminQuery(BaseModel):
     user_id: uuid.UUID
+    # A sparse fieldset: only these columns are loaded and returned.
+    fields: Optional[Tuple[str, ...]] = None
 
 
 class GetUserByIdAdminHandler:
@@ -17,7 +21,10 @@ class GetUserByIdAdminHandler:
     async def handle(self, query: GetUserByIdAdminQuery) -> UserInDBAdmin:
         async with self.uow:
             repo = self.uow.get_repository(UserRepository)
-            user = await repo.get(query.user_id)
+            if query.fields is not None:
+                user = await repo.get_columns(query.user_id, columns=query.fields)
+            else:
+                user = await repo.get(query.user_id)
             if not user:
                 raise ResourceNotFoundError("User not found.")
-            return UserInDBAdmin.model_validate(user)
+            return dto_from(UserInDBAdmin, user, query.fields)
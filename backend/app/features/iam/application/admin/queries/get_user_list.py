@@ -1,12 +1,23 @@
+from typing import Optional, Tuple
 from pydantic import BaseModel
 from app.shared.infrastructure.uow import IUnitOfWork
-from app.shared.schemas import Paginated, PageParams
+from app.shared.schemas import (
+    CursorPaginated,
+    CursorParams,
+    Paginated,
+    PageParams,
+    decode_cursor,
+    dto_from,
+    encode_cursor,
+)
 from app.features.iam.schemas import UserInDBAdmin
 from app.features.iam.infra.user_repository import UserRepository
 
 
 class GetUserListAdminQuery(BaseModel):
     page_params: PageParams
+    # A sparse fieldset: only these columns are loaded and returned.
+    fields: Optional[Tuple[str, ...]] = None
 
 
 class GetUserListAdminHandler:
@@ -14,18 +25,54 @@ class GetUserListAdminHandler:
         self.uow = uow
 
     async def handle(self, query: GetUserListAdminQuery) -> Paginated[UserInDBAdmin]:
-        users_from_db = []
-        total_count = 0
-
         async with self.uow:
             repo = self.uow.get_repository(UserRepository)
-            users_from_db, total_count = await repo.get_multi_paginated(
-                skip=query.page_params.offset, limit=query.page_params.size
+            page = await repo.get_multi_paginated(
+                skip=query.page_params.offset,
+                limit=query.page_params.size,
+                count_strategy=query.page_params.count_strategy,
+                columns=query.fields,
             )
 
         # --- Post-transaction processing ---
-        user_dtos = [UserInDBAdmin.model_validate(user) for user in users_from_db]
+        user_dtos = [dto_from(UserInDBAdmin, user, query.fields) for user in page.items]
 
         return Paginated.create(
-            items=user_dtos, total=total_count, params=query.page_params
+            items=user_dtos,
+            total=page.total,
+            params=query.page_params,
+            has_next=page.has_next,
+        )
+
+
+class GetUserListByCursorAdminQuery(BaseModel):
+    cursor_params: CursorParams
+    # A sparse fieldset: only these columns are loaded and returned. It must
+    # include `username`, the sort key that the next cursor is made of.
+    fields: Optional[Tuple[str, ...]] = None
+
+
+class GetUserListByCursorAdminHandler:
+    def __init__(self, uow: IUnitOfWork):
+        self.uow = uow
+
+    async def handle(
+        self, query: GetUserListByCursorAdminQuery
+    ) -> CursorPaginated[UserInDBAdmin]:
+        params = query.cursor_params
+        after = decode_cursor(params.cursor, str)[0] if params.cursor else None
+
+        async with self.uow:
+            repo = self.uow.get_repository(UserRepository)
+            users_from_db, has_next = await repo.get_multi_keyset(
+                after=after, limit=params.size, columns=query.fields
+            )
+
+        user_dtos = [
+            dto_from(UserInDBAdmin, user, query.fields) for user in users_from_db
+        ]
+        next_cursor = encode_cursor(user_dtos[-1].username) if has_next else None
+
+        return CursorPaginated.create(
+            items=user_dtos, next_cursor=next_cursor, params=params
         )
@@ -0,0 +1,7 @@
+# Maps the unique indexes a user write can hit to user-facing error messages.
+DUPLICATE_USER_MESSAGES = {
+    "ix_user_email": "Email already registered.",
+    "ix_user_username": "Username already exists.",
+    # e.g. a new username that equals another user's email
+    "ix_identity_provider_provider_user_id": "Email or username already exists.",
+}
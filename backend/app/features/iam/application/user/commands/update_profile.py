@@ -1,14 +1,25 @@
 import uuid
+from typing import Optional
 from pydantic import BaseModel
+from sqlalchemy.exc import IntegrityError
 from app.shared.infrastructure.uow import IUnitOfWork
-from app.shared.application.exceptions import ResourceNotFoundError
+from app.shared.infrastructure.db.errors import get_violated_constraint
+from app.shared.application.exceptions import (
+    ConcurrencyConflictError,
+    ResourceNotFoundError,
+)
+from app.shared.domain.exceptions import BusinessRuleViolationError
+from app.features.iam.application.exceptions import DUPLICATE_USER_MESSAGES
 from app.features.iam.schemas import UserUpdateProfile, UserPublic
 from app.features.iam.infra.user_repository import UserRepository
+from app.features.iam.infra.principal_cache import principal_cache
 
 
 class UpdateProfileCommand(BaseModel):
     user_id: uuid.UUID
     profile_data: UserUpdateProfile
+    # When set, the update only applies if the user is still at this version.
+    expected_version: Optional[int] = None
 
 
 class UpdateProfileHandler:
@@ -18,11 +29,25 @@ class UpdateProfileHandler:
     async def handle(self, command: UpdateProfileCommand) -> UserPublic:
         async with self.uow:
             user_repo = self.uow.get_repository(UserRepository)
-            db_user = await user_repo.get(command.user_id)
-            if not db_user:
+
+            try:
+                updated_user = await user_repo.update_profile(
+                    user_id=command.user_id,
+                    user_in=command.profile_data,
+                    expected_version=command.expected_version,
+                )
+            except IntegrityError as e:
+                message = DUPLICATE_USER_MESSAGES.get(get_violated_constraint(e))
+                if message is None:
+                    raise
+                raise BusinessRuleViolationError(message) from e
+            if not updated_user:
+                # Only a failed update pays for telling the cases apart.
+                if await user_repo.get_version(command.user_id):
+                    raise ConcurrencyConflictError(
+                        "The profile was modified by someone else."
+                    )
                 raise ResourceNotFoundError("User not found.")
 
-            updated_user = await user_repo.update_profile(
-                db_user=db_user, user_in=command.profile_data
-            )
+        principal_cache.invalidate(command.user_id)
         return UserPublic.model_validate(updated_user)
@@ -5,6 +5,7 @@ from pydantic import BaseModel
 from app.shared.infrastructure.uow import IUnitOfWork
 from app.shared.infrastructure.storage.interface import IFileStorage
 from app.features.iam.infra.user_repository import UserRepository
+from app.features.iam.infra.principal_cache import principal_cache
 from app.features.iam.schemas import UserPublic
 from app.config import settings
 
@@ -52,4 +53,5 @@ class UploadAvatarHandler:
 
             # The UoW will commit the change to the user model
 
+        principal_cache.invalidate(command.user_id)
         return UserPublic.model_validate(user)
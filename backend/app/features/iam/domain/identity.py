@@ -1,8 +1,10 @@
 import uuid
 from enum import Enum
 from typing import TYPE_CHECKING, Optional
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship
 from app.shared.domain.entity import Entity
+from app.shared.domain.ids import uuid7
 
 if TYPE_CHECKING:
     from .user import User
@@ -24,20 +26,31 @@ class Identity(Entity, table=True):
     This table is the core of the Identity/Entity separation pattern.
     """
 
+    # Logins look identities up by (provider, provider_user_id), and each
+    # provider identifier may belong to only one user.
+    __table_args__ = (
+        Index(
+            "ix_identity_provider_provider_user_id",
+            "provider",
+            "provider_user_id",
+            unique=True,
+        ),
+    )
+
     # The 'id' is inherited from Entity.
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True, nullable=False)
+    id: uuid.UUID = Field(default_factory=uuid7, primary_key=True, nullable=False)
 
     # Foreign key to the User aggregate root.
     user_id: uuid.UUID = Field(foreign_key="user.id", index=True)
     user: Optional["User"] = Relationship(back_populates="identities")
 
     # The authentication provider.
-    provider: IdentityProvider = Field(index=True)
+    provider: IdentityProvider
 
     # The user's unique identifier within the provider's system.
     # For 'password', this is the username or email.
     # For 'google', this is the 'sub' claim.
-    provider_user_id: str = Field(index=True)
+    provider_user_id: str
 
     # The credentials for this identity, if applicable.
     # For 'password', this stores the hashed password.
@@ -2,6 +2,7 @@ import uuid
 from typing import TYPE_CHECKING, List, Optional
 from sqlmodel import Field, Relationship
 from app.shared.domain.aggregate_root import AggregateRoot
+from app.shared.domain.ids import uuid7
 from app.shared.domain.exceptions import BusinessRuleViolationError
 
 if TYPE_CHECKING:
@@ -15,8 +16,11 @@ class User(AggregateRoot, table=True):
     but explicitly DOES NOT contain any authentication credentials like passwords.
     """
 
+    # Read the version columns back on flush; see AggregateRoot.
+    __mapper_args__ = {"eager_defaults": True}
+
     # The 'id' is inherited from AggregateRoot -> Entity.
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True, nullable=False)
+    id: uuid.UUID = Field(default_factory=uuid7, primary_key=True, nullable=False)
 
     username: str = Field(index=True, unique=True, max_length=50)
     email: str = Field(unique=True, index=True, max_length=100)
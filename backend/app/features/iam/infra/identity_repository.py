@@ -1,9 +1,18 @@
 import uuid
-from typing import Optional
-from sqlmodel import select
+from typing import NamedTuple, Optional
+from sqlmodel import select, update
 from sqlmodel.ext.asyncio.session import AsyncSession
 from ..domain.identity import Identity, IdentityProvider
-from .security import get_password_hash
+from ..domain.user import User
+from .security import get_password_hash_async
+
+
+class IdentityCredentials(NamedTuple):
+    """The subset of an identity and its user that a login needs."""
+
+    user_id: uuid.UUID
+    credentials: Optional[str]
+    is_active: bool
 
 
 class IdentityRepository:
@@ -18,10 +27,28 @@ class IdentityRepository:
         )
         return (await self.session.exec(statement)).first()
 
+    async def get_credentials_by_provider(
+        self, provider: IdentityProvider, provider_user_id: str
+    ) -> Optional[IdentityCredentials]:
+        """
+        Fetches an identity's credentials together with its user's active flag
+        in one joined query, served by the (provider, provider_user_id) index.
+        """
+        statement = (
+            select(Identity.user_id, Identity.credentials, User.is_active)
+            .join(User, User.id == Identity.user_id)
+            .where(
+                Identity.provider == provider,
+                Identity.provider_user_id == provider_user_id,
+            )
+        )
+        row = (await self.session.exec(statement)).first()
+        return IdentityCredentials(*row) if row else None
+
     async def create_password_identity(
         self, user_id: uuid.UUID, identifier: str, password: str
     ) -> Identity:
-        hashed_password = get_password_hash(password)
+        hashed_password = await get_password_hash_async(password)
         db_identity = Identity(
             user_id=user_id,
             provider=IdentityProvider.PASSWORD,
@@ -30,3 +57,20 @@ class IdentityRepository:
         )
         self.session.add(db_identity)
         return db_identity
+
+    async def set_password_credentials(
+        self, user_id: uuid.UUID, hashed_password: str
+    ) -> None:
+        """
+        Sets the password hash of all of a user's password identities (one
+        per identifier, sharing the hash) in a single UPDATE. Does not commit.
+        """
+        statement = (
+            update(Identity)
+            .where(
+                Identity.user_id == user_id,
+                Identity.provider == IdentityProvider.PASSWORD,
+            )
+            .values(credentials=hashed_password)
+        )
+        await self.session.exec(statement)
@@ -0,0 +1,61 @@
+import uuid
+from typing import Dict, Optional, Set, Tuple
+from app.config import settings
+from app.shared.infrastructure.cache.memory import TTLCache
+from ..domain.user import User
+
+_CacheKey = Tuple[str, str]
+
+
+class PrincipalCache:
+    """
+    A bounded, in-process LRU cache of authenticated principals with a TTL.
+
+    Entries are keyed by (user_id, token), so a user logged in from several
+    devices has one entry per token. The cache is local to the worker process:
+    command handlers invalidate it after they commit a change to a user, and
+    the TTL bounds how long other workers may serve a stale principal.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self._entries: TTLCache[_CacheKey, User] = TTLCache(
+            max_size, ttl_seconds, on_evict=self._unindex
+        )
+        self._keys_by_user: Dict[str, Set[_CacheKey]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._entries.enabled
+
+    def get(self, user_id: uuid.UUID | str, token: str) -> Optional[User]:
+        return self._entries.get((str(user_id), token))
+
+    def set(self, user_id: uuid.UUID | str, token: str, user: User) -> None:
+        if not self.enabled:
+            return
+
+        key = (str(user_id), token)
+        self._keys_by_user.setdefault(key[0], set()).add(key)
+        self._entries.set(key, user)
+
+    def invalidate(self, user_id: uuid.UUID | str) -> None:
+        """Drops every cached principal (one per token) for the given user."""
+        for key in self._keys_by_user.pop(str(user_id), set()):
+            self._entries.delete(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_user.clear()
+
+    def _unindex(self, key: _CacheKey) -> None:
+        user_keys = self._keys_by_user.get(key[0])
+        if user_keys is not None:
+            user_keys.discard(key)
+            if not user_keys:
+                del self._keys_by_user[key[0]]
+
+
+principal_cache = PrincipalCache(
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
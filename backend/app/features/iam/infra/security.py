@@ -3,6 +3,7 @@ from typing import Any
 from passlib.context import CryptContext
 from jose import jwt
 from app.config import settings
+from app.shared.infrastructure.concurrency.cpu_executor import cpu_executor
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -15,6 +16,21 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def is_password_hash(value: str) -> bool:
+    """Checks whether a value is a hash that `pwd_context` can verify against."""
+    return pwd_context.identify(value) is not None
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Like `verify_password`, but runs on the CPU executor."""
+    return await cpu_executor.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Like `get_password_hash`, but runs on the CPU executor."""
+    return await cpu_executor.run(get_password_hash, password)
+
+
 def create_access_token(subject: Any, expires_delta: timedelta | None = None) -> str:
     if expires_delta:
         expire = datetime.now(timezone.utc) + expires_delta
@@ -0,0 +1,83 @@
+import codecs
+import csv
+import json
+from typing import Any, AsyncIterator, Dict, NamedTuple, Optional
+from fastapi import UploadFile
+from app.shared.application.exceptions import InvalidCommandError
+from ..schemas import UserImportFormat
+
+# Read the upload in 64KB chunks so memory use does not depend on file size.
+CHUNK_SIZE = 64 * 1024
+
+
+class ImportRecord(NamedTuple):
+    line: int
+    data: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+async def iter_lines(file: UploadFile) -> AsyncIterator[tuple[int, str]]:
+    """Yields (line_number, line) pairs, decoding the file incrementally."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    line_number = 0
+    try:
+        while chunk := await file.read(CHUNK_SIZE):
+            buffer += decoder.decode(chunk)
+            *lines, buffer = buffer.split("\n")
+            for line in lines:
+                line_number += 1
+                yield line_number, line.rstrip("\r")
+        buffer += decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        raise InvalidCommandError("Import file must be UTF-8 encoded.")
+
+    if buffer:
+        yield line_number + 1, buffer.rstrip("\r")
+
+
+async def iter_ndjson_records(file: UploadFile) -> AsyncIterator[ImportRecord]:
+    async for line_number, line in iter_lines(file):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield ImportRecord(line=line_number, error=f"Invalid JSON: {e.msg}.")
+            continue
+        if not isinstance(data, dict):
+            yield ImportRecord(line=line_number, error="Expected a JSON object.")
+            continue
+        yield ImportRecord(line=line_number, data=data)
+
+
+async def iter_csv_records(file: UploadFile) -> AsyncIterator[ImportRecord]:
+    """
+    Parses a CSV file with a header row. Records are parsed line by line,
+    so quoted fields must not contain line breaks.
+    """
+    header: Optional[list[str]] = None
+    async for line_number, line in iter_lines(file):
+        if not line.strip():
+            continue
+        values = next(csv.reader([line]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield ImportRecord(
+                line=line_number,
+                error=f"Expected {len(header)} columns, got {len(values)}.",
+            )
+            continue
+        # Empty cells are treated as missing values.
+        data = {name: value for name, value in zip(header, values) if value != ""}
+        yield ImportRecord(line=line_number, data=data)
+
+
+def iter_import_records(
+    file: UploadFile, format: UserImportFormat
+) -> AsyncIterator[ImportRecord]:
+    if format == UserImportFormat.CSV:
+        return iter_csv_records(file)
+    return iter_ndjson_records(file)
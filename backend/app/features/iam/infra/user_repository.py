@@ -1,7 +1,21 @@
 import uuid
-from typing import List, Optional, Tuple
-from sqlmodel import func, select
+from collections import Counter
+from typing import List, Optional, Sequence, Set, Tuple
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy import Row, literal, true, values
+from sqlmodel import delete, insert, select
 from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import Select, SelectOfScalar
+from app.shared.domain.ids import uuid7
+from app.shared.infrastructure.db.pagination import (
+    Page,
+    keyset_page,
+    paginate,
+    split_page,
+)
+from app.shared.infrastructure.db.updates import update_returning
+from app.shared.schemas import CountStrategy
+from ..domain.identity import Identity, IdentityProvider
 from ..domain.user import User
 from ..schemas import UserCreate, UserUpdateAdmin, UserUpdateProfile
 
@@ -10,9 +24,26 @@ class UserRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    @staticmethod
+    def _select(columns: Optional[Sequence[str]]) -> Select | SelectOfScalar:
+        """
+        SELECTs whole users or, for sparse fieldsets, only the named columns
+        (at least two), which come back as rows in that order.
+        """
+        if columns is None:
+            return select(User)
+        return select(*(getattr(User, name) for name in columns))
+
     async def get(self, user_id: uuid.UUID) -> Optional[User]:
         return await self.session.get(User, user_id)
 
+    async def get_columns(
+        self, user_id: uuid.UUID, columns: Sequence[str]
+    ) -> Optional[Row]:
+        """Gets only the named columns of a user."""
+        statement = self._select(columns).where(User.id == user_id)
+        return (await self.session.exec(statement)).first()
+
     async def get_by_email(self, email: str) -> Optional[User]:
         statement = select(User).where(User.email == email)
         return (await self.session.exec(statement)).first()
@@ -28,6 +59,114 @@ class UserRepository:
         # Commit is handled by Unit of Work
         return db_user
 
+    async def create_with_password_identities(
+        self, user_in: UserCreate, hashed_password: str
+    ) -> User:
+        """
+        Creates a user and its email and username password identities in a
+        single INSERT statement, using a data-modifying CTE for the user row.
+
+        Duplicates are not checked beforehand; the unique constraints raise an
+        IntegrityError, which the caller translates. The identity rows are
+        selected from the CTE, so the user row (and its constraints) is always
+        written first.
+        """
+        db_user = User(**user_in.model_dump(exclude={"password"}))
+        identities = [
+            Identity(
+                user_id=db_user.id,
+                provider=IdentityProvider.PASSWORD,
+                provider_user_id=identifier,
+                credentials=hashed_password,
+            )
+            for identifier in (db_user.email, db_user.username)
+        ]
+
+        identity_table = Identity.__table__
+        user_cte = (insert(User).values(**db_user.model_dump()).returning(User.id)).cte(
+            "new_user"
+        )
+        identity_values = values(
+            identity_table.c.id,
+            identity_table.c.provider_user_id,
+            name="new_identity",
+        ).data([(identity.id, identity.provider_user_id) for identity in identities])
+        statement = insert(Identity).from_select(
+            ["id", "user_id", "provider", "provider_user_id", "credentials"],
+            select(
+                identity_values.c.id,
+                user_cte.c.id,
+                literal(IdentityProvider.PASSWORD, identity_table.c.provider.type),
+                identity_values.c.provider_user_id,
+                literal(hashed_password, identity_table.c.credentials.type),
+            ).select_from(user_cte.join(identity_values, true())),
+        )
+        await self.session.exec(statement)
+        return db_user
+
+    async def bulk_create_with_password_identities(
+        self, users: Sequence[Tuple[User, str]]
+    ) -> Set[uuid.UUID]:
+        """
+        Inserts many users, each with its email and username password identities.
+        Rows are passed as executemany parameters, which SQLAlchemy sends as
+        multi-row INSERT statements with a cached compiled form.
+
+        :param users: Pairs of (new user, hashed password).
+        :return: The ids of the users that were inserted. Users whose email or
+                 username already exists, as a user's or as another identity's
+                 identifier (in the tables or earlier in the batch), are
+                 skipped rather than failing the whole batch.
+        """
+        if not users:
+            return set()
+
+        user_statement = pg_insert(User).on_conflict_do_nothing().returning(User.id)
+        result = await self.session.exec(
+            user_statement, params=[user.model_dump() for user, _ in users]
+        )
+        created_ids = set(result.scalars())
+        if not created_ids:
+            return created_ids
+
+        identifiers = {
+            user.id: set((user.email, user.username))
+            for user, _ in users
+            if user.id in created_ids
+        }
+        identity_rows = [
+            {
+                "id": uuid7(),
+                "user_id": user.id,
+                "provider": IdentityProvider.PASSWORD,
+                "provider_user_id": identifier,
+                "credentials": hashed_password,
+            }
+            for user, hashed_password in users
+            if user.id in created_ids
+            for identifier in identifiers[user.id]
+        ]
+        identity_statement = (
+            pg_insert(Identity).on_conflict_do_nothing().returning(Identity.user_id)
+        )
+        result = await self.session.exec(identity_statement, params=identity_rows)
+        inserted = Counter(result.scalars())
+
+        # A user missing an identity could not log in with that identifier
+        # (e.g. their username is another user's email): take them out again.
+        incomplete = [
+            user_id
+            for user_id, user_identifiers in identifiers.items()
+            if inserted[user_id] < len(user_identifiers)
+        ]
+        if incomplete:
+            await self.session.exec(
+                delete(Identity).where(Identity.user_id.in_(incomplete))
+            )
+            await self.session.exec(delete(User).where(User.id.in_(incomplete)))
+            created_ids.difference_update(incomplete)
+        return created_ids
+
     async def update(self, db_user: User, user_in: UserUpdateAdmin) -> User:
         update_data = user_in.model_dump(exclude_unset=True)
         # Password update is handled by IdentityRepository
@@ -40,25 +179,40 @@ class UserRepository:
         return db_user
 
     async def get_multi_paginated(
-        self, skip: int = 0, limit: int = 100
-    ) -> Tuple[List[User], int]:
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Page:
         """
-        Gets a paginated list of all users and the total count.
+        Gets a paginated list of all users and, depending on the count
+        strategy, the total count. With `columns`, the users are rows of only
+        those columns.
         """
-        # Query for the data
-        data_statement = (
-            select(User)
-            .order_by(User.username)  # Use a consistent order
-            .offset(skip)
-            .limit(limit)
-        )
-        items = (await self.session.exec(data_statement)).all()
-
-        # Query for the total count
-        count_statement = select(func.count()).select_from(User)
-        total = (await self.session.exec(count_statement)).one()
+        # Use a consistent order
+        statement = self._select(columns).order_by(User.username)
+        return await paginate(self.session, statement, skip, limit, count_strategy)
 
-        return items, total
+    async def get_multi_keyset(
+        self,
+        after: Optional[str] = None,
+        limit: int = 100,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Tuple[List[User | Row], bool]:
+        """
+        Gets a keyset-paginated page of all users (ordered by the unique
+        username) and whether another page follows. With `columns`, the
+        users are rows of only those columns.
+        """
+        statement = keyset_page(
+            self._select(columns),
+            keys=(User.username,),
+            after=(after,) if after is not None else None,
+            limit=limit,
+        )
+        users = (await self.session.exec(statement)).all()
+        return split_page(users, limit)
 
     async def remove(self, db_user: User) -> None:
         # 删除用户时，也应该级联删除其所有 Identities
@@ -74,30 +228,51 @@ class UserRepository:
         await self.session.refresh(user)
         return user
 
-    async def update_profile(self, db_user: User, user_in: UserUpdateProfile) -> User:
-        """Updates a user's own profile information."""
-        update_data = user_in.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(db_user, key, value)
-        return await self.save(db_user)
-
-    # 管理员的 update 方法已经很完善了，它可以处理密码重置
-    async def update_by_admin(self, db_user: User, user_in: UserUpdateAdmin) -> User:
-        update_data = user_in.model_dump(exclude_unset=True)
+    async def get_version(self, user_id: uuid.UUID) -> Optional[Row]:
+        """Gets the (version, updated_at) of a user without loading it."""
+        statement = select(User.version, User.updated_at).where(User.id == user_id)
+        return (await self.session.exec(statement)).first()
 
-        if "password" in update_data and update_data["password"]:
-            # 当管理员重置密码时，需要找到并更新对应的 password identity
-            # 这是一个更复杂的流程，暂时简化为直接更新 User 表，但实际上应操作 Identity
-            # TODO: Implement password reset via IdentityRepository
-            # For now, let's assume we need a way to hash it
-            from .security import get_password_hash
+    async def update_profile(
+        self,
+        user_id: uuid.UUID,
+        user_in: UserUpdateProfile,
+        expected_version: Optional[int] = None,
+    ) -> Optional[User]:
+        """
+        Updates a user's own profile information in a single UPDATE ...
+        RETURNING. Returns None when the user does not exist or is no longer
+        at `expected_version`. Does not commit.
+        """
+        return await update_returning(
+            self.session,
+            User,
+            User.id == user_id,
+            values=user_in.model_dump(exclude_unset=True),
+            expected_version=expected_version,
+        )
 
-            hashed_password = get_password_hash(update_data["password"])
-            # This demonstrates a flaw if we were to store password in User table
-            # db_user.hashed_password = hashed_password
-            del update_data["password"]
+    async def update_by_admin(
+        self,
+        user_id: uuid.UUID,
+        user_in: UserUpdateAdmin,
+        expected_version: Optional[int] = None,
+    ) -> Optional[User]:
+        """
+        Updates a user's information in a single UPDATE ... RETURNING.
+        Returns None when the user does not exist or is no longer at
+        `expected_version`. Does not commit.
+        """
+        update_data = user_in.model_dump(exclude_unset=True)
 
-        for key, value in update_data.items():
-            setattr(db_user, key, value)
+        # Passwords live on the password identities, not the user; the
+        # handler resets them through the IdentityRepository.
+        update_data.pop("password", None)
 
-        return await self.save(db_user)
+        return await update_returning(
+            self.session,
+            User,
+            User.id == user_id,
+            values=update_data,
+            expected_version=expected_version,
+        )
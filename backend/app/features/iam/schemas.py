@@ -1,6 +1,8 @@
 import uuid
-from typing import Optional
-from pydantic import BaseModel, EmailStr
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+from pydantic import BaseModel, EmailStr, Field, model_validator
 from sqlmodel import SQLModel
 
 
@@ -34,12 +36,15 @@ class UserPublic(UserBase):
     is_active: bool
     is_superuser: bool
     profile_picture_url: Optional[str] = None
+    version: int
+    updated_at: datetime
 
 
 # --- Admin Schemas ---
 class UserInDBAdmin(UserPublic):
     # It inherits all fields from UserPublic:
-    # id, username, email, is_active, is_superuser, profile_picture_url
+    # id, username, email, is_active, is_superuser, profile_picture_url,
+    # version, updated_at
 
     # In the future, you could add admin-only viewable fields here, for example:
     # last_login: Optional[datetime] = None
@@ -52,3 +57,40 @@ class UserUpdateAdmin(BaseModel):
     is_active: Optional[bool] = None
     is_superuser: Optional[bool] = None
     password: Optional[str] = None
+
+
+# --- Bulk Import Schemas ---
+class UserImportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class UserImportRow(BaseModel):
+    """A single user record from a bulk import file."""
+
+    # As long as the columns allow, so that a long value fails its row only.
+    username: str = Field(max_length=50)
+    email: EmailStr = Field(max_length=100)
+    password: Optional[str] = None
+    # An existing bcrypt hash, e.g. when migrating users from another system.
+    password_hash: Optional[str] = None
+
+    @model_validator(mode="after")
+    def check_password_present(self) -> "UserImportRow":
+        if not self.password and not self.password_hash:
+            raise ValueError("Either 'password' or 'password_hash' is required.")
+        return self
+
+
+class UserImportRowError(BaseModel):
+    line: int
+    detail: str
+
+
+class UserImportResult(BaseModel):
+    total: int
+    created: int
+    failed: int
+    errors: List[UserImportRowError]
+    elapsed_seconds: float
+    rows_per_second: float
@@ -1,7 +1,16 @@
 import uuid
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional, Tuple, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from app.config import settings
 from app.shared.infrastructure.uow import IUnitOfWork
-from app.shared.web.deps import get_uow, get_current_active_superuser
+from app.shared.web.deps import (
+    get_current_active_superuser,
+    get_cursor_params,
+    get_page_params,
+    get_read_uow,
+    get_uow,
+)
+from app.shared.web.fields import IDENTITY_FIELDS, sparse_fields, sparse_response
 from app.features.iam.domain.user import User
 from app.features.item.application.admin.commands.delete_item import (
     DeleteItemAdminCommand,
@@ -11,69 +20,285 @@ from app.features.item.application.admin.commands.update_item import (
     UpdateItemAdminCommand,
     UpdateItemAdminHandler,
 )
+from app.features.item.application.admin.commands.bulk_update_items import (
+    BulkUpdateItemsAdminCommand,
+    BulkUpdateItemsAdminHandler,
+)
+from app.features.item.application.admin.commands.bulk_delete_items import (
+    BulkDeleteItemsAdminCommand,
+    BulkDeleteItemsAdminHandler,
+)
 from app.shared.application.exceptions import ResourceNotFoundError
 from app.features.item.application.admin.queries.get_item_by_id import (
     GetItemByIdAdminHandler,
     GetItemByIdAdminQuery,
 )
-from app.shared.schemas import PageParams, Paginated
+from app.shared.web import sse
+from app.shared.web.responses import ClosingStreamingResponse
+from app.shared.web.conditional import (
+    PRECONDITION_FAILED_RESPONSES,
+    if_match_version,
+    resource_etag,
+    set_validators,
+)
+from app.shared.schemas import CursorPaginated, CursorParams, PageParams, Paginated
 
-from ..schemas import ItemPublic, ItemUpdateAdmin
+from ..schemas import (
+    ItemBulkDelete,
+    ItemBulkResponse,
+    ItemBulkUpdateAdmin,
+    ItemExportFormat,
+    ItemSearchResult,
+    ItemSuggestion,
+    ItemPublic,
+    ItemUpdateAdmin,
+)
+from app.features.item.application.admin.queries.export_items import (
+    ExportItemsAdminQuery,
+    ExportItemsAdminHandler,
+)
+from app.features.item.application.admin.queries.search_items import (
+    AutocompleteItemsAdminQuery,
+    AutocompleteItemsAdminHandler,
+    SearchItemsAdminQuery,
+    SearchItemsAdminHandler,
+)
+from app.features.item.application.admin.queries.stream_item_changes import (
+    StreamItemChangesAdminQuery,
+    StreamItemChangesAdminHandler,
+)
+from app.features.item.application.admin.queries.get_items_by_ids import (
+    GetItemsByIdsAdminQuery,
+    GetItemsByIdsAdminHandler,
+)
 from app.features.item.application.admin.queries.get_all_items import (
     GetAllItemsAdminQuery,
     GetAllItemsAdminHandler,
+    GetAllItemsByCursorAdminQuery,
+    GetAllItemsByCursorAdminHandler,
 )
 
 router = APIRouter()
 
+item_fields = sparse_fields(ItemPublic)
+# Keyset pages also need their sort key, to make the next cursor of.
+item_cursor_fields = sparse_fields(ItemPublic, (*IDENTITY_FIELDS, "created_at"))
 
-@router.get("", response_model=Paginated[ItemPublic])
+
+@router.get("", response_model=Union[Paginated[ItemPublic], ItemBulkResponse])
 async def read_items_admin(
-    pagination: PageParams = Depends(),
-    uow: IUnitOfWork = Depends(get_uow),
+    response: Response,
+    pagination: PageParams = Depends(get_page_params),
+    fields: Optional[Tuple[str, ...]] = Depends(item_fields),
+    ids: Optional[List[uuid.UUID]] = Query(
+        None, max_length=settings.ITEM_BATCH_MAX_SIZE
+    ),
+    uow: IUnitOfWork = Depends(get_read_uow),
     current_user: User = Depends(get_current_active_superuser),
 ):
     """
     Retrieve a paginated list of all items in the system. (Admin access required)
+    With `fields` (e.g. `?fields=name`), only those fields of each item are
+    read from the database and returned.
+
+    With `ids`, fetch exactly those items instead, each with its own status;
+    pagination parameters and `fields` are then ignored.
     """
-    query = GetAllItemsAdminQuery(page_params=pagination)
+    if ids:
+        query = GetItemsByIdsAdminQuery(item_ids=ids)
+        handler = GetItemsByIdsAdminHandler(uow)
+        return await handler.handle(query)
+
+    query = GetAllItemsAdminQuery(page_params=pagination, fields=fields)
     handler = GetAllItemsAdminHandler(uow)
+    page = await handler.handle(query)
+    return page if fields is None else sparse_response(page, response)
+
+
+@router.get("/cursor", response_model=CursorPaginated[ItemPublic])
+async def read_items_by_cursor_admin(
+    response: Response,
+    pagination: CursorParams = Depends(get_cursor_params),
+    fields: Optional[Tuple[str, ...]] = Depends(item_cursor_fields),
+    uow: IUnitOfWork = Depends(get_read_uow),
+    current_user: User = Depends(get_current_active_superuser),
+):
+    """
+    Retrieve all items, newest first, using keyset pagination. (Admin access
+    required)
+    Pass the returned `next_cursor` to fetch the following page. With
+    `fields`, only those fields of each item are read and returned.
+    """
+    query = GetAllItemsByCursorAdminQuery(cursor_params=pagination, fields=fields)
+    handler = GetAllItemsByCursorAdminHandler(uow)
+    page = await handler.handle(query)
+    return page if fields is None else sparse_response(page, response)
+
+
+@router.get(
+    "/changes",
+    response_class=ClosingStreamingResponse,
+    responses={200: {"content": {sse.MEDIA_TYPE: {}}}},
+)
+async def stream_item_changes_admin(
+    owner_id: Optional[uuid.UUID] = Query(None),
+    current_user: User = Depends(get_current_active_superuser),
+):
+    """
+    Stream changes to all items, or to one owner's, as Server-Sent Events.
+    (Admin access required) The events are those of `GET /items/changes`.
+    """
+    query = StreamItemChangesAdminQuery(owner_id=owner_id)
+    handler = StreamItemChangesAdminHandler()
+    return ClosingStreamingResponse(
+        sse.event_stream(handler.handle(query)),
+        media_type=sse.MEDIA_TYPE,
+        headers=sse.HEADERS,
+    )
+
+
+@router.get("/search", response_model=CursorPaginated[ItemSearchResult])
+async def search_items_admin(
+    q: str = Query(..., min_length=1, max_length=256),
+    pagination: CursorParams = Depends(get_cursor_params),
+    uow: IUnitOfWork = Depends(get_read_uow),
+    current_user: User = Depends(get_current_active_superuser),
+):
+    """
+    Full-text search the names and descriptions of all items, best matches
+    first. (Admin access required)
+    """
+    query = SearchItemsAdminQuery(text=q, cursor_params=pagination)
+    handler = SearchItemsAdminHandler(uow)
     return await handler.handle(query)
 
 
+@router.get("/autocomplete", response_model=List[ItemSuggestion])
+async def autocomplete_items_admin(
+    prefix: str = Query(..., min_length=1, max_length=256),
+    limit: int = Query(10, gt=0, le=50),
+    uow: IUnitOfWork = Depends(get_read_uow),
+    current_user: User = Depends(get_current_active_superuser),
+):
+    """
+    Suggest items whose name starts with `prefix`. (Admin access required)
+    """
+    query = AutocompleteItemsAdminQuery(prefix=prefix, limit=limit)
+    handler = AutocompleteItemsAdminHandler(uow)
+    return await handler.handle(query)
+
+
+EXPORT_MEDIA_TYPES = {
+    ItemExportFormat.NDJSON: "application/x-ndjson",
+    ItemExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+@router.get(
+    "/export",
+    response_class=ClosingStreamingResponse,
+    responses={
+        200: {"content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}}
+    },
+)
+async def export_items_admin(
+    format: ItemExportFormat = Query(ItemExportFormat.NDJSON),
+    uow: IUnitOfWork = Depends(get_read_uow),
+    current_user: User = Depends(get_current_active_superuser),
+):
+    """
+    Stream every item in the system as NDJSON or CSV. (Admin access required)
+    Rows are read from a server-side cursor and sent as they arrive.
+    """
+    query = ExportItemsAdminQuery(format=format)
+    handler = ExportItemsAdminHandler(uow)
+    return ClosingStreamingResponse(
+        handler.handle(query),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="items.{format.value}"'},
+    )
+
+
+@router.patch("/bulk", response_model=ItemBulkResponse)
+async def update_items_bulk_admin(
+    bulk_in: ItemBulkUpdateAdmin,
+    uow: IUnitOfWork = Depends(get_uow),
+    current_user: User = Depends(get_current_active_superuser),
+):
+    """
+    Partially update many items in the system, in a single transaction.
+    (Admin access required)
+    """
+    command = BulkUpdateItemsAdminCommand(items_in=bulk_in.items)
+    handler = BulkUpdateItemsAdminHandler(uow)
+    return await handler.handle(command)
+
+
+@router.post("/bulk/delete", response_model=ItemBulkResponse)
+async def delete_items_bulk_admin(
+    bulk_in: ItemBulkDelete,
+    uow: IUnitOfWork = Depends(get_uow),
+    current_user: User = Depends(get_current_active_superuser),
+):
+    """
+    Delete many items in the system, in a single transaction.
+    (Admin access required)
+    """
+    command = BulkDeleteItemsAdminCommand(item_ids=bulk_in.ids)
+    handler = BulkDeleteItemsAdminHandler(uow)
+    return await handler.handle(command)
+
+
 @router.get("/{item_id}", response_model=ItemPublic)
 async def read_item_admin(
     item_id: uuid.UUID,
-    uow: IUnitOfWork = Depends(get_uow),
+    response: Response,
+    fields: Optional[Tuple[str, ...]] = Depends(item_fields),
+    uow: IUnitOfWork = Depends(get_read_uow),
     current_user: User = Depends(get_current_active_superuser),
 ):
     """
     Get any item in the system by its ID. (Admin access required)
+    With `fields`, only those fields are read from the database and returned.
     """
-    query = GetItemByIdAdminQuery(item_id=item_id)
+    query = GetItemByIdAdminQuery(item_id=item_id, fields=fields)
     handler = GetItemByIdAdminHandler(uow)
     try:
-        return await handler.handle(query)
+        item = await handler.handle(query)
     except ResourceNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    return item if fields is None else sparse_response(item, response)
 
 
-@router.put("/{item_id}", response_model=ItemPublic)
+@router.put(
+    "/{item_id}", response_model=ItemPublic, responses=PRECONDITION_FAILED_RESPONSES
+)
 async def update_item_admin(
     item_id: uuid.UUID,
     item_in: ItemUpdateAdmin,
+    request: Request,
+    response: Response,
     uow: IUnitOfWork = Depends(get_uow),
     current_user: User = Depends(get_current_active_superuser),
 ):
     """
     Update any item in the system. (Admin access required)
+
+    Send the item's `ETag` in `If-Match` to update it only if nobody changed
+    it in the meantime; otherwise the response is 412 and nothing changes.
     """
-    command = UpdateItemAdminCommand(item_id=item_id, item_in=item_in)
+    command = UpdateItemAdminCommand(
+        item_id=item_id,
+        item_in=item_in,
+        expected_version=if_match_version(request, item_id),
+    )
     handler = UpdateItemAdminHandler(uow)
     try:
-        return await handler.handle(command)
+        item = await handler.handle(command)
     except ResourceNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    set_validators(response, resource_etag(item.id, item.version), item.updated_at)
+    return item
 
 
 @router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -1,24 +1,92 @@
 import uuid
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional, Tuple, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from app.config import settings
 from app.shared.infrastructure.uow import IUnitOfWork
-from app.shared.web.deps import get_uow, get_current_active_user
+from app.shared.web import sse
+from app.shared.web.responses import ClosingStreamingResponse
+from app.shared.web.deps import (
+    get_current_active_user,
+    get_cursor_params,
+    get_page_params,
+    get_read_uow,
+    get_uow,
+)
+from app.shared.web.fields import IDENTITY_FIELDS, sparse_fields, sparse_response
+from app.shared.web.conditional import (
+    NOT_MODIFIED_RESPONSES,
+    PRECONDITION_FAILED_RESPONSES,
+    has_preconditions,
+    if_match_version,
+    is_not_modified,
+    not_modified,
+    page_etag,
+    resource_etag,
+    set_validators,
+)
 from app.features.iam.domain.user import User
 from app.features.item.application.user.queries.get_item_by_id import (
     GetItemByIdHandler,
     GetItemByIdQuery,
+    GetItemVersionHandler,
 )
 from app.shared.application.exceptions import ResourceNotFoundError
-from app.shared.schemas import PageParams, Paginated
+from app.shared.schemas import CursorPaginated, CursorParams, PageParams, Paginated
 
-from ..schemas import ItemCreate, ItemPublic
+from ..schemas import (
+    ItemBulkCreate,
+    ItemBulkDelete,
+    ItemBulkResponse,
+    ItemBulkUpdate,
+    ItemCreate,
+    ItemPublic,
+    ItemSearchResult,
+    ItemSuggestion,
+    ItemUpdate,
+)
 from ..application.user.commands.create_item import CreateItemCommand, CreateItemHandler
+from ..application.user.commands.update_item import UpdateItemCommand, UpdateItemHandler
+from ..application.user.commands.bulk_create_items import (
+    BulkCreateItemsCommand,
+    BulkCreateItemsHandler,
+)
+from ..application.user.commands.bulk_update_items import (
+    BulkUpdateItemsCommand,
+    BulkUpdateItemsHandler,
+)
+from ..application.user.commands.bulk_delete_items import (
+    BulkDeleteItemsCommand,
+    BulkDeleteItemsHandler,
+)
+from ..application.user.queries.search_items import (
+    AutocompleteItemsQuery,
+    AutocompleteItemsHandler,
+    SearchItemsQuery,
+    SearchItemsHandler,
+)
+from ..application.user.queries.stream_item_changes import (
+    StreamItemChangesQuery,
+    StreamItemChangesHandler,
+)
+from ..application.user.queries.get_items_by_ids import (
+    GetItemsByIdsQuery,
+    GetItemsByIdsHandler,
+)
 from ..application.user.queries.get_item_list import (
     GetItemListQuery,
     GetItemListHandler,
+    GetItemListVersionsHandler,
+    GetItemListByCursorQuery,
+    GetItemListByCursorHandler,
+    GetItemListByCursorVersionsHandler,
 )
 
 router = APIRouter()
 
+item_fields = sparse_fields(ItemPublic)
+# Keyset pages also need their sort key, to make the next cursor of.
+item_cursor_fields = sparse_fields(ItemPublic, (*IDENTITY_FIELDS, "created_at"))
+
 
 @router.post("", response_model=ItemPublic, status_code=201)
 async def create_item(
@@ -31,32 +99,267 @@ async def create_item(
     return await handler.handle(command)
 
 
-@router.get("", response_model=Paginated[ItemPublic])
-async def read_items(
-    pagination: PageParams = Depends(),
+@router.post("/bulk", response_model=ItemBulkResponse, status_code=201)
+async def create_items_bulk(
+    bulk_in: ItemBulkCreate,
     uow: IUnitOfWork = Depends(get_uow),
     current_user: User = Depends(get_current_active_user),
+):
+    """
+    Create many items at once, in a single transaction.
+    """
+    command = BulkCreateItemsCommand(items_in=bulk_in.items, owner_id=current_user.id)
+    handler = BulkCreateItemsHandler(uow)
+    return await handler.handle(command)
+
+
+@router.patch("/bulk", response_model=ItemBulkResponse)
+async def update_items_bulk(
+    bulk_in: ItemBulkUpdate,
+    uow: IUnitOfWork = Depends(get_uow),
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Partially update many items owned by the current user, in a single
+    transaction. Items that do not exist or belong to someone else are
+    reported as `not_found`.
+    """
+    command = BulkUpdateItemsCommand(items_in=bulk_in.items, owner_id=current_user.id)
+    handler = BulkUpdateItemsHandler(uow)
+    return await handler.handle(command)
+
+
+@router.post("/bulk/delete", response_model=ItemBulkResponse)
+async def delete_items_bulk(
+    bulk_in: ItemBulkDelete,
+    uow: IUnitOfWork = Depends(get_uow),
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Delete many items owned by the current user, in a single transaction.
+    Items that do not exist or belong to someone else are reported as
+    `not_found`.
+    """
+    command = BulkDeleteItemsCommand(item_ids=bulk_in.ids, owner_id=current_user.id)
+    handler = BulkDeleteItemsHandler(uow)
+    return await handler.handle(command)
+
+
+@router.get(
+    "",
+    response_model=Union[Paginated[ItemPublic], ItemBulkResponse],
+    responses=NOT_MODIFIED_RESPONSES,
+)
+async def read_items(
+    request: Request,
+    response: Response,
+    pagination: PageParams = Depends(get_page_params),
+    fields: Optional[Tuple[str, ...]] = Depends(item_fields),
+    ids: Optional[List[uuid.UUID]] = Query(
+        None, max_length=settings.ITEM_BATCH_MAX_SIZE
+    ),
+    uow: IUnitOfWork = Depends(get_read_uow),
+    current_user: User = Depends(get_current_active_user),
 ):
     """
     Retrieve a paginated list of items owned by the current user.
+
+    Pages carry an `ETag`; send it back in `If-None-Match` to get an empty
+    304 response while the page is unchanged.
+
+    With `fields` (e.g. `?fields=name`), only those fields of each item are
+    read from the database and returned.
+
+    With `ids`, fetch exactly those items instead, each with its own status;
+    pagination parameters and `fields` are then ignored.
     """
-    query = GetItemListQuery(owner_id=current_user.id, page_params=pagination)
+    if ids:
+        query = GetItemsByIdsQuery(item_ids=ids, owner_id=current_user.id)
+        handler = GetItemsByIdsHandler(uow)
+        return await handler.handle(query)
+
+    query = GetItemListQuery(
+        owner_id=current_user.id, page_params=pagination, fields=fields
+    )
+    if has_preconditions(request):
+        versions = await GetItemListVersionsHandler(uow).handle(query)
+        etag = page_etag(*versions, fields=fields)
+        if is_not_modified(request, etag):
+            return not_modified(etag)
+
     handler = GetItemListHandler(uow)
+    page = await handler.handle(query)
+    versions = [(item.id, item.version) for item in page.items]
+    set_validators(response, page_etag(versions, page.total, page.has_next, fields))
+    return page if fields is None else sparse_response(page, response)
+
+
+@router.get(
+    "/cursor",
+    response_model=CursorPaginated[ItemPublic],
+    responses=NOT_MODIFIED_RESPONSES,
+)
+async def read_items_by_cursor(
+    request: Request,
+    response: Response,
+    pagination: CursorParams = Depends(get_cursor_params),
+    fields: Optional[Tuple[str, ...]] = Depends(item_cursor_fields),
+    uow: IUnitOfWork = Depends(get_read_uow),
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Retrieve items owned by the current user, newest first, using keyset
+    pagination.
+    Pass the returned `next_cursor` to fetch the following page.
+
+    Pages carry an `ETag`; send it back in `If-None-Match` to get an empty
+    304 response while the page is unchanged.
+
+    With `fields` (e.g. `?fields=name`), only those fields of each item are
+    read from the database and returned.
+    """
+    query = GetItemListByCursorQuery(
+        owner_id=current_user.id, cursor_params=pagination, fields=fields
+    )
+    if has_preconditions(request):
+        versions = await GetItemListByCursorVersionsHandler(uow).handle(query)
+        etag = page_etag(*versions, fields=fields)
+        if is_not_modified(request, etag):
+            return not_modified(etag)
+
+    handler = GetItemListByCursorHandler(uow)
+    page = await handler.handle(query)
+    versions = [(item.id, item.version) for item in page.items]
+    has_next = page.next_cursor is not None
+    set_validators(response, page_etag(versions, None, has_next, fields))
+    return page if fields is None else sparse_response(page, response)
+
+
+@router.get(
+    "/changes",
+    response_class=ClosingStreamingResponse,
+    responses={200: {"content": {sse.MEDIA_TYPE: {}}}},
+)
+async def stream_item_changes(
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Stream changes to the current user's items as Server-Sent Events,
+    instead of polling `GET /items`.
+
+    Events are `item.created`, `item.updated` and `item.deleted`, with the
+    item's `id`, `owner_id` and new `version` as JSON data, and `item.moved`
+    when an admin gave one of the user's items to someone else (its
+    `owner_id` is then still the user's). A `resync` event means changes may
+    have been missed (always the first event, and after a client fell too
+    far behind): reload the items, then keep applying events.
+    """
+    query = StreamItemChangesQuery(owner_id=current_user.id)
+    handler = StreamItemChangesHandler()
+    return ClosingStreamingResponse(
+        sse.event_stream(handler.handle(query)),
+        media_type=sse.MEDIA_TYPE,
+        headers=sse.HEADERS,
+    )
+
+
+@router.get("/search", response_model=CursorPaginated[ItemSearchResult])
+async def search_items(
+    q: str = Query(..., min_length=1, max_length=256),
+    pagination: CursorParams = Depends(get_cursor_params),
+    uow: IUnitOfWork = Depends(get_read_uow),
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Full-text search the names and descriptions of the current user's items,
+    best matches first. `q` accepts web search syntax: `"exact phrase"`,
+    `or`, and `-excluded`. Pass the returned `next_cursor` for more results.
+    """
+    query = SearchItemsQuery(text=q, owner_id=current_user.id, cursor_params=pagination)
+    handler = SearchItemsHandler(uow)
     return await handler.handle(query)
 
 
-@router.get("/{item_id}", response_model=ItemPublic)
+@router.get("/autocomplete", response_model=List[ItemSuggestion])
+async def autocomplete_items(
+    prefix: str = Query(..., min_length=1, max_length=256),
+    limit: int = Query(10, gt=0, le=50),
+    uow: IUnitOfWork = Depends(get_read_uow),
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Suggest the current user's items whose name starts with `prefix`.
+    """
+    query = AutocompleteItemsQuery(prefix=prefix, owner_id=current_user.id, limit=limit)
+    handler = AutocompleteItemsHandler(uow)
+    return await handler.handle(query)
+
+
+@router.get("/{item_id}", response_model=ItemPublic, responses=NOT_MODIFIED_RESPONSES)
 async def read_item(
     item_id: uuid.UUID,
-    uow: IUnitOfWork = Depends(get_uow),
+    request: Request,
+    response: Response,
+    fields: Optional[Tuple[str, ...]] = Depends(item_fields),
+    uow: IUnitOfWork = Depends(get_read_uow),
     current_user: User = Depends(get_current_active_user),
 ):
     """
-    Get an item by ID, owned by the current user.
+    Get an item by ID, owned by the current user. With `fields`, only those
+    fields are read from the database and returned.
+
+    Supports conditional requests with `If-None-Match` (the `ETag`) and
+    `If-Modified-Since` (the `Last-Modified` date), answered with a 304.
     """
-    query = GetItemByIdQuery(item_id=item_id, owner_id=current_user.id)
+    query = GetItemByIdQuery(item_id=item_id, owner_id=current_user.id, fields=fields)
+    if has_preconditions(request):
+        # Checked against the version alone; the item is only loaded on a miss.
+        version = await GetItemVersionHandler(uow).handle(query)
+        if version is not None:
+            etag = resource_etag(item_id, version.version, fields)
+            if is_not_modified(request, etag, version.updated_at):
+                return not_modified(etag, version.updated_at)
+
     handler = GetItemByIdHandler(uow)
     try:
-        return await handler.handle(query)
+        item = await handler.handle(query)
+    except ResourceNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    # A sparse item may leave out `updated_at`; the ETag still validates it.
+    last_modified = getattr(item, "updated_at", None)
+    set_validators(
+        response, resource_etag(item.id, item.version, fields), last_modified
+    )
+    return item if fields is None else sparse_response(item, response)
+
+
+@router.put(
+    "/{item_id}", response_model=ItemPublic, responses=PRECONDITION_FAILED_RESPONSES
+)
+async def update_item(
+    item_id: uuid.UUID,
+    item_in: ItemUpdate,
+    request: Request,
+    response: Response,
+    uow: IUnitOfWork = Depends(get_uow),
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Update an item owned by the current user.
+
+    Send the item's `ETag` in `If-Match` to update it only if nobody changed
+    it in the meantime; otherwise the response is 412 and nothing changes.
+    """
+    command = UpdateItemCommand(
+        item_id=item_id,
+        item_in=item_in,
+        owner_id=current_user.id,
+        expected_version=if_match_version(request, item_id),
+    )
+    handler = UpdateItemHandler(uow)
+    try:
+        item = await handler.handle(command)
     except ResourceNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    set_validators(response, resource_etag(item.id, item.version), item.updated_at)
+    return item
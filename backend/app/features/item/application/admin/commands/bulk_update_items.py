@@ -0,0 +1,38 @@
+from typing import List
+from pydantic import BaseModel
+from sqlalchemy.exc import IntegrityError
+from app.shared.infrastructure.uow import IUnitOfWork
+from app.shared.application.exceptions import InvalidCommandError
+from app.features.item.infra.item_repository import ItemRepository
+from app.features.item.schemas import (
+    ItemBulkResponse,
+    ItemBulkStatus,
+    ItemBulkUpdateAdminEntry,
+    ItemPublic,
+)
+
+
+class BulkUpdateItemsAdminCommand(BaseModel):
+    items_in: List[ItemBulkUpdateAdminEntry]
+
+
+class BulkUpdateItemsAdminHandler:
+    def __init__(self, uow: IUnitOfWork):
+        self.uow = uow
+
+    async def handle(self, command: BulkUpdateItemsAdminCommand) -> ItemBulkResponse:
+        try:
+            async with self.uow:
+                repo = self.uow.get_repository(ItemRepository)
+                db_items = await repo.bulk_update(
+                    items_in=command.items_in, owner_id=None
+                )
+        except IntegrityError:
+            # The only constraint an update can break is the owner foreign key.
+            raise InvalidCommandError("One or more new owners do not exist.")
+
+        return ItemBulkResponse.create(
+            ids=[item_in.id for item_in in command.items_in],
+            status=ItemBulkStatus.UPDATED,
+            items=[ItemPublic.model_validate(item) for item in db_items],
+        )
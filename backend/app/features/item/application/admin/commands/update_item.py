@@ -1,7 +1,13 @@
 import uuid
+from typing import Optional
 from pydantic import BaseModel
+from sqlalchemy.exc import IntegrityError
 from app.shared.infrastructure.uow import IUnitOfWork
-from app.shared.application.exceptions import ResourceNotFoundError
+from app.shared.application.exceptions import (
+    ConcurrencyConflictError,
+    InvalidCommandError,
+    ResourceNotFoundError,
+)
 from app.features.item.schemas import ItemUpdateAdmin, ItemPublic
 from app.features.item.infra.item_repository import ItemRepository
 
@@ -9,6 +15,8 @@ from app.features.item.infra.item_repository import ItemRepository
 class UpdateItemAdminCommand(BaseModel):
     item_id: uuid.UUID
     item_in: ItemUpdateAdmin
+    # When set, the update only applies if the item is still at this version.
+    expected_version: Optional[int] = None
 
 
 class UpdateItemAdminHandler:
@@ -16,13 +24,25 @@ class UpdateItemAdminHandler:
         self.uow = uow
 
     async def handle(self, command: UpdateItemAdminCommand) -> ItemPublic:
-        async with self.uow:
-            repo = self.uow.get_repository(ItemRepository)
-
-            db_item = await repo.get_by_id_admin(item_id=command.item_id)
-            if not db_item:
-                raise ResourceNotFoundError("Item not found.")
-
-            updated_item = await repo.update(db_item=db_item, item_in=command.item_in)
+        try:
+            async with self.uow:
+                repo = self.uow.get_repository(ItemRepository)
+
+                updated_item = await repo.update(
+                    item_id=command.item_id,
+                    item_in=command.item_in,
+                    owner_id=None,
+                    expected_version=command.expected_version,
+                )
+                if not updated_item:
+                    # Only a failed update pays for telling the cases apart.
+                    if await repo.get_version(command.item_id, owner_id=None):
+                        raise ConcurrencyConflictError(
+                            "The item was modified by someone else."
+                        )
+                    raise ResourceNotFoundError("Item not found.")
+        except IntegrityError:
+            # The only constraint an update can break is the owner foreign key.
+            raise InvalidCommandError("The new owner does not exist.")
 
         return ItemPublic.model_validate(updated_item)
@@ -0,0 +1,69 @@
+import csv
+import io
+import json
+from typing import AsyncIterator, Optional, Sequence
+from pydantic import BaseModel
+from sqlalchemy import Row
+from app.config import settings
+from app.shared.infrastructure.uow import IUnitOfWork
+from app.features.item.infra.item_repository import ItemRepository
+from app.features.item.schemas import ItemExportFormat
+
+EXPORT_FIELDS = ("id", "name", "description", "owner_id")
+
+
+def _encode_ndjson(rows: Sequence[Row]) -> bytes:
+    return "".join(
+        json.dumps(
+            {
+                "id": str(row.id),
+                "name": row.name,
+                "description": row.description,
+                "owner_id": str(row.owner_id),
+            },
+            ensure_ascii=False,
+        )
+        + "\n"
+        for row in rows
+    ).encode("utf-8")
+
+
+def _encode_csv(rows: Sequence[Row]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _csv_header() -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(EXPORT_FIELDS)
+    return buffer.getvalue().encode("utf-8")
+
+
+class ExportItemsAdminQuery(BaseModel):
+    format: ItemExportFormat = ItemExportFormat.NDJSON
+
+
+class ExportItemsAdminHandler:
+    def __init__(self, uow: IUnitOfWork, batch_size: Optional[int] = None):
+        self.uow = uow
+        self.batch_size = batch_size or settings.ITEM_EXPORT_BATCH_SIZE
+
+    async def handle(self, query: ExportItemsAdminQuery) -> AsyncIterator[bytes]:
+        """
+        Yields the encoded export one cursor batch at a time.
+
+        The transaction stays open while the caller consumes the chunks, and
+        the next batch is only fetched once the previous chunk was taken, so a
+        slow client slows the cursor down rather than buffering rows here.
+        """
+        if query.format == ItemExportFormat.CSV:
+            encode = _encode_csv
+            yield _csv_header()
+        else:
+            encode = _encode_ndjson
+
+        async with self.uow:
+            repo = self.uow.get_repository(ItemRepository)
+            async for rows in repo.stream_all_admin(batch_size=self.batch_size):
+                yield encode(rows)
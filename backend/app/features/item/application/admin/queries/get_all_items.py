@@ -1,12 +1,25 @@
+import uuid
+from datetime import datetime
+from typing import Optional, Tuple
 from pydantic import BaseModel
 from app.shared.infrastructure.uow import IUnitOfWork
-from app.shared.schemas import Paginated, PageParams
+from app.shared.schemas import (
+    CursorPaginated,
+    CursorParams,
+    Paginated,
+    PageParams,
+    decode_cursor,
+    dto_from,
+    encode_cursor,
+)
 from app.features.item.schemas import ItemPublic
 from app.features.item.infra.item_repository import ItemRepository
 
 
 class GetAllItemsAdminQuery(BaseModel):
     page_params: PageParams
+    # A sparse fieldset: only these columns are loaded and returned.
+    fields: Optional[Tuple[str, ...]] = None
 
 
 class GetAllItemsAdminHandler:
@@ -14,18 +27,59 @@ class GetAllItemsAdminHandler:
         self.uow = uow
 
     async def handle(self, query: GetAllItemsAdminQuery) -> Paginated[ItemPublic]:
-        items_from_db = []
-        total_count = 0
-
         async with self.uow:
             repo = self.uow.get_repository(ItemRepository)
-            items_from_db, total_count = await repo.get_multi_admin_paginated(
-                skip=query.page_params.offset, limit=query.page_params.size
+            page = await repo.get_multi_admin_paginated(
+                skip=query.page_params.offset,
+                limit=query.page_params.size,
+                count_strategy=query.page_params.count_strategy,
+                columns=query.fields,
             )
 
         # --- Post-transaction processing ---
-        item_dtos = [ItemPublic.model_validate(item) for item in items_from_db]
+        item_dtos = [dto_from(ItemPublic, item, query.fields) for item in page.items]
 
         return Paginated.create(
-            items=item_dtos, total=total_count, params=query.page_params
+            items=item_dtos,
+            total=page.total,
+            params=query.page_params,
+            has_next=page.has_next,
+        )
+
+
+class GetAllItemsByCursorAdminQuery(BaseModel):
+    cursor_params: CursorParams
+    # A sparse fieldset: only these columns are loaded and returned.
+    fields: Optional[Tuple[str, ...]] = None
+
+
+class GetAllItemsByCursorAdminHandler:
+    def __init__(self, uow: IUnitOfWork):
+        self.uow = uow
+
+    async def handle(
+        self, query: GetAllItemsByCursorAdminQuery
+    ) -> CursorPaginated[ItemPublic]:
+        params = query.cursor_params
+        after = (
+            decode_cursor(params.cursor, datetime.fromisoformat, uuid.UUID)
+            if params.cursor
+            else None
+        )
+
+        async with self.uow:
+            repo = self.uow.get_repository(ItemRepository)
+            items_from_db, has_next = await repo.get_multi_admin_keyset(
+                after=after, limit=params.size, columns=query.fields
+            )
+
+        item_dtos = [dto_from(ItemPublic, item, query.fields) for item in items_from_db]
+        next_cursor = (
+            encode_cursor(item_dtos[-1].created_at, item_dtos[-1].id)
+            if has_next
+            else None
+        )
+
+        return CursorPaginated.create(
+            items=item_dtos, next_cursor=next_cursor, params=params
         )
@@ -1,13 +1,18 @@
 import uuid
+from typing import Optional, Tuple
 from pydantic import BaseModel
 from app.shared.infrastructure.uow import IUnitOfWork
+from app.shared.schemas import dto_from, partial_model
 from app.shared.application.exceptions import ResourceNotFoundError
 from app.features.item.schemas import ItemPublic
 from app.features.item.infra.item_repository import ItemRepository
+from app.features.item.infra.item_cache import item_cache
 
 
 class GetItemByIdAdminQuery(BaseModel):
     item_id: uuid.UUID
+    # A sparse fieldset: only these columns are loaded and returned.
+    fields: Optional[Tuple[str, ...]] = None
 
 
 class GetItemByIdAdminHandler:
@@ -15,6 +20,25 @@ class GetItemByIdAdminHandler:
         self.uow = uow
 
     async def handle(self, query: GetItemByIdAdminQuery) -> ItemPublic:
+        cached_item = await item_cache.get(query.item_id)
+        if cached_item is not None:
+            if query.fields is not None:
+                return partial_model(ItemPublic, query.fields).model_validate(
+                    cached_item.model_dump(include=set(query.fields))
+                )
+            return cached_item
+
+        if query.fields is not None:
+            # Sparse reads load only their columns, and so are not cached.
+            async with self.uow:
+                repo = self.uow.get_repository(ItemRepository)
+                row = await repo.get_columns(
+                    item_id=query.item_id, owner_id=None, columns=query.fields
+                )
+            if not row:
+                raise ResourceNotFoundError("Item not found.")
+            return dto_from(ItemPublic, row, query.fields)
+
         async with self.uow:
             repo = self.uow.get_repository(ItemRepository)
 
@@ -24,4 +48,10 @@ class GetItemByIdAdminHandler:
             if not db_item:
                 raise ResourceNotFoundError("Item not found.")
 
-            return ItemPublic.model_validate(db_item)
+            item = ItemPublic.model_validate(db_item)
+
+        # Caching a replica's row could undo the invalidation of a write that
+        # has not reached it yet.
+        if self.uow.reads_primary:
+            await item_cache.set(item)
+        return item
@@ -0,0 +1,26 @@
+import uuid
+from typing import List
+from pydantic import BaseModel
+from app.shared.infrastructure.uow import IUnitOfWork
+from app.features.item.infra.item_repository import ItemRepository
+from app.features.item.schemas import ItemBulkResponse, ItemBulkStatus, ItemPublic
+
+
+class GetItemsByIdsAdminQuery(BaseModel):
+    item_ids: List[uuid.UUID]
+
+
+class GetItemsByIdsAdminHandler:
+    def __init__(self, uow: IUnitOfWork):
+        self.uow = uow
+
+    async def handle(self, query: GetItemsByIdsAdminQuery) -> ItemBulkResponse:
+        async with self.uow:
+            repo = self.uow.get_repository(ItemRepository)
+            db_items = await repo.get_many(item_ids=query.item_ids, owner_id=None)
+
+        return ItemBulkResponse.create(
+            ids=query.item_ids,
+            status=ItemBulkStatus.FOUND,
+            items=[ItemPublic.model_validate(item) for item in db_items],
+        )
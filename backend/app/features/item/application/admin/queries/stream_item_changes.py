@@ -0,0 +1,22 @@
+import uuid
+from typing import AsyncIterator, Optional
+from pydantic import BaseModel
+from app.config import settings
+from app.shared.web.sse import ServerSentEvent
+from app.features.item.infra.item_feed import ItemChangeFeed, item_feed
+
+
+class StreamItemChangesAdminQuery(BaseModel):
+    owner_id: Optional[uuid.UUID] = None  # None streams every owner's changes
+
+
+class StreamItemChangesAdminHandler:
+    def __init__(self, feed: ItemChangeFeed = item_feed):
+        self.feed = feed
+
+    async def handle(
+        self, query: StreamItemChangesAdminQuery
+    ) -> AsyncIterator[Optional[ServerSentEvent]]:
+        with self.feed.subscribe(owner_id=query.owner_id) as subscription:
+            while True:
+                yield await subscription.next(settings.ITEM_FEED_HEARTBEAT_SECONDS)
@@ -0,0 +1,36 @@
+import uuid
+from typing import List
+from pydantic import BaseModel
+from app.shared.infrastructure.uow import IUnitOfWork
+from app.features.item.infra.item_repository import ItemRepository
+from app.features.item.schemas import (
+    ItemBulkResponse,
+    ItemBulkStatus,
+    ItemCreate,
+    ItemPublic,
+)
+
+
+class BulkCreateItemsCommand(BaseModel):
+    items_in: List[ItemCreate]
+    owner_id: uuid.UUID
+
+
+class BulkCreateItemsHandler:
+    def __init__(self, uow: IUnitOfWork):
+        self.uow = uow
+
+    async def handle(self, command: BulkCreateItemsCommand) -> ItemBulkResponse:
+        # The whole batch is inserted in one statement and one transaction.
+        async with self.uow:
+            repo = self.uow.get_repository(ItemRepository)
+            db_items = await repo.bulk_create(
+                items_in=command.items_in, owner_id=command.owner_id
+            )
+
+        item_dtos = [ItemPublic.model_validate(item) for item in db_items]
+        return ItemBulkResponse.create(
+            ids=[item.id for item in item_dtos],
+            status=ItemBulkStatus.CREATED,
+            items=item_dtos,
+        )
@@ -0,0 +1,29 @@
+import uuid
+from typing import List
+from pydantic import BaseModel
+from app.shared.infrastructure.uow import IUnitOfWork
+from app.features.item.infra.item_repository import ItemRepository
+from app.features.item.schemas import ItemBulkResponse, ItemBulkStatus
+
+
+class BulkDeleteItemsCommand(BaseModel):
+    item_ids: List[uuid.UUID]
+    owner_id: uuid.UUID
+
+
+class BulkDeleteItemsHandler:
+    def __init__(self, uow: IUnitOfWork):
+        self.uow = uow
+
+    async def handle(self, command: BulkDeleteItemsCommand) -> ItemBulkResponse:
+        async with self.uow:
+            repo = self.uow.get_repository(ItemRepository)
+            deleted_ids = await repo.bulk_remove(
+                item_ids=command.item_ids, owner_id=command.owner_id
+            )
+
+        return ItemBulkResponse.create(
+            ids=command.item_ids,
+            status=ItemBulkStatus.DELETED,
+            found_ids=deleted_ids,
+        )
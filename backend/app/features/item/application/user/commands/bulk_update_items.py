@@ -0,0 +1,36 @@
+import uuid
+from typing import List
+from pydantic import BaseModel
+from app.shared.infrastructure.uow import IUnitOfWork
+from app.features.item.infra.item_repository import ItemRepository
+from app.features.item.schemas import (
+    ItemBulkResponse,
+    ItemBulkStatus,
+    ItemBulkUpdateEntry,
+    ItemPublic,
+)
+
+
+class BulkUpdateItemsCommand(BaseModel):
+    items_in: List[ItemBulkUpdateEntry]
+    owner_id: uuid.UUID
+
+
+class BulkUpdateItemsHandler:
+    def __init__(self, uow: IUnitOfWork):
+        self.uow = uow
+
+    async def handle(self, command: BulkUpdateItemsCommand) -> ItemBulkResponse:
+        async with self.uow:
+            repo = self.uow.get_repository(ItemRepository)
+            # Ownership is part of the UPDATE's WHERE clause, so items of
+            # other users are simply not matched and come back as not found.
+            db_items = await repo.bulk_update(
+                items_in=command.items_in, owner_id=command.owner_id
+            )
+
+        return ItemBulkResponse.create(
+            ids=[item_in.id for item_in in command.items_in],
+            status=ItemBulkStatus.UPDATED,
+            items=[ItemPublic.model_validate(item) for item in db_items],
+        )
@@ -24,7 +24,7 @@ class CreateItemHandler:
                 command.item_in, update={"owner_id": command.owner_id}
             )
 
-            self.uow.session.add(db_item)
+            repo.add(db_item)
             # UoW handles commit
 
         return ItemPublic.model_validate(db_item)
@@ -1,9 +1,12 @@
 import uuid
+from typing import Optional
 from pydantic import BaseModel
-from sqlmodel.ext.asyncio.session import AsyncSession
-from app.shared.application.result import Result
-from app.shared.application.exceptions import ResourceNotFoundError
-from app.features.item.domain.item import ItemUpdate, ItemPublic
+from app.shared.infrastructure.uow import IUnitOfWork
+from app.shared.application.exceptions import (
+    ConcurrencyConflictError,
+    ResourceNotFoundError,
+)
+from app.features.item.schemas import ItemUpdate, ItemPublic
 from app.features.item.infra.item_repository import ItemRepository
 
 
@@ -11,33 +14,36 @@ class UpdateItemCommand(BaseModel):
     item_id: uuid.UUID
     item_in: ItemUpdate
     owner_id: uuid.UUID
+    # When set, the update only applies if the item is still at this version.
+    expected_version: Optional[int] = None
 
 
 class UpdateItemHandler:
-    def __init__(self, session: AsyncSession):
-        self.repo = ItemRepository(session)
+    def __init__(self, uow: IUnitOfWork):
+        self.uow = uow
 
-    async def handle(
-        self, command: UpdateItemCommand
-    ) -> Result[ItemPublic, ResourceNotFoundError]:
+    async def handle(self, command: UpdateItemCommand) -> ItemPublic:
         """
-        Handles the update of an existing item.
+        Handles the update of an existing item, in a single UPDATE statement
+        that also enforces ownership and the expected version.
         """
-        # 1. First, retrieve the item from the database
-        db_item = await self.repo.get(
-            item_id=command.item_id, owner_id=command.owner_id
-        )
-
-        # 2. Check if the item exists and belongs to the user
-        if not db_item:
-            return Result.failure(
-                ResourceNotFoundError(
-                    f"Item with id {command.item_id} not found or you don't have permission."
-                )
+        async with self.uow:
+            repo = self.uow.get_repository(ItemRepository)
+
+            updated_item = await repo.update(
+                item_id=command.item_id,
+                item_in=command.item_in,
+                owner_id=command.owner_id,
+                expected_version=command.expected_version,
             )
+            if not updated_item:
+                # Only a failed update pays for telling the cases apart.
+                if await repo.get_version(command.item_id, command.owner_id):
+                    raise ConcurrencyConflictError(
+                        "The item was modified by someone else."
+                    )
+                raise ResourceNotFoundError(
+                    "Item not found or you don't have permission."
+                )
 
-        # 3. If it exists, update it with the new data
-        updated_item = await self.repo.update(db_item=db_item, item_in=command.item_in)
-
-        # 4. Return the updated item as a public DTO
-        return Result.success(ItemPublic.model_validate(updated_item))
+        return ItemPublic.model_validate(updated_item)
@@ -1,14 +1,19 @@
 import uuid
+from typing import Optional, Tuple
 from pydantic import BaseModel
 from app.shared.infrastructure.uow import IUnitOfWork
+from app.shared.schemas import ResourceVersion, dto_from, partial_model
 from app.shared.application.exceptions import ResourceNotFoundError
 from app.features.item.schemas import ItemPublic
 from app.features.item.infra.item_repository import ItemRepository
+from app.features.item.infra.item_cache import item_cache
 
 
 class GetItemByIdQuery(BaseModel):
     item_id: uuid.UUID
     owner_id: uuid.UUID
+    # A sparse fieldset: only these columns are loaded and returned.
+    fields: Optional[Tuple[str, ...]] = None
 
 
 class GetItemByIdHandler:
@@ -16,6 +21,33 @@ class GetItemByIdHandler:
         self.uow = uow
 
     async def handle(self, query: GetItemByIdQuery) -> ItemPublic:
+        cached_item = await item_cache.get(query.item_id)
+        if cached_item is not None:
+            # Entries are shared with admins and other owners' lookups, so
+            # ownership is checked on every hit.
+            if cached_item.owner_id != query.owner_id:
+                raise ResourceNotFoundError(
+                    "Item not found or you don't have permission."
+                )
+            if query.fields is not None:
+                return partial_model(ItemPublic, query.fields).model_validate(
+                    cached_item.model_dump(include=set(query.fields))
+                )
+            return cached_item
+
+        if query.fields is not None:
+            # Sparse reads load only their columns, and so are not cached.
+            async with self.uow:
+                repo = self.uow.get_repository(ItemRepository)
+                row = await repo.get_columns(
+                    item_id=query.item_id, owner_id=query.owner_id, columns=query.fields
+                )
+            if not row:
+                raise ResourceNotFoundError(
+                    "Item not found or you don't have permission."
+                )
+            return dto_from(ItemPublic, row, query.fields)
+
         async with self.uow:
             repo = self.uow.get_repository(ItemRepository)
 
@@ -27,4 +59,33 @@ class GetItemByIdHandler:
                     "Item not found or you don't have permission."
                 )
 
-            return ItemPublic.model_validate(db_item)
+            item = ItemPublic.model_validate(db_item)
+
+        # Caching a replica's row could undo the invalidation of a write that
+        # has not reached it yet.
+        if self.uow.reads_primary:
+            await item_cache.set(item)
+        return item
+
+
+class GetItemVersionHandler:
+    """
+    Answers a GetItemByIdQuery with only the item's version, for conditional
+    requests. Returns None when the item is not found.
+    """
+
+    def __init__(self, uow: IUnitOfWork):
+        self.uow = uow
+
+    async def handle(self, query: GetItemByIdQuery) -> Optional[ResourceVersion]:
+        cached_item = await item_cache.get(query.item_id)
+        if cached_item is not None:
+            if cached_item.owner_id != query.owner_id:
+                return None
+            return ResourceVersion(cached_item.version, cached_item.updated_at)
+
+        async with self.uow:
+            repo = self.uow.get_repository(ItemRepository)
+            row = await repo.get_version(item_id=query.item_id, owner_id=query.owner_id)
+
+        return ResourceVersion(*row) if row else None
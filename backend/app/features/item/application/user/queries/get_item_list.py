@@ -1,14 +1,27 @@
 import uuid
+from datetime import datetime
+from typing import Optional, Tuple
 from pydantic import BaseModel
 from app.shared.infrastructure.uow import IUnitOfWork
 from app.features.item.schemas import ItemPublic
 from app.features.item.infra.item_repository import ItemRepository
-from app.shared.schemas import PageParams, Paginated
+from app.shared.schemas import (
+    CursorPaginated,
+    CursorParams,
+    PageParams,
+    PageVersions,
+    Paginated,
+    decode_cursor,
+    dto_from,
+    encode_cursor,
+)
 
 
 class GetItemListQuery(BaseModel):
     owner_id: uuid.UUID
     page_params: PageParams
+    # A sparse fieldset: only these columns are loaded and returned.
+    fields: Optional[Tuple[str, ...]] = None
 
 
 class GetItemListHandler:
@@ -16,19 +29,117 @@ class GetItemListHandler:
         self.uow = uow
 
     async def handle(self, query: GetItemListQuery) -> Paginated[ItemPublic]:
-        items_from_db = []
-        total_count = 0
-
         async with self.uow:
             repo = self.uow.get_repository(ItemRepository)
-            items_from_db, total_count = await repo.get_multi_by_owner_paginated(
+            page = await repo.get_multi_by_owner_paginated(
                 owner_id=query.owner_id,
                 offset=query.page_params.offset,
                 limit=query.page_params.size,
+                count_strategy=query.page_params.count_strategy,
+                columns=query.fields,
             )
 
-        item_dtos = [ItemPublic.model_validate(item) for item in items_from_db]
+        item_dtos = [dto_from(ItemPublic, item, query.fields) for item in page.items]
 
         return Paginated.create(
-            items=item_dtos, total=total_count, params=query.page_params
+            items=item_dtos,
+            total=page.total,
+            params=query.page_params,
+            has_next=page.has_next,
+        )
+
+
+class GetItemListVersionsHandler:
+    """
+    Answers a GetItemListQuery with only the versions of the page, for
+    conditional requests.
+    """
+
+    def __init__(self, uow: IUnitOfWork):
+        self.uow = uow
+
+    async def handle(self, query: GetItemListQuery) -> PageVersions:
+        async with self.uow:
+            repo = self.uow.get_repository(ItemRepository)
+            page = await repo.get_versions_by_owner_paginated(
+                owner_id=query.owner_id,
+                offset=query.page_params.offset,
+                limit=query.page_params.size,
+                count_strategy=query.page_params.count_strategy,
+            )
+
+        return PageVersions(
+            versions=[(row[0], row[1]) for row in page.items],
+            total=page.total,
+            has_next=page.has_next,
+        )
+
+
+class GetItemListByCursorQuery(BaseModel):
+    owner_id: uuid.UUID
+    cursor_params: CursorParams
+    # A sparse fieldset: only these columns are loaded and returned.
+    fields: Optional[Tuple[str, ...]] = None
+
+
+class GetItemListByCursorHandler:
+    def __init__(self, uow: IUnitOfWork):
+        self.uow = uow
+
+    async def handle(
+        self, query: GetItemListByCursorQuery
+    ) -> CursorPaginated[ItemPublic]:
+        params = query.cursor_params
+        after = (
+            decode_cursor(params.cursor, datetime.fromisoformat, uuid.UUID)
+            if params.cursor
+            else None
+        )
+
+        async with self.uow:
+            repo = self.uow.get_repository(ItemRepository)
+            items_from_db, has_next = await repo.get_multi_by_owner_keyset(
+                owner_id=query.owner_id,
+                after=after,
+                limit=params.size,
+                columns=query.fields,
+            )
+
+        item_dtos = [dto_from(ItemPublic, item, query.fields) for item in items_from_db]
+        next_cursor = (
+            encode_cursor(item_dtos[-1].created_at, item_dtos[-1].id)
+            if has_next
+            else None
+        )
+
+        return CursorPaginated.create(
+            items=item_dtos, next_cursor=next_cursor, params=params
+        )
+
+
+class GetItemListByCursorVersionsHandler:
+    """
+    Answers a GetItemListByCursorQuery with only the versions of the page,
+    for conditional requests.
+    """
+
+    def __init__(self, uow: IUnitOfWork):
+        self.uow = uow
+
+    async def handle(self, query: GetItemListByCursorQuery) -> PageVersions:
+        params = query.cursor_params
+        after = (
+            decode_cursor(params.cursor, datetime.fromisoformat, uuid.UUID)
+            if params.cursor
+            else None
+        )
+
+        async with self.uow:
+            repo = self.uow.get_repository(ItemRepository)
+            rows, has_next = await repo.get_versions_by_owner_keyset(
+                owner_id=query.owner_id, after=after, limit=params.size
+            )
+
+        return PageVersions(
+            versions=[(row[0], row[1]) for row in rows], total=None, has_next=has_next
         )
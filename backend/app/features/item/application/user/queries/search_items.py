@@ -0,0 +1,72 @@
+import uuid
+from typing import List
+from pydantic import BaseModel
+from app.shared.infrastructure.uow import IUnitOfWork
+from app.shared.schemas import (
+    CursorPaginated,
+    CursorParams,
+    decode_cursor,
+    encode_cursor,
+)
+from app.features.item.infra.item_repository import ItemRepository
+from app.features.item.schemas import ItemSearchResult, ItemSuggestion
+
+
+class SearchItemsQuery(BaseModel):
+    text: str
+    owner_id: uuid.UUID
+    cursor_params: CursorParams
+
+
+class SearchItemsHandler:
+    def __init__(self, uow: IUnitOfWork):
+        self.uow = uow
+
+    async def handle(
+        self, query: SearchItemsQuery
+    ) -> CursorPaginated[ItemSearchResult]:
+        params = query.cursor_params
+        after = (
+            decode_cursor(params.cursor, float, uuid.UUID) if params.cursor else None
+        )
+
+        async with self.uow:
+            repo = self.uow.get_repository(ItemRepository)
+            hits, has_next = await repo.search(
+                text=query.text,
+                owner_id=query.owner_id,
+                after=after,
+                limit=params.size,
+            )
+
+        results = [
+            ItemSearchResult.model_validate(item, update={"rank": rank})
+            for item, rank in hits
+        ]
+        next_cursor = (
+            encode_cursor(results[-1].rank, results[-1].id) if has_next else None
+        )
+
+        return CursorPaginated.create(
+            items=results, next_cursor=next_cursor, params=params
+        )
+
+
+class AutocompleteItemsQuery(BaseModel):
+    prefix: str
+    owner_id: uuid.UUID
+    limit: int
+
+
+class AutocompleteItemsHandler:
+    def __init__(self, uow: IUnitOfWork):
+        self.uow = uow
+
+    async def handle(self, query: AutocompleteItemsQuery) -> List[ItemSuggestion]:
+        async with self.uow:
+            repo = self.uow.get_repository(ItemRepository)
+            rows = await repo.autocomplete_names(
+                prefix=query.prefix, owner_id=query.owner_id, limit=query.limit
+            )
+
+        return [ItemSuggestion(id=row.id, name=row.name) for row in rows]
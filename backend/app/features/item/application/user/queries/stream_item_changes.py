@@ -0,0 +1,27 @@
+import uuid
+from typing import AsyncIterator, Optional
+from pydantic import BaseModel
+from app.config import settings
+from app.shared.web.sse import ServerSentEvent
+from app.features.item.infra.item_feed import ItemChangeFeed, item_feed
+
+
+class StreamItemChangesQuery(BaseModel):
+    owner_id: uuid.UUID
+
+
+class StreamItemChangesHandler:
+    def __init__(self, feed: ItemChangeFeed = item_feed):
+        self.feed = feed
+
+    async def handle(
+        self, query: StreamItemChangesQuery
+    ) -> AsyncIterator[Optional[ServerSentEvent]]:
+        """
+        Yields the changes to the owner's items until the caller stops
+        iterating, and None whenever the feed was idle for a heartbeat
+        interval. The first event is a `resync`.
+        """
+        with self.feed.subscribe(owner_id=query.owner_id) as subscription:
+            while True:
+                yield await subscription.next(settings.ITEM_FEED_HEARTBEAT_SECONDS)
@@ -0,0 +1,33 @@
+import uuid
+from app.shared.domain.event import DomainEvent
+
+
+class ItemCreated(DomainEvent):
+    """An item was created."""
+
+    item_id: uuid.UUID
+    owner_id: uuid.UUID
+    version: int
+
+
+class ItemUpdated(DomainEvent):
+    """An item's fields (or owner) changed."""
+
+    item_id: uuid.UUID
+    owner_id: uuid.UUID
+    version: int
+
+
+class ItemDeleted(DomainEvent):
+    """An item was deleted."""
+
+    item_id: uuid.UUID
+    owner_id: uuid.UUID
+
+
+class ItemMoved(DomainEvent):
+    """An item was given to another owner; `owner_id` is the owner it left."""
+
+    item_id: uuid.UUID
+    owner_id: uuid.UUID
+    version: int
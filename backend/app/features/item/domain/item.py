@@ -1,12 +1,95 @@
 import uuid
+from datetime import datetime, timezone
 from typing import Optional
-from sqlmodel import Field
+from sqlalchemy import Column, Computed, DateTime, func, literal_column
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlmodel import Field, Index
 from app.shared.domain.aggregate_root import AggregateRoot
+from app.shared.domain.ids import uuid7
+from .events import ItemCreated, ItemDeleted, ItemMoved, ItemUpdated
+
+# Sort/match key for name autocomplete; see the prefix indexes below.
+NAME_PREFIX_KEY = func.lower(literal_column("name")).collate("C")
+
+# Text search configuration of `search_vector`. 'simple' does no stemming or
+# stop-word removal, so it works the same for any language.
+SEARCH_CONFIG = "simple"
 
 
 # The Item aggregate root and database table model.
 class Item(AggregateRoot, table=True):
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True, nullable=False)
-    name: str = Field(index=True)
+    __table_args__ = (
+        # Serves owner-scoped lookups and counts. The included version
+        # columns let conditional GETs be answered from the index alone.
+        Index(
+            "ix_item_owner_id_id",
+            "owner_id",
+            "id",
+            postgresql_include=["version", "updated_at"],
+        ),
+        # Serve the item lists, newest first: an owner's (answerable from the
+        # index alone for conditional requests) and all items.
+        Index(
+            "ix_item_owner_id_created_at_id",
+            "owner_id",
+            "created_at",
+            "id",
+            postgresql_include=["version", "updated_at"],
+        ),
+        Index("ix_item_created_at_id", "created_at", "id"),
+        # Full-text search document, maintained by Postgres. Matches in the
+        # name weigh more than matches in the description.
+        Column(
+            "search_vector",
+            TSVECTOR,
+            Computed(
+                f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(name, '')), 'A')"
+                f" || setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+        ),
+        Index("ix_item_search_vector", "search_vector", postgresql_using="gin"),
+        # Case-insensitive name prefix lookups (autocomplete), per owner and
+        # across all items. The "C" collation lets a B-tree serve both the
+        # LIKE 'abc%' range and the ORDER BY, so a LIMIT stops early.
+        Index("ix_item_owner_id_name_prefix", "owner_id", NAME_PREFIX_KEY),
+        Index("ix_item_name_prefix", NAME_PREFIX_KEY),
+    )
+    # The search vector is only used in queries and never loaded into items.
+    __mapper_args__ = {"exclude_properties": ["search_vector"], "eager_defaults": True}
+
+    id: uuid.UUID = Field(default_factory=uuid7, primary_key=True, nullable=False)
+    name: str
     description: Optional[str] = None
     owner_id: uuid.UUID = Field(foreign_key="user.id", nullable=False)
+    # Lists are ordered by creation time, ties broken by id. Ids alone do not
+    # give that order: rows created before ids were UUIDv7 have random ones.
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
+    )
+
+    # --- Domain Events ---
+    # Changes are applied by the repository in single INSERT/UPDATE/DELETE
+    # statements, which call these with the affected rows.
+    def record_created(self) -> None:
+        self._add_domain_event(
+            ItemCreated(item_id=self.id, owner_id=self.owner_id, version=self.version)
+        )
+
+    def record_updated(self, previous_owner_id: Optional[uuid.UUID] = None) -> None:
+        self._add_domain_event(
+            ItemUpdated(item_id=self.id, owner_id=self.owner_id, version=self.version)
+        )
+        # ItemUpdated only reaches the new owner; tell the old one too.
+        if previous_owner_id is not None and previous_owner_id != self.owner_id:
+            self._add_domain_event(
+                ItemMoved(
+                    item_id=self.id, owner_id=previous_owner_id, version=self.version
+                )
+            )
+
+    def record_deleted(self) -> None:
+        self._add_domain_event(ItemDeleted(item_id=self.id, owner_id=self.owner_id))
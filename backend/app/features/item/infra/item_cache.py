@@ -0,0 +1,112 @@
+import uuid
+from typing import Any, Dict, Iterable, Optional, Sequence
+from pydantic import ValidationError
+from app.config import settings
+from app.shared.application.event_bus import event_bus
+from app.shared.infrastructure.cache.interface import ICache
+from app.shared.infrastructure.cache.memory import MemoryCache
+from app.shared.infrastructure.cache.redis_cache import RedisCache
+from ..domain.events import ItemDeleted, ItemUpdated
+from ..schemas import ItemPublic
+
+
+class ItemCache:
+    """
+    A read-through cache of ItemPublic DTOs, keyed by item id.
+
+    Queries look items up here first and store what they load from the
+    primary (never what they read from a replica, which may be behind the
+    invalidation). Entries are dropped when an item is updated or deleted, by the
+    ItemUpdated/ItemDeleted events that the Unit of Work publishes only after
+    the transaction commits; invalidating earlier would let a concurrent read
+    cache the old row again before the change became visible. The TTL bounds
+    how long anything missed (e.g. a write made outside the application) can
+    be served.
+    """
+
+    def __init__(self, backend: Optional[ICache], backend_name: str):
+        self._backend = backend
+        self.backend_name = backend_name
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._backend is not None
+
+    async def get(self, item_id: uuid.UUID) -> Optional[ItemPublic]:
+        if self._backend is None:
+            return None
+
+        value = await self._backend.get(str(item_id))
+        try:
+            item = None if value is None else ItemPublic.model_validate_json(value)
+        except ValidationError:
+            # Cached by a version of the app with different item fields.
+            item = None
+        if item is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        return item
+
+    async def set(self, item: ItemPublic) -> None:
+        if self._backend is not None:
+            await self._backend.set(str(item.id), item.model_dump_json())
+
+    async def invalidate(self, item_ids: Iterable[uuid.UUID]) -> None:
+        keys = [str(item_id) for item_id in item_ids]
+        if self._backend is not None and keys:
+            await self._backend.delete(*keys)
+            self._invalidations += len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._hits + self._misses
+        return {
+            "backend": self.backend_name,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": round(self._hits / lookups, 4) if lookups else None,
+            "invalidations": self._invalidations,
+            **(self._backend.stats() if self._backend is not None else {}),
+        }
+
+    async def close(self) -> None:
+        if self._backend is not None:
+            await self._backend.close()
+
+
+def _create_backend(name: str) -> Optional[ICache]:
+    if name == "memory":
+        return MemoryCache(
+            max_size=settings.ITEM_CACHE_MAX_SIZE,
+            ttl_seconds=settings.ITEM_CACHE_TTL_SECONDS,
+        )
+    if name == "redis":
+        return RedisCache(
+            url=settings.ITEM_CACHE_REDIS_URL,
+            namespace="item",
+            ttl_seconds=settings.ITEM_CACHE_TTL_SECONDS,
+            timeout_seconds=settings.ITEM_CACHE_REDIS_TIMEOUT_SECONDS,
+        )
+    if name == "none":
+        return None
+    raise ValueError(f"Unknown ITEM_CACHE_BACKEND: {name!r}")
+
+
+item_cache = ItemCache(
+    backend=_create_backend(settings.ITEM_CACHE_BACKEND),
+    backend_name=settings.ITEM_CACHE_BACKEND,
+)
+
+
+async def invalidate_changed_items(
+    events: Sequence[ItemUpdated | ItemDeleted],
+) -> None:
+    await item_cache.invalidate({event.item_id for event in events})
+
+
+event_bus.subscribe(ItemUpdated, invalidate_changed_items)
+event_bus.subscribe(ItemDeleted, invalidate_changed_items)
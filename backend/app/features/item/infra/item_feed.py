@@ -0,0 +1,174 @@
+import asyncio
+import json
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+from itertools import chain
+from typing import Any, Dict, Iterator, Optional, Sequence, Set
+from app.config import settings
+from app.shared.application.event_bus import outbox_bus
+from app.shared.infrastructure.db.notifications import notify, pg_listener
+from app.shared.web.sse import ServerSentEvent
+from ..domain.events import ItemCreated, ItemDeleted, ItemMoved, ItemUpdated
+
+# The Postgres notification channel that carries item changes.
+CHANNEL = "item_changes"
+
+CHANGE_TYPES = {
+    ItemCreated: "created",
+    ItemUpdated: "updated",
+    ItemDeleted: "deleted",
+    ItemMoved: "moved",
+}
+
+# Tells a client that it may have missed changes, and must reload what it
+# shows (e.g. with a conditional GET /items) before applying further events.
+RESYNC = ServerSentEvent("resync", "{}")
+
+
+class ItemChangeSubscription:
+    """
+    One client's stream of item changes: a bounded queue that the feed fills
+    and the client's response drains.
+
+    A client that falls `buffer_size` events behind is not waited for. Its
+    queued changes are discarded and replaced by a single `resync` event, so
+    a slow consumer costs a bounded amount of memory and never delays
+    others. Every subscription also starts with a `resync`, which tells the
+    client to load its initial state.
+    """
+
+    def __init__(self, owner_id: Optional[uuid.UUID], buffer_size: int):
+        self.owner_id = owner_id
+        self._queue: asyncio.Queue[ServerSentEvent] = asyncio.Queue(
+            maxsize=max(buffer_size, 1)
+        )
+        self._queue.put_nowait(RESYNC)
+        self.delivered = 0
+        self.dropped = 0
+        self.resyncs = 0
+
+    def offer(self, event: ServerSentEvent) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.resync()
+
+    def resync(self) -> None:
+        """Discards the queued changes and asks the client to reload instead."""
+        while not self._queue.empty():
+            if self._queue.get_nowait() is not RESYNC:
+                self.dropped += 1
+        self._queue.put_nowait(RESYNC)
+        self.resyncs += 1
+
+    async def next(self, timeout: float) -> Optional[ServerSentEvent]:
+        """The next event, or None when there was none for `timeout` seconds."""
+        try:
+            event = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        self.delivered += 1
+        return event
+
+
+class ItemChangeFeed:
+    """
+    Fans item changes out to the subscribed clients of this process: each
+    owner's clients get the changes to that owner's items, and firehose
+    subscriptions (owner None, admin only) get every change.
+
+    Changes arrive as Postgres notifications on the process's single LISTEN
+    connection (see `pg_listener`), so they include changes made by every
+    worker, and each is decoded once however many clients receive it.
+    """
+
+    def __init__(self, buffer_size: int):
+        self.buffer_size = buffer_size
+        self._by_owner: Dict[uuid.UUID, Set[ItemChangeSubscription]] = defaultdict(set)
+        self._firehose: Set[ItemChangeSubscription] = set()
+        self._received = 0
+        # Totals of closed subscriptions; live ones are added in stats().
+        self._delivered = 0
+        self._dropped = 0
+        self._resyncs = 0
+
+    @contextmanager
+    def subscribe(
+        self, owner_id: Optional[uuid.UUID]
+    ) -> Iterator[ItemChangeSubscription]:
+        subscription = ItemChangeSubscription(owner_id, self.buffer_size)
+        group = self._firehose if owner_id is None else self._by_owner[owner_id]
+        group.add(subscription)
+        try:
+            yield subscription
+        finally:
+            group.discard(subscription)
+            if owner_id is not None and not group:
+                self._by_owner.pop(owner_id, None)
+            self._delivered += subscription.delivered
+            self._dropped += subscription.dropped
+            self._resyncs += subscription.resyncs
+
+    def dispatch(self, payload: str) -> None:
+        """Delivers one change notification to the matching subscriptions."""
+        self._received += 1
+        change = json.loads(payload)
+        event = ServerSentEvent(f"item.{change['type']}", payload)
+        owners = self._by_owner.get(uuid.UUID(change["owner_id"]), ())
+        for subscription in chain(self._firehose, owners):
+            subscription.offer(event)
+
+    def resync_all(self) -> None:
+        """Asks every client to reload, e.g. after notifications were lost."""
+        for subscription in self._subscriptions():
+            subscription.resync()
+
+    def stats(self) -> Dict[str, Any]:
+        live = list(self._subscriptions())
+        return {
+            "subscribers": len(live),
+            "firehose_subscribers": len(self._firehose),
+            "received": self._received,
+            "delivered": self._delivered + sum(s.delivered for s in live),
+            "dropped": self._dropped + sum(s.dropped for s in live),
+            "resyncs": self._resyncs + sum(s.resyncs for s in live),
+        }
+
+    def _subscriptions(self) -> Iterator[ItemChangeSubscription]:
+        return chain(self._firehose, *self._by_owner.values())
+
+
+item_feed = ItemChangeFeed(buffer_size=settings.ITEM_FEED_CLIENT_BUFFER_SIZE)
+
+pg_listener.listen(CHANNEL, item_feed.dispatch)
+pg_listener.on_connect(item_feed.resync_all)
+
+
+async def notify_item_changes(
+    events: Sequence[ItemCreated | ItemUpdated | ItemDeleted | ItemMoved],
+) -> None:
+    """
+    Broadcasts committed item changes to the feeds of all processes. Runs
+    from the outbox, so a change is announced even if the process that made
+    it dies right after the commit.
+    """
+    await notify(
+        CHANNEL,
+        [
+            json.dumps(
+                {
+                    "type": CHANGE_TYPES[type(event)],
+                    "id": str(event.item_id),
+                    "owner_id": str(event.owner_id),
+                    "version": getattr(event, "version", None),
+                },
+                separators=(",", ":"),
+            )
+            for event in events
+        ],
+    )
+
+
+for event_type in CHANGE_TYPES:
+    outbox_bus.subscribe(event_type, notify_item_changes)
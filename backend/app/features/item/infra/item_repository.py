@@ -1,71 +1,414 @@
 import uuid
-from typing import List, Optional, Tuple
-from sqlmodel import select, func
+from datetime import datetime
+from typing import (
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+from sqlalchemy import Boolean, Row, Uuid, case, cast, column, func, values
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlmodel import delete, insert, select, update
 from sqlmodel.ext.asyncio.session import AsyncSession
-from ..domain.item import Item
-from ..schemas import ItemCreate, ItemUpdate
+from sqlmodel.sql.expression import Select, SelectOfScalar
+from app.shared.infrastructure.db.pagination import (
+    Page,
+    keyset_page,
+    paginate,
+    split_page,
+)
+from app.shared.infrastructure.db.updates import update_returning
+from app.shared.schemas import CountStrategy
+from ..domain.item import SEARCH_CONFIG, Item
+from ..schemas import ItemCreate, ItemUpdate, ItemUpdateAdmin
+
+
+# Item lists are ordered by creation, newest first, with the id breaking ties.
+CREATION_KEY = (Item.created_at, Item.id)
+NEWEST_FIRST = tuple(key.desc() for key in CREATION_KEY)
 
 
 class ItemRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
+        # Items changed through this repository; the Unit of Work publishes
+        # their domain events after commit.
+        self.seen: Set[Item] = set()
+
+    @staticmethod
+    def _select(columns: Optional[Sequence[str]]) -> Select | SelectOfScalar:
+        """
+        SELECTs whole items or, for sparse fieldsets, only the named columns
+        (at least two), which come back as rows in that order.
+        """
+        if columns is None:
+            return select(Item)
+        return select(*(getattr(Item, name) for name in columns))
 
     async def get(self, item_id: uuid.UUID, owner_id: uuid.UUID) -> Optional[Item]:
         statement = select(Item).where(Item.id == item_id, Item.owner_id == owner_id)
         result = await self.session.exec(statement)
         return result.first()
 
+    async def get_columns(
+        self,
+        item_id: uuid.UUID,
+        owner_id: Optional[uuid.UUID],
+        columns: Sequence[str],
+    ) -> Optional[Row]:
+        """
+        Gets only the named columns of an item. A `None` owner_id skips the
+        ownership check (admin use only).
+        """
+        statement = self._select(columns).where(Item.id == item_id)
+        if owner_id is not None:
+            statement = statement.where(Item.owner_id == owner_id)
+        return (await self.session.exec(statement)).first()
+
     async def get_multi_by_owner_paginated(
-        self, owner_id: uuid.UUID, offset: int = 0, limit: int = 100
-    ) -> Tuple[List[Item], int]:
+        self,
+        owner_id: uuid.UUID,
+        offset: int = 0,
+        limit: int = 100,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Page:
         """
-        Gets a paginated list of items for an owner and the total count.
+        Gets a paginated list of items for an owner and, depending on the
+        count strategy, the total count. With `columns`, the items are rows
+        of only those columns.
         """
-        # --- Query for the data ---
-        data_statement = (
-            select(Item)
+        statement = (
+            self._select(columns)
             .where(Item.owner_id == owner_id)
-            .order_by(Item.id.desc())  # Or another consistent order
-            .offset(offset)
-            .limit(limit)
+            .order_by(*NEWEST_FIRST)
         )
+        return await paginate(self.session, statement, offset, limit, count_strategy)
 
-        # --- Query for the total count ---
-        # We build a separate query for the count for clarity and performance.
-        count_statement = (
-            select(func.count()).select_from(Item).where(Item.owner_id == owner_id)
+    async def get_multi_by_owner_keyset(
+        self,
+        owner_id: uuid.UUID,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+        limit: int = 100,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Tuple[List[Item | Row], bool]:
+        """
+        Gets a keyset-paginated page of an owner's items, newest first, and
+        whether another page follows. `after` is the (created_at, id) of the
+        last item of the previous page. With `columns`, the items are rows of
+        only those columns.
+        """
+        statement = keyset_page(
+            self._select(columns).where(Item.owner_id == owner_id),
+            keys=CREATION_KEY,
+            after=after,
+            limit=limit,
+            descending=True,
         )
+        items = (await self.session.exec(statement)).all()
+        return split_page(items, limit)
 
-        # --- Execute both queries ---
-        # In a real high-performance scenario, one might run these concurrently
-        # with asyncio.gather, but for simplicity, sequential is fine.
-        data_result = await self.session.exec(data_statement)
-        items = data_result.all()
+    async def get_version(
+        self, item_id: uuid.UUID, owner_id: Optional[uuid.UUID]
+    ) -> Optional[Row]:
+        """
+        Gets the (version, updated_at) of an item without loading it. For an
+        owner's item, both columns are read from ix_item_owner_id_id alone
+        (an index-only scan). A `None` owner_id skips the ownership check
+        (admin use only).
+        """
+        statement = select(Item.version, Item.updated_at).where(Item.id == item_id)
+        if owner_id is not None:
+            statement = statement.where(Item.owner_id == owner_id)
+        return (await self.session.exec(statement)).first()
 
-        count_result = await self.session.exec(count_statement)
-        total = count_result.one()
+    async def get_versions_by_owner_paginated(
+        self,
+        owner_id: uuid.UUID,
+        offset: int = 0,
+        limit: int = 100,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+    ) -> Page:
+        """
+        Like `get_multi_by_owner_paginated`, but the page holds only the
+        (id, version) of each item, read from ix_item_owner_id_created_at_id
+        alone.
+        """
+        statement = (
+            select(Item.id, Item.version)
+            .where(Item.owner_id == owner_id)
+            .order_by(*NEWEST_FIRST)
+        )
+        return await paginate(self.session, statement, offset, limit, count_strategy)
 
-        return items, total
+    async def get_versions_by_owner_keyset(
+        self,
+        owner_id: uuid.UUID,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+        limit: int = 100,
+    ) -> Tuple[List[Row], bool]:
+        """
+        Like `get_multi_by_owner_keyset`, but the page holds only the
+        (id, version) of each item, read from ix_item_owner_id_created_at_id
+        alone.
+        """
+        statement = keyset_page(
+            select(Item.id, Item.version).where(Item.owner_id == owner_id),
+            keys=CREATION_KEY,
+            after=after,
+            limit=limit,
+            descending=True,
+        )
+        rows = (await self.session.exec(statement)).all()
+        return split_page(rows, limit)
 
     async def create(self, item_in: ItemCreate, owner_id: uuid.UUID) -> Item:
+        """Creates an item and flushes it. Does not commit."""
         db_item = Item.model_validate(item_in, update={"owner_id": owner_id})
-        self.session.add(db_item)
-        await self.session.commit()
+        self.add(db_item)
+        await self.session.flush()
         await self.session.refresh(db_item)
         return db_item
 
-    async def update(self, db_item: Item, item_in: ItemUpdate) -> Item:
-        item_data = item_in.model_dump(exclude_unset=True)
-        for key, value in item_data.items():
-            setattr(db_item, key, value)
+    def add(self, db_item: Item) -> None:
+        """Adds a new item to the session. Does not commit."""
         self.session.add(db_item)
-        await self.session.commit()
-        await self.session.refresh(db_item)
+        self._record(db_item, Item.record_created)
+
+    async def update(
+        self,
+        item_id: uuid.UUID,
+        item_in: ItemUpdate | ItemUpdateAdmin,
+        owner_id: Optional[uuid.UUID],
+        expected_version: Optional[int] = None,
+    ) -> Optional[Item]:
+        """
+        Applies a partial update in a single UPDATE ... RETURNING, without
+        loading the item first. Only the fields `item_in` explicitly sets are
+        changed.
+
+        Returns None when no item matched: it does not exist, belongs to
+        another owner, or is no longer at `expected_version`. A `None`
+        owner_id skips the ownership check (admin use only). Does not commit.
+        """
+        criteria = [Item.id == item_id]
+        if owner_id is not None:
+            criteria.append(Item.owner_id == owner_id)
+        values = item_in.model_dump(exclude_unset=True)
+        previous_owner_id = None
+        if "owner_id" in values:
+            # Only reassignments pay for reading (and locking) the current
+            # owner, who must hear that the item moved away.
+            previous_owner_id = (
+                await self.session.exec(
+                    select(Item.owner_id).where(*criteria).with_for_update()
+                )
+            ).first()
+        db_item = await update_returning(
+            self.session,
+            Item,
+            *criteria,
+            values=values,
+            expected_version=expected_version,
+        )
+        if db_item is not None and values:
+            self._record(db_item, lambda item: item.record_updated(previous_owner_id))
         return db_item
 
     async def remove(self, db_item: Item) -> None:
+        """Deletes an item. Does not commit."""
         await self.session.delete(db_item)
-        await self.session.commit()
+        self._record(db_item, Item.record_deleted)
+
+    def _record(self, db_item: Item, record_event) -> None:
+        """Raises a domain event on a changed item and tracks it for the UoW."""
+        record_event(db_item)
+        self.seen.add(db_item)
+
+    async def get_many(
+        self, item_ids: Iterable[uuid.UUID], owner_id: Optional[uuid.UUID]
+    ) -> List[Item]:
+        """
+        Gets the items with the given ids. Ids that do not exist, or belong to
+        another owner, are left out. A `None` owner_id skips the ownership
+        check (admin use only).
+        """
+        statement = select(Item).where(Item.id.in_(list(item_ids)))
+        if owner_id is not None:
+            statement = statement.where(Item.owner_id == owner_id)
+        return (await self.session.exec(statement)).all()
+
+    async def bulk_create(
+        self, items_in: Sequence[ItemCreate], owner_id: uuid.UUID
+    ) -> List[Item]:
+        """
+        Inserts many items with a multi-row INSERT ... RETURNING. The returned
+        items are in the order of `items_in`. Does not commit.
+        """
+        rows = [
+            Item.model_validate(item_in, update={"owner_id": owner_id}).model_dump()
+            for item_in in items_in
+        ]
+        statement = insert(Item).returning(Item, sort_by_parameter_order=True)
+        db_items = (await self.session.exec(statement, params=rows)).scalars().all()
+        for db_item in db_items:
+            self._record(db_item, Item.record_created)
+        return db_items
+
+    async def bulk_update(
+        self,
+        items_in: Sequence[ItemUpdate | ItemUpdateAdmin],
+        owner_id: Optional[uuid.UUID],
+    ) -> List[Item]:
+        """
+        Applies partial updates to many items in one UPDATE ... FROM (VALUES).
+
+        Each entry of `items_in` carries its item's `id`, and only the fields
+        it explicitly sets are changed. Items that do not exist, or belong to
+        another owner, are left untouched and are not returned. A `None`
+        owner_id skips the ownership check (admin use only). Does not commit.
+        """
+        fields = [
+            name
+            for name in type(items_in[0]).model_fields
+            if name != "id" and hasattr(Item, name)
+        ]
+        columns = [column("id", Uuid)]
+        for name in fields:
+            column_type = getattr(Item, name).type
+            columns += [column(name, column_type), column(f"set_{name}", Boolean)]
+
+        rows = []
+        for item_in in items_in:
+            row = [item_in.id]
+            for name in fields:
+                is_set = name in item_in.model_fields_set
+                row += [getattr(item_in, name) if is_set else None, is_set]
+            rows.append(tuple(row))
+        changes = values(*columns, name="changes").data(rows)
+
+        previous_owners: Dict[uuid.UUID, uuid.UUID] = {}
+        if any("owner_id" in item_in.model_fields_set for item_in in items_in):
+            # As in `update`, reassignments read and lock the current owners.
+            owners = (
+                select(Item.id, Item.owner_id)
+                .where(Item.id.in_([item_in.id for item_in in items_in]))
+                .order_by(Item.id)
+                .with_for_update()
+            )
+            if owner_id is not None:
+                owners = owners.where(Item.owner_id == owner_id)
+            previous_owners = dict((await self.session.exec(owners)).all())
+
+        statement = (
+            update(Item)
+            .where(Item.id == changes.c.id)
+            .values(
+                {
+                    # The cast types columns that are NULL in every row.
+                    name: case(
+                        (
+                            changes.c[f"set_{name}"],
+                            cast(changes.c[name], getattr(Item, name).type),
+                        ),
+                        else_=getattr(Item, name),
+                    )
+                    for name in fields
+                }
+            )
+            .returning(Item)
+            .execution_options(synchronize_session=False)
+        )
+        if owner_id is not None:
+            statement = statement.where(Item.owner_id == owner_id)
+        db_items = (await self.session.exec(statement)).scalars().all()
+        for db_item in db_items:
+            self._record(
+                db_item,
+                lambda item: item.record_updated(previous_owners.get(item.id)),
+            )
+        return db_items
+
+    async def bulk_remove(
+        self, item_ids: Iterable[uuid.UUID], owner_id: Optional[uuid.UUID]
+    ) -> Set[uuid.UUID]:
+        """
+        Deletes many items in one statement and returns the ids that were
+        deleted. A `None` owner_id skips the ownership check (admin use only).
+        Does not commit.
+        """
+        statement = (
+            delete(Item)
+            .where(Item.id.in_(list(item_ids)))
+            .returning(Item)
+            .execution_options(synchronize_session=False)
+        )
+        if owner_id is not None:
+            statement = statement.where(Item.owner_id == owner_id)
+        db_items = (await self.session.exec(statement)).scalars().all()
+        for db_item in db_items:
+            self._record(db_item, Item.record_deleted)
+        return {db_item.id for db_item in db_items}
+
+    async def search(
+        self,
+        text: str,
+        owner_id: Optional[uuid.UUID],
+        after: Optional[Tuple[float, uuid.UUID]] = None,
+        limit: int = 100,
+    ) -> Tuple[List[Tuple[Item, float]], bool]:
+        """
+        Full-text searches item names and descriptions with web search syntax
+        (quoted phrases, `or`, `-word`), using the GIN index on the search
+        vector.
+
+        Returns a keyset-paginated page of (item, rank) pairs, best matches
+        first, and whether another page follows. A `None` owner_id searches
+        all items (admin use only).
+        """
+        query = func.websearch_to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), text)
+        search_vector = Item.__table__.c.search_vector
+        rank = func.ts_rank_cd(search_vector, query)
+
+        statement = select(Item, rank.label("rank")).where(
+            search_vector.bool_op("@@")(query)
+        )
+        if owner_id is not None:
+            statement = statement.where(Item.owner_id == owner_id)
+        statement = keyset_page(
+            statement, keys=(rank, Item.id), after=after, limit=limit, descending=True
+        )
+        rows = (await self.session.exec(statement)).all()
+        return split_page([(row[0], row[1]) for row in rows], limit)
+
+    async def autocomplete_names(
+        self, prefix: str, owner_id: Optional[uuid.UUID], limit: int = 10
+    ) -> List[Row]:
+        """
+        Gets (id, name) rows whose name starts with `prefix`, ignoring case,
+        in name order. A `None` owner_id searches all items (admin use only).
+
+        The prefix is matched as a range on the indexed `lower(name)` key
+        rather than with LIKE, so the name prefix indexes are used even with
+        generic prepared-statement plans.
+        """
+        key = func.lower(Item.name).collate("C")
+        lower_bound = func.lower(prefix).collate("C")
+        # Every string that starts with the prefix sorts below prefix + U+10FFFF.
+        upper_bound = func.lower(prefix + "\U0010ffff").collate("C")
+        statement = (
+            select(Item.id, Item.name)
+            .where(key >= lower_bound, key < upper_bound)
+            .order_by(key)
+            .limit(limit)
+        )
+        if owner_id is not None:
+            statement = statement.where(Item.owner_id == owner_id)
+        return (await self.session.exec(statement)).all()
 
     async def get_by_id_admin(self, item_id: uuid.UUID) -> Optional[Item]:
         """
@@ -75,15 +418,57 @@ class ItemRepository:
         return await self.session.get(Item, item_id)
 
     async def get_multi_admin_paginated(
-        self, skip: int = 0, limit: int = 100
-    ) -> Tuple[List[Item], int]:
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Page:
         """
-        Gets a paginated list of all items and the total count.
+        Gets a paginated list of all items and, depending on the count
+        strategy, the total count. With `columns`, the items are rows of only
+        those columns.
         """
-        data_statement = select(Item).order_by(Item.id.desc()).offset(skip).limit(limit)
-        items = (await self.session.exec(data_statement)).all()
+        statement = self._select(columns).order_by(*NEWEST_FIRST)
+        return await paginate(self.session, statement, skip, limit, count_strategy)
 
-        count_statement = select(func.count()).select_from(Item)
-        total = (await self.session.exec(count_statement)).one()
+    async def get_multi_admin_keyset(
+        self,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+        limit: int = 100,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Tuple[List[Item | Row], bool]:
+        """
+        Gets a keyset-paginated page of all items, newest first, and whether
+        another page follows. `after` is the (created_at, id) of the last item
+        of the previous page. With `columns`, the items are rows of only those
+        columns.
+        """
+        statement = keyset_page(
+            self._select(columns),
+            keys=CREATION_KEY,
+            after=after,
+            limit=limit,
+            descending=True,
+        )
+        items = (await self.session.exec(statement)).all()
+        return split_page(items, limit)
 
-        return items, total
+    async def stream_all_admin(self, batch_size: int) -> AsyncIterator[Sequence[Row]]:
+        """
+        Streams all items, ordered by id, in batches read from a server-side
+        cursor. Rows are plain (id, name, description, owner_id) tuples rather
+        than ORM objects, so memory stays bounded by one batch.
+        """
+        statement = (
+            select(Item.id, Item.name, Item.description, Item.owner_id)
+            .order_by(Item.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(statement)
+        try:
+            async for rows in result.partitions():
+                yield rows
+        finally:
+            # Closes the cursor even when the consumer stops early.
+            await result.close()
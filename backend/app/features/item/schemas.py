@@ -1,7 +1,10 @@
 import uuid
-from typing import Optional
-from pydantic import BaseModel
+from datetime import datetime
+from enum import Enum
+from typing import Iterable, List, Optional, Sequence, Set
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
 from sqlmodel import SQLModel
+from app.config import settings
 
 
 # Base DTO with common fields
@@ -25,6 +28,9 @@ class ItemUpdate(BaseModel):  # Using BaseModel as all fields are optional
 class ItemPublic(ItemBase):
     id: uuid.UUID
     owner_id: uuid.UUID
+    version: int
+    updated_at: datetime
+    created_at: datetime
 
 
 # DTO for an admin updating an item
@@ -32,3 +38,136 @@ class ItemUpdateAdmin(BaseModel):
     name: Optional[str] = None
     description: Optional[str] = None
     owner_id: Optional[uuid.UUID] = None  # Admin might be able to reassign an item
+
+
+# DTO for a full-text search hit; a higher rank is a better match
+class ItemSearchResult(ItemPublic):
+    rank: float
+
+
+# DTO for a name autocomplete suggestion
+class ItemSuggestion(BaseModel):
+    id: uuid.UUID
+    name: str
+
+
+class ItemExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+# --- Bulk operations ---
+
+
+def _reject_duplicate_ids(ids: List[uuid.UUID]) -> List[uuid.UUID]:
+    if len(set(ids)) != len(ids):
+        raise ValueError("Item ids must be unique within a batch.")
+    return ids
+
+
+class ItemBulkCreate(BaseModel):
+    items: List[ItemCreate] = Field(
+        ..., min_length=1, max_length=settings.ITEM_BATCH_MAX_SIZE
+    )
+
+
+def _reject_null(value, info: ValidationInfo):
+    # Omit a field to leave it unchanged; its column is not nullable.
+    if value is None:
+        raise ValueError(f"Item {info.field_name} cannot be null.")
+    return value
+
+
+class ItemBulkUpdateEntry(ItemUpdate):
+    id: uuid.UUID
+
+    @field_validator("name")
+    @classmethod
+    def not_null(cls, value, info: ValidationInfo):
+        return _reject_null(value, info)
+
+
+class ItemBulkUpdate(BaseModel):
+    items: List[ItemBulkUpdateEntry] = Field(
+        ..., min_length=1, max_length=settings.ITEM_BATCH_MAX_SIZE
+    )
+
+    @field_validator("items")
+    @classmethod
+    def unique_ids(cls, items: List[ItemBulkUpdateEntry]):
+        _reject_duplicate_ids([item.id for item in items])
+        return items
+
+
+class ItemBulkUpdateAdminEntry(ItemUpdateAdmin):
+    id: uuid.UUID
+
+    @field_validator("name", "owner_id")
+    @classmethod
+    def not_null(cls, value, info: ValidationInfo):
+        return _reject_null(value, info)
+
+
+class ItemBulkUpdateAdmin(BaseModel):
+    items: List[ItemBulkUpdateAdminEntry] = Field(
+        ..., min_length=1, max_length=settings.ITEM_BATCH_MAX_SIZE
+    )
+
+    @field_validator("items")
+    @classmethod
+    def unique_ids(cls, items: List[ItemBulkUpdateAdminEntry]):
+        _reject_duplicate_ids([item.id for item in items])
+        return items
+
+
+class ItemBulkDelete(BaseModel):
+    ids: List[uuid.UUID] = Field(
+        ..., min_length=1, max_length=settings.ITEM_BATCH_MAX_SIZE
+    )
+
+    @field_validator("ids")
+    @classmethod
+    def unique_ids(cls, ids: List[uuid.UUID]):
+        return _reject_duplicate_ids(ids)
+
+
+class ItemBulkStatus(str, Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+    FOUND = "found"
+    NOT_FOUND = "not_found"  # Missing, or owned by someone else
+
+
+class ItemBulkResult(BaseModel):
+    id: uuid.UUID
+    status: ItemBulkStatus
+    item: Optional[ItemPublic] = None
+
+
+# Results are in the order of the request.
+class ItemBulkResponse(BaseModel):
+    results: List[ItemBulkResult]
+
+    @classmethod
+    def create(
+        cls,
+        ids: Sequence[uuid.UUID],
+        status: ItemBulkStatus,
+        items: Iterable[ItemPublic] = (),
+        found_ids: Optional[Set[uuid.UUID]] = None,
+    ) -> "ItemBulkResponse":
+        """
+        Gives each requested id the `status` if it was found (it is among
+        `items` or `found_ids`), and `not_found` otherwise.
+        """
+        items_by_id = {item.id: item for item in items}
+        found = found_ids if found_ids is not None else items_by_id.keys()
+        return cls(
+            results=[
+                ItemBulkResult(id=item_id, status=status, item=items_by_id.get(item_id))
+                if item_id in found
+                else ItemBulkResult(id=item_id, status=ItemBulkStatus.NOT_FOUND)
+                for item_id in ids
+            ]
+        )
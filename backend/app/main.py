@@ -3,15 +3,19 @@ from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 from app.config import settings
 from app.shared.infrastructure.db.session import async_engine
+from app.shared.infrastructure.concurrency.cpu_executor import cpu_executor
+from app.shared.infrastructure.db.pagination import count_cache
+from app.shared.infrastructure.db.notifications import pg_listener
+from app.shared.infrastructure.db.replicas import replica_router
+from app.shared.infrastructure.messaging.outbox import outbox_relay
+from app.features.item.infra.item_cache import item_cache
+from app.features.item.infra.item_feed import item_feed
 from app.features.iam.api.auth_router import router as auth_router
 from app.features.iam.api.user_router import router as user_router
 from app.features.iam.api.admin_router import router as admin_user_router
 from app.features.item.api.user_router import router as item_user_router
 from app.features.item.api.admin_router import router as item_admin_router
-from app.shared.web.middleware import (
-    ExceptionHandlingMiddleware,
-    LoggingContextMiddleware,
-)
+from app.shared.web.middleware import RequestContextMiddleware
 from app.shared.infrastructure.logging.config import setup_logging
 
 
@@ -22,11 +26,19 @@ async def lifespan(app: FastAPI):
     # Startup logic
     setup_logging()
     print("--- Starting up Application ---")
+    pg_listener.start()
+    replica_router.start()
+    outbox_relay.start()
     # 这里可以添加一些启动时检查，比如尝试连接数据库
     yield
     # Shutdown logic
     print("--- Shutting down Application ---")
+    await outbox_relay.stop()
+    await pg_listener.stop()
+    await replica_router.stop()
     await async_engine.dispose()
+    await item_cache.close()
+    cpu_executor.shutdown()
 
 
 # --- 创建 FastAPI 应用实例 ---
@@ -43,6 +55,20 @@ async def health_check():
     return {"status": "ok"}
 
 
+@app.get("/health/metrics", tags=["Health Check"])
+async def health_metrics():
+    return {
+        "cpu_executor": cpu_executor.stats(),
+        "db_pool": async_engine.pool.stats(),
+        "pagination_count_cache": count_cache.stats(),
+        "item_cache": item_cache.stats(),
+        "item_feed": item_feed.stats(),
+        "pg_listener": pg_listener.stats(),
+        "outbox_relay": outbox_relay.stats(),
+        "db_replicas": replica_router.stats(),
+    }
+
+
 # --- 包含功能模块的路由 ---
 app.include_router(
     auth_router, prefix=settings.API_V1_STR, tags=["IAM - Authentication"]
@@ -63,8 +89,7 @@ app.include_router(
     tags=["Admin - Items"],
 )
 # --- 添加全局中间件 ---
-app.add_middleware(ExceptionHandlingMiddleware)
-app.add_middleware(LoggingContextMiddleware)
+app.add_middleware(RequestContextMiddleware)
 
 app.mount(
     settings.STATIC_URL,
@@ -0,0 +1,59 @@
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, Iterable, List, Sequence, Type
+from app.shared.domain.event import DomainEvent
+from app.shared.infrastructure.logging.config import get_logger
+
+EventHandler = Callable[[Sequence[DomainEvent]], Awaitable[None]]
+
+logger = get_logger("app.events")
+
+
+class EventBus:
+    """
+    An in-process dispatcher of domain events to the handlers subscribed to
+    their type (or one of its base classes).
+
+    The Unit of Work publishes the events its aggregates raised once the
+    transaction has committed, so handlers only ever see changes that are
+    durable. Each handler receives all matching events of one publish call at
+    once, which lets it batch its work (e.g. one cache DELETE for many keys).
+    """
+
+    def __init__(self) -> None:
+        self._handlers: Dict[Type[DomainEvent], List[EventHandler]] = defaultdict(list)
+
+    def subscribe(self, event_type: Type[DomainEvent], handler: EventHandler) -> None:
+        self._handlers[event_type].append(handler)
+
+    def handles(self, event: DomainEvent) -> bool:
+        """Whether any handler is subscribed to the event's type."""
+        return any(event_type in self._handlers for event_type in type(event).__mro__)
+
+    async def publish(self, events: Iterable[DomainEvent]) -> None:
+        batches: Dict[EventHandler, List[DomainEvent]] = {}
+        for event in events:
+            for event_type in type(event).__mro__:
+                for handler in self._handlers.get(event_type, ()):
+                    batches.setdefault(handler, []).append(event)
+
+        for handler, batch in batches.items():
+            try:
+                await handler(batch)
+            except Exception:
+                # The transaction is already committed; a failing handler must
+                # not turn the request into an error or starve other handlers.
+                logger.exception(
+                    "Domain event handler failed",
+                    handler=getattr(handler, "__qualname__", repr(handler)),
+                    events=len(batch),
+                )
+
+
+# Handlers that must run right after the commit, in the process that made
+# the change, e.g. invalidating its caches. Lost if the process dies first.
+event_bus = EventBus()
+
+# Handlers of side effects that must not be lost: the Unit of Work stores
+# the events in the transactional outbox, and the outbox relay publishes them
+# here, in batches, at least once (see `OutboxRelay`).
+outbox_bus = EventBus()
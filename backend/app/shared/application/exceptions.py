@@ -22,3 +22,12 @@ class ResourceNotFoundError(ApplicationError):
     """A more generic not-found error for the application layer."""
 
     pass
+
+
+class ConcurrencyConflictError(ApplicationError):
+    """
+    Raised when an aggregate was changed by someone else since the version a
+    command was based on (optimistic concurrency control).
+    """
+
+    pass
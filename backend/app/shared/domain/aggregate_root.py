@@ -1,6 +1,9 @@
 # backend/app/shared/domain/aggregate_root.py
 
+from datetime import datetime, timezone
 from typing import List
+from sqlalchemy import DateTime, func, literal_column
+from sqlmodel import Field
 from .entity import Entity
 from .event import DomainEvent
 
@@ -16,8 +19,30 @@ class AggregateRoot(Entity):
     This class adds the capability to manage and dispatch domain events that occur
     within the aggregate, ensuring that business operations and their resulting
     events are managed transactionally.
+
+    Every aggregate also carries a `version`, incremented by the database on
+    each UPDATE of its row, and the time of that update in `updated_at`. The
+    increment is a column `onupdate`, so ORM flushes and bulk UPDATE
+    statements bump it alike. Tables of aggregate roots should map with
+    `eager_defaults`, so flushed objects read both back through RETURNING
+    instead of expiring them.
     """
 
+    version: int = Field(
+        default=1,
+        nullable=False,
+        sa_column_kwargs={
+            "server_default": "1",
+            "onupdate": literal_column("version") + 1,
+        },
+    )
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        nullable=False,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
+    )
+
     _domain_events: List[DomainEvent] = []
 
     @property
@@ -25,7 +50,11 @@ class AggregateRoot(Entity):
         """
         Returns the list of recorded domain events that have occurred in this aggregate.
         """
-        return self._domain_events
+        # Instances loaded by the ORM skip __init__, so their private state
+        # (and with it the per-instance event list) is created on first use.
+        if self.__pydantic_private__ is None:
+            object.__setattr__(self, "__pydantic_private__", {})
+        return self.__pydantic_private__.setdefault("_domain_events", [])
 
     def _add_domain_event(self, domain_event: DomainEvent) -> None:
         """
@@ -33,7 +62,7 @@ class AggregateRoot(Entity):
         method intended to be called by the aggregate's business methods after a
         state change.
         """
-        self._domain_events.append(domain_event)
+        self.domain_events.append(domain_event)
 
     def clear_domain_events(self) -> None:
         """
@@ -41,4 +70,4 @@ class AggregateRoot(Entity):
         have been successfully dispatched by the infrastructure layer (e.g., after
         a successful database commit).
         """
-        self._domain_events.clear()
+        self.domain_events.clear()
@@ -2,6 +2,7 @@
 
 import uuid
 from sqlmodel import SQLModel, Field
+from .ids import uuid7
 
 
 class Entity(SQLModel):
@@ -10,12 +11,16 @@ class Entity(SQLModel):
 
     Entities have a unique identifier and a lifecycle. Their identity is defined by their ID,
     not their attributes. This base class provides a default UUID identifier.
+    Identifiers are time-ordered UUIDv7s, so new keys are appended to their
+    indexes. Rows created before the switch keep their random UUIDv4 ids, so
+    lists that must follow creation order sort by a creation timestamp, with
+    the id only breaking ties.
 
     It also implements equality comparison based on the entity's ID, which is a
     fundamental concept in Domain-Driven Design.
     """
 
-    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    id: uuid.UUID = Field(default_factory=uuid7, primary_key=True)
 
     def __eq__(self, other: object) -> bool:
         """
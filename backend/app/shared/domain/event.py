@@ -12,4 +12,4 @@ class DomainEvent(BaseModel):
     """
 
     event_id: uuid.UUID = Field(default_factory=uuid.uuid4)
-    occurred_on: datetime = Field(default_factory=datetime.now(timezone.utc))
+    occurred_on: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -0,0 +1,44 @@
+import secrets
+import threading
+import time
+import uuid
+
+_lock = threading.Lock()
+_last_timestamp_ms = 0
+_last_counter = 0
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generates a time-ordered UUID version 7 (RFC 9562).
+
+    The first 48 bits are a Unix timestamp in milliseconds, so new keys are
+    appended to the right edge of a B-tree index instead of being scattered
+    across it, and ordering by id approximates ordering by creation time.
+    The 12-bit `rand_a` field is used as a counter that keeps ids generated
+    within the same millisecond monotonic in this process.
+    """
+    global _last_timestamp_ms, _last_counter
+
+    with _lock:
+        timestamp_ms = time.time_ns() // 1_000_000
+        if timestamp_ms > _last_timestamp_ms:
+            # Start from a random value in the lower half, leaving room to count.
+            counter = secrets.randbits(11)
+        else:
+            # Same millisecond (or the clock went backwards): keep counting.
+            timestamp_ms = _last_timestamp_ms
+            counter = _last_counter + 1
+            if counter > 0xFFF:
+                timestamp_ms += 1
+                counter = secrets.randbits(11)
+        _last_timestamp_ms, _last_counter = timestamp_ms, counter
+
+    value = (
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76  # version
+        | counter << 64
+        | 0b10 << 62  # variant
+        | secrets.randbits(62)
+    )
+    return uuid.UUID(int=value)
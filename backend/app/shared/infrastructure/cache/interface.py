@@ -0,0 +1,31 @@
+import abc
+from typing import Any, Dict, Optional
+
+
+class ICache(abc.ABC):
+    """
+    An async key/value cache of strings whose entries expire after a TTL.
+
+    Implementations must not raise on backend failures: a cache that is
+    unavailable behaves as if it were empty.
+    """
+
+    @abc.abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def set(self, key: str, value: str) -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def delete(self, *keys: str) -> None:
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns backend-specific metrics."""
+        return {}
+
+    async def close(self) -> None:
+        """Releases connections, if any."""
+        pass
@@ -0,0 +1,110 @@
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+from .interface import ICache
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    A bounded, in-process LRU cache whose entries expire after a TTL.
+
+    It is not shared between worker processes, so it suits values that may
+    be slightly stale for up to `ttl_seconds`. `on_evict`, if given, is
+    called with the key of each entry the cache drops by itself, because it
+    expired or was the least recently used one, e.g. to keep an index of the
+    keys in step.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        on_evict: Optional[Callable[[K], None]] = None,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._on_evict = on_evict
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl_seconds > 0
+
+    def get(self, key: K) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+                self._evicted(key)
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry[1]
+
+    def set(self, key: K, value: V) -> None:
+        if not self.enabled:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        # Evict the least recently used entries once the bound is exceeded.
+        while len(self._entries) > self.max_size:
+            self._evicted(self._entries.popitem(last=False)[0])
+
+    def delete(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _evicted(self, key: K) -> None:
+        if self._on_evict is not None:
+            self._on_evict(key)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+
+class MemoryCache(ICache):
+    """
+    An ICache backed by a TTLCache in this process. Fast, but each worker
+    process has its own copy, and invalidations only reach the process that
+    made the change; the TTL bounds how stale other processes can be.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self._cache: TTLCache[str, str] = TTLCache(max_size, ttl_seconds)
+
+    async def get(self, key: str) -> Optional[str]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: str) -> None:
+        self._cache.set(key, value)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._cache.delete(key)
+
+    def stats(self) -> Dict[str, Any]:
+        return self._cache.stats()
@@ -0,0 +1,80 @@
+from typing import Any, Dict, Optional
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from app.shared.infrastructure.logging.config import get_logger
+from .interface import ICache
+
+logger = get_logger("app.cache")
+
+
+class RedisCache(ICache):
+    """
+    An ICache in a Redis-protocol server (Redis, Valkey, KeyDB, ...), shared
+    by all worker processes, so an invalidation is seen by every process.
+
+    Keys are prefixed with `namespace` and written with an expiry (SET EX).
+    LRU eviction is the server's job: give it a `maxmemory` and an LRU
+    `maxmemory-policy` (e.g. `allkeys-lru`).
+
+    Server errors and timeouts are logged and counted, and then treated as a
+    miss (or a no-op), so the cache can slow a request down by at most the
+    socket timeout and never fails it.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        namespace: str,
+        ttl_seconds: int,
+        timeout_seconds: float,
+        client: Optional[Redis] = None,
+    ):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        # A client can be passed in, e.g. a local fake in tests.
+        self._client = client or Redis.from_url(
+            url,
+            socket_timeout=timeout_seconds,
+            socket_connect_timeout=timeout_seconds,
+        )
+        self._errors = 0
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    async def get(self, key: str) -> Optional[str]:
+        try:
+            value = await self._client.get(self._key(key))
+        except RedisError as e:
+            self._on_error("GET", e)
+            return None
+        return value.decode() if isinstance(value, bytes) else value
+
+    async def set(self, key: str, value: str) -> None:
+        try:
+            await self._client.set(self._key(key), value, ex=self.ttl_seconds)
+        except RedisError as e:
+            self._on_error("SET", e)
+
+    async def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        try:
+            await self._client.delete(*(self._key(key) for key in keys))
+        except RedisError as e:
+            self._on_error("DEL", e)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"errors": self._errors}
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    def _on_error(self, command: str, error: RedisError) -> None:
+        self._errors += 1
+        logger.warning(
+            "Cache command failed",
+            command=command,
+            namespace=self.namespace,
+            error=str(error),
+        )
@@ -0,0 +1,107 @@
+import asyncio
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+from app.config import settings
+
+T = TypeVar("T")
+
+
+class ExecutorOverloadedError(Exception):
+    """Raised when the CPU executor's queue is full and a task is rejected."""
+
+    pass
+
+
+class CpuBoundExecutor:
+    """
+    Runs CPU-bound callables (e.g. password hashing) off the event loop.
+
+    It is backed by a thread pool, which is enough for work that releases the
+    GIL, such as bcrypt. Submissions beyond `max_workers` wait in a queue of at
+    most `max_queue_size` tasks; once it is full, new submissions are rejected
+    with `ExecutorOverloadedError` instead of piling up unbounded latency.
+
+    A task counts as in flight from its submission until its worker is done
+    with it, even when the caller stopped waiting (e.g. the client
+    disconnected): the thread keeps running, so the bound still holds it.
+    All bookkeeping happens on the event loop thread, so no locking is needed.
+    """
+
+    def __init__(self, max_workers: int, max_queue_size: int):
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight = 0
+        self._max_queue_depth = 0
+        self._completed = 0
+        self._failed = 0
+        self._cancelled = 0
+        self._rejected = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of submitted tasks still waiting for a free worker."""
+        return max(0, self._in_flight - self.max_workers)
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        if self._in_flight >= self.max_workers + self.max_queue_size:
+            self._rejected += 1
+            raise ExecutorOverloadedError("CPU executor queue is full.")
+
+        loop = asyncio.get_running_loop()
+        future = self._get_executor().submit(func, *args)
+        self._in_flight += 1
+        self._max_queue_depth = max(self._max_queue_depth, self.queue_depth)
+        future.add_done_callback(functools.partial(self._on_done, loop))
+        # Cancelling the wait only cancels a task that has not started yet.
+        return await asyncio.wrap_future(future)
+
+    def _on_done(self, loop: asyncio.AbstractEventLoop, future: Future) -> None:
+        # Called on the worker thread; the counters belong to the loop.
+        try:
+            loop.call_soon_threadsafe(self._task_done, future)
+        except RuntimeError:
+            pass  # The loop is closed; there is nothing left to count for.
+
+    def _task_done(self, future: Future) -> None:
+        self._in_flight -= 1
+        if future.cancelled():
+            self._cancelled += 1
+        elif future.exception() is not None:
+            self._failed += 1
+        else:
+            self._completed += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Returns a snapshot of the executor's queue-depth metrics."""
+        return {
+            "max_workers": self.max_workers,
+            "max_queue_size": self.max_queue_size,
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self._max_queue_depth,
+            "completed": self._completed,
+            "failed": self._failed,
+            "cancelled": self._cancelled,
+            "rejected": self._rejected,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # Created lazily so that importing this module never spawns threads.
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="cpu-executor"
+            )
+        return self._executor
+
+
+cpu_executor = CpuBoundExecutor(
+    max_workers=settings.CPU_EXECUTOR_MAX_WORKERS,
+    max_queue_size=settings.CPU_EXECUTOR_MAX_QUEUE_SIZE,
+)
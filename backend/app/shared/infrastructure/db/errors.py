@@ -0,0 +1,16 @@
+from typing import Optional
+from sqlalchemy.exc import IntegrityError
+
+
+def get_violated_constraint(error: IntegrityError) -> Optional[str]:
+    """
+    Returns the name of the constraint (or unique index) that caused an
+    IntegrityError, if the database driver reports it.
+    """
+    # asyncpg exposes the name on the original exception, which SQLAlchemy's
+    # DBAPI adapter chains as the cause of `error.orig`.
+    for candidate in (error.orig, getattr(error.orig, "__cause__", None)):
+        constraint_name = getattr(candidate, "constraint_name", None)
+        if constraint_name:
+            return constraint_name
+    return None
@@ -0,0 +1,138 @@
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Tuple
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Runs of bind parameters (with their casts, if any), e.g. an expanded
+# `IN (...)`, vary in length from one execution to the next but are the same
+# statement shape.
+_PARAMETER = r"\$\d+(?:::\w+(?: \w+)*)?"
+_PARAMETER_RUN = re.compile(rf"{_PARAMETER}(?:\s*,\s*{_PARAMETER})*")
+
+_trackers: ContextVar[Tuple["QueryStats", ...]] = ContextVar(
+    "query_trackers", default=()
+)
+
+
+def statement_shape(statement: str) -> str:
+    """A statement with its whitespace and bind parameter runs normalized."""
+    return _PARAMETER_RUN.sub("?", " ".join(statement.split()))
+
+
+class QueryStats:
+    """
+    The SQL statements executed while it was tracking (see `track_queries`):
+    how many, how long the database took, and how many rows they returned or
+    changed. Rows streamed from a server-side cursor are not counted.
+    """
+
+    def __init__(self) -> None:
+        self.statements = 0
+        self.seconds = 0.0
+        self.rows = 0
+        self._executions: Counter[str] = Counter()
+
+    def record(self, statement: str, seconds: float, rows: int) -> None:
+        self.statements += 1
+        self.seconds += seconds
+        self.rows += max(rows, 0)
+        self._executions[statement] += 1
+
+    @property
+    def milliseconds(self) -> float:
+        return round(self.seconds * 1000, 3)
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """
+        The statement shapes executed at least `threshold` times, most
+        frequent first: in a single request, usually an N+1 pattern, i.e. a
+        query per row of a previous query instead of one query for all rows.
+        """
+        if threshold <= 0:
+            return []
+        shapes: Counter[str] = Counter()
+        for statement, count in self._executions.items():
+            shapes[statement_shape(statement)] += count
+        return [
+            (shape, count)
+            for shape, count in shapes.most_common()
+            if count >= threshold
+        ]
+
+    def log_fields(self) -> Dict[str, Any]:
+        return {
+            "db_statements": self.statements,
+            "db_time_ms": self.milliseconds,
+            "db_rows": self.rows,
+        }
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Records the statements executed in the current context, i.e. by this
+    task and the tasks it starts, on every instrumented engine. Trackers
+    nest: each of them sees the statements run inside it.
+    """
+    stats = QueryStats()
+    token = _trackers.set(_trackers.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _trackers.reset(token)
+
+
+@contextmanager
+def query_budget(max_statements: int) -> Iterator[QueryStats]:
+    """
+    Asserts that the block executes at most `max_statements` statements, for
+    tests, e.g. around a request to the app through `httpx.ASGITransport`
+    (which runs the app in the caller's context):
+
+        with query_budget(3):
+            response = await client.get("/api/v1/items")
+
+    The AssertionError lists the statement shapes that were executed.
+    """
+    with track_queries() as stats:
+        yield stats
+    if stats.statements > max_statements:
+        executed = "\n".join(
+            f"  {count} x {shape}" for shape, count in stats.repeated(1)
+        )
+        raise AssertionError(
+            f"Expected at most {max_statements} statements, "
+            f"{stats.statements} were executed:\n{executed}"
+        )
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Reports the engine's statements to the active `track_queries` blocks."""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(connection, cursor, statement, parameters, context, executemany):
+        context._query_started_at = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(connection, cursor, statement, parameters, context, executemany):
+        trackers = _trackers.get()
+        if trackers:
+            elapsed = time.perf_counter() - context._query_started_at
+            for stats in trackers:
+                stats.record(statement, elapsed, cursor.rowcount)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _on_error(exception_context):
+        # A failed statement took database time too.
+        context = exception_context.execution_context
+        started_at = getattr(context, "_query_started_at", None)
+        trackers = _trackers.get()
+        if trackers and started_at is not None and exception_context.statement:
+            elapsed = time.perf_counter() - started_at
+            for stats in trackers:
+                stats.record(exception_context.statement, elapsed, 0)
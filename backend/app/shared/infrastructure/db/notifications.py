@@ -0,0 +1,158 @@
+import asyncio
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import asyncpg
+from sqlalchemy import make_url, text
+from app.config import settings
+from app.shared.infrastructure.db.session import async_engine
+from app.shared.infrastructure.logging.config import get_logger
+
+NotificationCallback = Callable[[str], None]
+
+logger = get_logger("app.db.notifications")
+
+# Notifications are sent once the change they describe has committed, so
+# they need no transaction of their own.
+_autocommit_engine = async_engine.execution_options(isolation_level="AUTOCOMMIT")
+
+
+async def notify(channel: str, payloads: Sequence[str]) -> None:
+    """
+    Sends one Postgres notification per payload on `channel`, in a single
+    statement on a pooled connection. Payloads must be under 8000 bytes.
+    """
+    if not payloads:
+        return
+    async with _autocommit_engine.connect() as connection:
+        await connection.execute(
+            text(
+                "SELECT pg_notify(:channel, payload)"
+                " FROM unnest(CAST(:payloads AS text[])) AS payload"
+            ),
+            {"channel": channel, "payloads": list(payloads)},
+        )
+
+
+class PgListener:
+    """
+    Receives Postgres notifications (LISTEN/NOTIFY) on a single dedicated
+    connection per process, outside the pool, and hands each payload to the
+    callbacks registered for its channel. However many consumers the process
+    serves, it holds one LISTEN connection.
+
+    The connection is checked every `keepalive_seconds` and re-established
+    with exponential backoff when lost. Notifications sent while it was down
+    are gone, so the `on_connect` callbacks run after every (re)connect to let
+    consumers resynchronise.
+
+    Callbacks run on the event loop and must not block.
+    """
+
+    def __init__(
+        self, dsn: str, keepalive_seconds: float, reconnect_max_seconds: float
+    ):
+        self._dsn = dsn
+        self.keepalive_seconds = keepalive_seconds
+        self.reconnect_max_seconds = reconnect_max_seconds
+        self._callbacks: Dict[str, List[NotificationCallback]] = defaultdict(list)
+        self._connect_callbacks: List[Callable[[], None]] = []
+        self._task: Optional[asyncio.Task] = None
+        self._connected = False
+        self._connects = 0
+        self._received = 0
+
+    def listen(self, channel: str, callback: NotificationCallback) -> None:
+        if self._task is not None:
+            raise RuntimeError("Channels must be registered before start().")
+        self._callbacks[channel].append(callback)
+
+    def on_connect(self, callback: Callable[[], None]) -> None:
+        self._connect_callbacks.append(callback)
+
+    def start(self) -> None:
+        if self._task is None and self._callbacks:
+            self._task = asyncio.create_task(self._run(), name="pg-listener")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "connected": self._connected,
+            "connects": self._connects,
+            "received": self._received,
+            "channels": sorted(self._callbacks),
+        }
+
+    async def _run(self) -> None:
+        delay = 0.5
+        while True:
+            connects = self._connects
+            try:
+                await self._listen_until_lost()
+            except (
+                OSError,
+                asyncio.TimeoutError,
+                asyncpg.PostgresError,
+                asyncpg.InterfaceError,
+            ) as e:
+                if self._connects > connects:
+                    # It was connected; start the backoff over.
+                    delay = 0.5
+                logger.warning(
+                    "Notification listener disconnected",
+                    error=str(e),
+                    retry_in=delay,
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.reconnect_max_seconds)
+
+    async def _listen_until_lost(self) -> None:
+        connection = await asyncpg.connect(self._dsn, timeout=self.keepalive_seconds)
+        lost = asyncio.Event()
+        connection.add_termination_listener(lambda _: lost.set())
+        try:
+            for channel in self._callbacks:
+                await connection.add_listener(channel, self._dispatch)
+            self._connected = True
+            self._connects += 1
+            logger.info("Listening for notifications", channels=list(self._callbacks))
+            for callback in self._connect_callbacks:
+                callback()
+
+            while not lost.is_set():
+                try:
+                    await asyncio.wait_for(lost.wait(), self.keepalive_seconds)
+                except asyncio.TimeoutError:
+                    # A dead peer is not always reported; probe the connection.
+                    await connection.fetchval(
+                        "SELECT 1", timeout=self.keepalive_seconds
+                    )
+            raise ConnectionResetError("The notification connection was closed.")
+        finally:
+            self._connected = False
+            connection.terminate()
+
+    def _dispatch(self, connection, pid: int, channel: str, payload: str) -> None:
+        self._received += 1
+        for callback in self._callbacks.get(channel, ()):
+            try:
+                callback(payload)
+            except Exception:
+                logger.exception("Notification callback failed", channel=channel)
+
+
+pg_listener = PgListener(
+    # asyncpg takes a plain libpq-style URL, without SQLAlchemy's driver name.
+    dsn=make_url(settings.DATABASE_URL)
+    .set(drivername="postgresql")
+    .render_as_string(hide_password=False),
+    keepalive_seconds=settings.DB_LISTEN_KEEPALIVE_SECONDS,
+    reconnect_max_seconds=settings.DB_LISTEN_RECONNECT_MAX_SECONDS,
+)
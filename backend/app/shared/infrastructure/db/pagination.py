@@ -0,0 +1,202 @@
+import json
+from typing import Any, Hashable, List, NamedTuple, Optional, Sequence, TypeVar
+from sqlalchemy import Table, func, literal, text, true, tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql.elements import ColumnElement
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import Select, SelectOfScalar
+from app.config import settings
+from app.shared.infrastructure.cache.memory import TTLCache
+from app.shared.schemas import CountStrategy
+
+SelectT = TypeVar("SelectT", Select, SelectOfScalar)
+
+_dialect = postgresql.dialect()
+
+# Totals for the 'cached' count strategy, keyed by the count statement.
+count_cache: TTLCache[Hashable, int] = TTLCache(
+    max_size=settings.PAGINATION_COUNT_CACHE_MAX_SIZE,
+    ttl_seconds=settings.PAGINATION_COUNT_CACHE_TTL_SECONDS,
+)
+
+
+class Page(NamedTuple):
+    items: List[Any]
+    total: Optional[int]
+    has_next: bool
+
+
+def keyset_page(
+    statement: SelectT,
+    keys: Sequence[ColumnElement],
+    after: Optional[Sequence[Any]],
+    limit: int,
+    descending: bool = False,
+) -> SelectT:
+    """
+    Applies keyset pagination to a SELECT.
+
+    Rows are ordered by `keys` and, when `after` holds the key of the last row
+    of the previous page, filtered with `WHERE (keys) > (after)` (or `<` when
+    descending). With an index on `keys` every page costs the same, unlike
+    OFFSET, which must walk past all skipped rows.
+
+    One extra row is fetched so the caller can tell whether a next page exists
+    without a separate count; see `split_page`.
+    """
+    if after is not None:
+        key = keys[0] if len(keys) == 1 else tuple_(*keys)
+        value = after[0] if len(keys) == 1 else tuple_(*after)
+        statement = statement.where(key < value if descending else key > value)
+
+    order_by = [k.desc() if descending else k.asc() for k in keys]
+    return statement.order_by(*order_by).limit(limit + 1)
+
+
+def split_page(rows: Sequence[Any], limit: int) -> tuple[list[Any], bool]:
+    """Splits rows fetched by `keyset_page` into (page, has_next)."""
+    return list(rows[:limit]), len(rows) > limit
+
+
+async def paginate(
+    session: AsyncSession,
+    statement: SelectT,
+    offset: int,
+    limit: int,
+    count_strategy: CountStrategy = CountStrategy.EXACT,
+) -> Page:
+    """
+    Runs an ordered SELECT with OFFSET/LIMIT and computes its total with the
+    given strategy. One extra row is fetched, so `has_next` is exact even when
+    the total is estimated or skipped.
+
+    Exact counts (and cache misses of the 'cached' strategy) are computed in
+    the same statement as the page, as an uncorrelated subquery that Postgres
+    evaluates once, so they cost one round trip even past the last page.
+    Unlike `count(*) OVER ()`, this does not make the page query read every
+    matching row before applying LIMIT.
+    """
+    cache_key = None
+    total = None
+    if count_strategy == CountStrategy.CACHED:
+        cache_key = _count_cache_key(statement)
+        total = count_cache.get(cache_key)
+        if total is None:
+            count_strategy = CountStrategy.EXACT
+
+    page_statement = statement.offset(offset).limit(limit + 1)
+    if count_strategy == CountStrategy.EXACT:
+        rows = (await session.exec(_with_total(page_statement, statement))).all()
+        total = rows[0].total_count
+        # Drop the total column again: single-entity SELECTs yield the entity,
+        # multi-column ones a tuple of their columns. A page past the end
+        # comes back as a single row of NULLs that only carries the total.
+        width = len(statement.column_descriptions)
+        page_rows = [row for row in rows if row[width] is not None]
+        items, has_next = split_page(
+            [row[0] if width == 1 else row[:width] for row in page_rows], limit
+        )
+        if cache_key is not None:
+            count_cache.set(cache_key, total)
+        return Page(items=items, total=total, has_next=has_next)
+
+    rows = (await session.exec(page_statement)).all()
+    items, has_next = split_page(rows, limit)
+    if total is None:
+        total = await count_rows(session, statement, count_strategy)
+    if count_strategy == CountStrategy.ESTIMATED:
+        # Never report fewer rows than this page has already proven to exist.
+        total = max(total, offset + len(items) + int(has_next))
+    return Page(items=items, total=total, has_next=has_next)
+
+
+def _with_total(page_statement: SelectT, statement: SelectT) -> Select:
+    """
+    Selects the page's columns and a `total_count` column holding the row
+    count of `statement`, plus a `page_row` marker that is NULL on the single
+    row returned for an empty page.
+
+    The count is the outer side of `LEFT JOIN ... ON true`, which Postgres
+    can only run as a nested loop, so the page rows keep the order of
+    `page_statement`.
+    """
+    page = page_statement.add_columns(literal(True).label("page_row")).subquery()
+    total = _count_statement(statement).subquery()
+    columns = [
+        (
+            aliased(description["entity"], page)
+            if description["expr"] is description["entity"]
+            else page.c[description["name"]]
+        )
+        for description in statement.column_descriptions
+    ]
+    return select(
+        *columns, page.c.page_row, total.c[0].label("total_count")
+    ).select_from(total.outerjoin(page, true()))
+
+
+def _count_statement(statement: SelectT) -> SelectOfScalar[int]:
+    return select(func.count()).select_from(statement.order_by(None).subquery())
+
+
+def _count_cache_key(statement: SelectT) -> Hashable:
+    compiled = _count_statement(statement).compile(dialect=_dialect)
+    return (str(compiled), tuple(compiled.params.items()))
+
+
+async def count_rows(
+    session: AsyncSession, statement: SelectT, count_strategy: CountStrategy
+) -> Optional[int]:
+    """Counts the rows a SELECT would return, using the given strategy."""
+    if count_strategy == CountStrategy.NONE:
+        return None
+    if count_strategy == CountStrategy.ESTIMATED:
+        return await estimate_rows(session, statement)
+
+    if count_strategy == CountStrategy.CACHED:
+        cache_key = _count_cache_key(statement)
+        total = count_cache.get(cache_key)
+        if total is None:
+            total = (await session.exec(_count_statement(statement))).one()
+            count_cache.set(cache_key, total)
+        return total
+
+    return (await session.exec(_count_statement(statement))).one()
+
+
+async def estimate_rows(session: AsyncSession, statement: SelectT) -> int:
+    """
+    Estimates the rows a SELECT would return without scanning them.
+
+    An unfiltered single-table SELECT uses the table's `pg_class.reltuples`
+    statistic; anything else uses the row estimate from the planner's EXPLAIN.
+    """
+    froms = statement.get_final_froms()
+    if (
+        statement.whereclause is None
+        and len(froms) == 1
+        and isinstance(froms[0], Table)
+    ):
+        table_name = _dialect.identifier_preparer.format_table(froms[0])
+        reltuples = (
+            await session.exec(
+                text(
+                    "SELECT CAST(reltuples AS bigint) FROM pg_class"
+                    " WHERE oid = CAST(:t AS regclass)"
+                ),
+                params={"t": table_name},
+            )
+        ).scalar()
+        # reltuples is -1 until the table has been vacuumed or analyzed.
+        if reltuples is not None and reltuples >= 0:
+            return reltuples
+
+    sql = statement.order_by(None).compile(
+        dialect=_dialect, compile_kwargs={"literal_binds": True}
+    )
+    plan = (await session.exec(text(f"EXPLAIN (FORMAT JSON) {sql}"))).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,129 @@
+import bisect
+import time
+from typing import Any, Dict, Optional
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Upper bounds of the checkout time histogram's buckets, in milliseconds.
+CHECKOUT_TIME_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+PRE_PING_STRATEGIES = ("always", "idle", "never")
+
+
+class PoolMetrics:
+    """
+    Checkout metrics of one connection pool: how long checkouts took, how
+    many timed out, and the most connections that were checked out at once.
+    """
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.max_checked_out = 0
+        self._total_seconds = 0.0
+        self._max_seconds = 0.0
+        # One count per bucket, plus one for checkouts above the last bound.
+        self._buckets = [0] * (len(CHECKOUT_TIME_BUCKETS_MS) + 1)
+
+    def observe(self, seconds: float, checked_out: int) -> None:
+        self.checkouts += 1
+        self._total_seconds += seconds
+        self._max_seconds = max(self._max_seconds, seconds)
+        self._buckets[bisect.bisect_left(CHECKOUT_TIME_BUCKETS_MS, seconds * 1000)] += 1
+        self.max_checked_out = max(self.max_checked_out, checked_out)
+
+    def stats(self) -> Dict[str, Any]:
+        # Cumulative, like a Prometheus histogram: each bucket counts the
+        # checkouts that took at most its bound.
+        histogram: Dict[str, int] = {}
+        count = 0
+        for bound, bucket in zip(CHECKOUT_TIME_BUCKETS_MS, self._buckets):
+            count += bucket
+            histogram[f"le_{bound}ms"] = count
+        histogram["le_inf"] = self.checkouts
+        return {
+            "checkouts": self.checkouts,
+            "checkout_timeouts": self.timeouts,
+            "max_checked_out": self.max_checked_out,
+            "checkout_ms_avg": (
+                round(self._total_seconds / self.checkouts * 1000, 3)
+                if self.checkouts
+                else None
+            ),
+            "checkout_ms_max": round(self._max_seconds * 1000, 3),
+            "checkout_ms_histogram": histogram,
+        }
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    The asyncio queue pool, recording PoolMetrics for every checkout.
+
+    A checkout's time covers waiting for a free connection, opening a new
+    one (up to the overflow), and the liveness check, if any: everything a
+    request waits for before it can send its first statement.
+    """
+
+    metrics: PoolMetrics
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self) -> "InstrumentedPool":
+        # Disposing the engine replaces its pool; keep the counters going.
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        self.metrics.observe(time.perf_counter() - start, self.checkedout())
+        return connection
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": self.size(),
+            "max_overflow": self._max_overflow,
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            # Negative while the pool has not yet opened `size` connections.
+            "overflow": max(self.overflow(), 0),
+            **self.metrics.stats(),
+        }
+
+
+def ping_idle_connections(engine: AsyncEngine, idle_seconds: float) -> None:
+    """
+    Checks a connection's liveness on checkout only when it sat in the pool
+    for longer than `idle_seconds`, instead of on every checkout like
+    `pool_pre_ping`. Under load connections are reused within milliseconds
+    and skip the extra round trip; the ones that idled long enough for a
+    server, proxy or firewall to drop them are still checked. A dead one is
+    replaced transparently.
+    """
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record) -> None:
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(sync_engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        checked_in_at: Optional[float] = connection_record.info.pop(
+            "checked_in_at", None
+        )
+        # A connection that was just opened has never been checked in.
+        if checked_in_at is None or time.monotonic() - checked_in_at < idle_seconds:
+            return
+        try:
+            sync_engine.dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            # The pool discards the connection and checks out another one.
+            raise exc.DisconnectionError() from e
@@ -0,0 +1,268 @@
+import asyncio
+import itertools
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import make_url, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.config import settings
+from app.shared.infrastructure.cache.interface import ICache
+from app.shared.infrastructure.cache.memory import MemoryCache
+from app.shared.infrastructure.cache.redis_cache import RedisCache
+from app.shared.infrastructure.db.session import async_engine, create_pooled_engine
+from app.shared.infrastructure.logging.config import get_logger
+
+logger = get_logger("app.db.replicas")
+
+# How far a server's replay is behind its primary, in seconds: 0 when it has
+# replayed everything it received, NULL on a primary.
+_REPLICATION_LAG = text(
+    "SELECT CASE"
+    " WHEN NOT pg_is_in_recovery() THEN NULL"
+    " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())"
+    " END"
+)
+
+
+def is_disconnect(error: BaseException) -> bool:
+    """Whether `error` means the database could not be reached or was lost."""
+    if isinstance(error, DBAPIError):
+        return error.connection_invalidated
+    return isinstance(error, (OSError, asyncio.TimeoutError))
+
+
+class ReadTarget:
+    """
+    A database that read-only units of work can run on. Its sessions open
+    READ ONLY transactions, so a query handler that tries to write fails
+    instead of writing to the primary (or failing only on a replica).
+    """
+
+    def __init__(self, name: str, engine: AsyncEngine, healthy: Optional[bool] = None):
+        self.name = name
+        self.engine = engine
+        self.session_factory = async_sessionmaker(
+            bind=engine.execution_options(postgresql_readonly=True),
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+        # None until a connection or probe showed whether it is up.
+        self.healthy = healthy
+        self.lag_seconds: Optional[float] = None
+        self._retry_at = 0.0
+        self.reads = 0
+        self.failures = 0
+
+    def mark_unhealthy(self, retry_in: float) -> None:
+        self.healthy = False
+        self._retry_at = time.monotonic() + retry_in
+        self.failures += 1
+
+    @property
+    def retry_due(self) -> bool:
+        return time.monotonic() >= self._retry_at
+
+
+class ReplicaRouter:
+    """
+    Routes read-only units of work to the read replicas, round-robin, and
+    to the primary when there are none, none is healthy, or the reader
+    itself wrote recently.
+
+    Replicas apply the primary's changes with a delay, so a user who just
+    wrote would not always see their own change on one. After a
+    committed write the writer's principal is therefore marked in
+    `write_marks` (an ICache whose TTL is the sticky window), and their
+    reads go to the primary until the mark expires. With the per-process
+    memory backend this only holds within a worker; use Redis to share the
+    marks between workers.
+
+    A replica is taken out of rotation when a read on it loses the
+    connection, or when the background probe (see `start`) fails or finds it
+    lagging more than `max_lag_seconds`, and is tried again after
+    `check_interval_seconds`.
+    """
+
+    def __init__(
+        self,
+        primary: ReadTarget,
+        replicas: Sequence[ReadTarget],
+        write_marks: ICache,
+        max_lag_seconds: float,
+        check_interval_seconds: float,
+    ):
+        self.primary = primary
+        self.replicas = list(replicas)
+        self._write_marks = write_marks
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self._rotation = itertools.cycle(self.replicas)
+        self._task: Optional[asyncio.Task] = None
+        self._sticky_reads = 0
+        self._fallback_reads = 0
+
+    async def session(
+        self, principal: Optional[str]
+    ) -> Tuple[ReadTarget, AsyncSession]:
+        """
+        A read-only session for a read by `principal` (None when anonymous),
+        and the target it reads from.
+        """
+        target = await self._choose(principal)
+        session = target.session_factory()
+        if target.healthy is not True:
+            # A replica not known to be up is connected to right away, so
+            # that the read can still go to the primary if it is down.
+            try:
+                await session.connection()
+            except Exception as e:
+                await session.close()
+                if not self.report_failure(target, e):
+                    raise
+                self._fallback_reads += 1
+                target, session = self.primary, self.primary.session_factory()
+            else:
+                target.healthy = True
+        target.reads += 1
+        return target, session
+
+    async def _choose(self, principal: Optional[str]) -> ReadTarget:
+        if not self.replicas:
+            return self.primary
+        if principal is not None and await self._write_marks.get(principal):
+            self._sticky_reads += 1
+            return self.primary
+        for _ in range(len(self.replicas)):
+            replica = next(self._rotation)
+            # While the probe runs, it decides when an unhealthy replica is
+            # back; otherwise one is tried again after the retry delay.
+            if replica.healthy is not False or (
+                self._task is None and replica.retry_due
+            ):
+                return replica
+        self._fallback_reads += 1
+        return self.primary
+
+    async def record_write(self, principal: Optional[str]) -> None:
+        """Keeps `principal`'s reads on the primary for the sticky window."""
+        if self.replicas and principal is not None:
+            await self._write_marks.set(principal, "1")
+
+    def report_failure(self, target: ReadTarget, error: BaseException) -> bool:
+        """
+        Takes a replica out of rotation after a read on it failed. Returns
+        whether it did, i.e. whether the error was the replica's.
+        """
+        if target is self.primary or not is_disconnect(error):
+            return False
+        if target.healthy is not False:
+            logger.warning(
+                "Read replica unreachable", replica=target.name, error=str(error)
+            )
+        target.mark_unhealthy(self.check_interval_seconds)
+        return True
+
+    def start(self) -> None:
+        if self._task is None and self.replicas:
+            self._task = asyncio.create_task(self._run(), name="replica-probe")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "replicas": [
+                {
+                    "name": replica.name,
+                    "healthy": replica.healthy,
+                    "lag_seconds": replica.lag_seconds,
+                    "reads": replica.reads,
+                    "failures": replica.failures,
+                    "pool": replica.engine.pool.stats(),
+                }
+                for replica in self.replicas
+            ],
+            "primary_reads": self.primary.reads,
+            "sticky_reads": self._sticky_reads,
+            "fallback_reads": self._fallback_reads,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.gather(*(self._probe(replica) for replica in self.replicas))
+            await asyncio.sleep(self.check_interval_seconds)
+
+    async def _probe(self, replica: ReadTarget) -> None:
+        try:
+            async with replica.engine.connect() as connection:
+                lag = await asyncio.wait_for(
+                    connection.scalar(_REPLICATION_LAG), self.check_interval_seconds
+                )
+        except Exception as e:
+            if replica.healthy is not False:
+                logger.warning(
+                    "Read replica unreachable", replica=replica.name, error=str(e)
+                )
+            replica.mark_unhealthy(self.check_interval_seconds)
+            return
+
+        replica.lag_seconds = None if lag is None else float(lag)
+        if (
+            replica.lag_seconds is not None
+            and replica.lag_seconds > self.max_lag_seconds
+        ):
+            if replica.healthy is not False:
+                logger.warning(
+                    "Read replica lagging",
+                    replica=replica.name,
+                    lag=replica.lag_seconds,
+                )
+            replica.mark_unhealthy(self.check_interval_seconds)
+        else:
+            if replica.healthy is False:
+                logger.info("Read replica back in rotation", replica=replica.name)
+            replica.healthy = True
+
+
+def _replica_targets(urls: Sequence[str]) -> List[ReadTarget]:
+    return [
+        ReadTarget(
+            # Named by host and database, never with the password.
+            name=make_url(url).render_as_string(hide_password=True),
+            engine=create_pooled_engine(url),
+        )
+        for url in urls
+    ]
+
+
+def _create_write_marks(name: str) -> ICache:
+    ttl = settings.DB_READ_YOUR_WRITES_SECONDS
+    if name == "memory":
+        return MemoryCache(max_size=100_000, ttl_seconds=ttl)
+    if name == "redis":
+        return RedisCache(
+            url=settings.DB_READ_YOUR_WRITES_REDIS_URL,
+            namespace="ryw",
+            ttl_seconds=ttl,
+            timeout_seconds=settings.DB_READ_YOUR_WRITES_REDIS_TIMEOUT_SECONDS,
+        )
+    raise ValueError(f"Unknown DB_READ_YOUR_WRITES_BACKEND: {name!r}")
+
+
+replica_router = ReplicaRouter(
+    primary=ReadTarget("primary", async_engine, healthy=True),
+    replicas=_replica_targets(settings.DATABASE_REPLICA_URLS),
+    write_marks=_create_write_marks(settings.DB_READ_YOUR_WRITES_BACKEND),
+    max_lag_seconds=settings.DB_REPLICA_MAX_LAG_SECONDS,
+    check_interval_seconds=settings.DB_REPLICA_CHECK_INTERVAL_SECONDS,
+)
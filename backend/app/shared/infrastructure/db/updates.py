@@ -0,0 +1,42 @@
+from typing import Any, Dict, Optional, Type, TypeVar
+from sqlalchemy.sql.elements import ColumnElement
+from sqlmodel import select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.shared.domain.aggregate_root import AggregateRoot
+
+AggregateT = TypeVar("AggregateT", bound=AggregateRoot)
+
+
+async def update_returning(
+    session: AsyncSession,
+    model: Type[AggregateT],
+    *criteria: ColumnElement[bool],
+    values: Dict[str, Any],
+    expected_version: Optional[int] = None,
+) -> Optional[AggregateT]:
+    """
+    Updates the aggregate row matching `criteria` in a single
+    `UPDATE ... WHERE ... RETURNING` and returns the updated aggregate,
+    without loading it first. The row's version is bumped by its `onupdate`.
+
+    With `expected_version`, the row must also still be at that version
+    (optimistic concurrency). Returns None when no row matched, i.e. it does
+    not exist, fails the criteria, or was changed concurrently; callers that
+    need to tell these apart look the row up again on that path only.
+
+    An empty `values` changes nothing and just reads the row. Does not commit.
+    """
+    if expected_version is not None:
+        criteria += (model.version == expected_version,)
+
+    if not values:
+        return (await session.exec(select(model).where(*criteria))).first()
+
+    statement = (
+        update(model)
+        .where(*criteria)
+        .values(values)
+        .returning(model)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    )
+    return (await session.exec(statement)).scalars().first()
@@ -5,7 +5,12 @@ celery_app = Celery(
     "tasks",
     broker=settings.CELERY_BROKER_URL,
     backend=settings.CELERY_RESULT_BACKEND,
-    include=["app.features.item.tasks"],
+    include=[
+        "app.features.item.tasks",
+        "app.shared.infrastructure.messaging.outbox",
+        # Subscribe handlers to the outbox events that workers publish.
+        "app.features.item.infra.item_feed",
+    ],
 )
 
 # Optional configuration
@@ -0,0 +1,235 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Type
+from sqlalchemy import BigInteger, Column, DateTime, Identity, func, insert, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlmodel import Field, SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.config import settings
+from app.shared.application.event_bus import EventBus, outbox_bus
+from app.shared.domain.event import DomainEvent
+from app.shared.infrastructure.db.session import AsyncSessionFactory, async_engine
+from app.shared.infrastructure.logging.config import get_logger
+from app.shared.infrastructure.messaging.celery_app import celery_app
+
+logger = get_logger("app.outbox")
+
+SINKS = ("local", "celery")
+
+
+class OutboxEvent(SQLModel, table=True):
+    """
+    A domain event waiting to be relayed, written in the transaction that
+    raised it. Rows are deleted once relayed, so the table stays small.
+    """
+
+    __tablename__ = "outbox_event"
+
+    # Relayed in insertion order.
+    id: Optional[int] = Field(
+        default=None,
+        sa_column=Column(BigInteger, Identity(always=True), primary_key=True),
+    )
+    event_type: str = Field(nullable=False)
+    payload: Dict[str, Any] = Field(sa_column=Column(JSONB, nullable=False))
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
+        nullable=False,
+    )
+
+
+def _event_types() -> Dict[str, Type[DomainEvent]]:
+    types: Dict[str, Type[DomainEvent]] = {}
+    pending: List[Type[DomainEvent]] = [DomainEvent]
+    while pending:
+        cls = pending.pop()
+        types[cls.__name__] = cls
+        pending.extend(cls.__subclasses__())
+    return types
+
+
+def decode_events(rows: Sequence[Dict[str, Any]]) -> List[DomainEvent]:
+    """Turns outbox rows (`event_type` and `payload`) back into events."""
+    types = _event_types()
+    return [types[row["event_type"]].model_validate(row["payload"]) for row in rows]
+
+
+async def add_to_outbox(session: AsyncSession, events: Sequence[DomainEvent]) -> None:
+    """Writes `events` to the outbox in the session's transaction."""
+    if events:
+        await session.execute(
+            insert(OutboxEvent),
+            [
+                {
+                    "event_type": type(event).__name__,
+                    "payload": event.model_dump(mode="json"),
+                }
+                for event in events
+            ],
+        )
+
+
+# Claims the oldest batch. Concurrent relays (one per worker process) skip
+# each other's rows, and the rows come back if the transaction rolls back.
+# `= ANY(ARRAY(...))` evaluates the subquery once; with `IN (...)` the planner
+# may pick a semi-join over the whole table when its statistics are stale.
+_CLAIM_BATCH = text(
+    "DELETE FROM outbox_event WHERE id = ANY(ARRAY("
+    " SELECT id FROM outbox_event ORDER BY id LIMIT :batch_size"
+    " FOR UPDATE SKIP LOCKED"
+    ")) RETURNING id, event_type, payload, created_at"
+)
+
+
+@celery_app.task(name="outbox.dispatch_events")
+def dispatch_events(rows: List[Dict[str, Any]]) -> None:
+    """
+    Publishes relayed outbox events on the worker's `outbox_bus`. The
+    modules that subscribe the handlers are imported by the Celery app.
+    """
+    asyncio.run(_publish_in_worker(decode_events(rows)))
+
+
+async def _publish_in_worker(events: List[DomainEvent]) -> None:
+    try:
+        await outbox_bus.publish(events)
+    finally:
+        # Each task runs its own event loop; pooled connections must not
+        # outlive it.
+        await async_engine.dispose()
+
+
+class OutboxRelay:
+    """
+    Moves domain events from the outbox to their handlers, in batches:
+    either to the handlers subscribed on `bus` in this process ('local'),
+    or to a Celery worker that publishes them on its own bus ('celery').
+
+    A batch is deleted from the outbox in the transaction that hands it
+    over, so an event is only gone once it was published, or accepted by
+    the broker. A crash or a broker error leaves it in the outbox to be
+    relayed again, so delivery is at least once: handlers must tolerate
+    duplicates. Handler errors in 'local' mode are logged like on any
+    EventBus and do not hold the outbox up.
+
+    The relay drains until the outbox is empty, then waits up to
+    `poll_interval_seconds`, or until `wake` is called after a commit that
+    added events.
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        bus: EventBus,
+        sink: str,
+        batch_size: int,
+        poll_interval_seconds: float,
+    ):
+        if sink not in SINKS:
+            raise ValueError(f"Unknown OUTBOX_RELAY_SINK: {sink!r}")
+        self._session_factory = session_factory
+        self._bus = bus
+        self.sink = sink
+        self.batch_size = batch_size
+        self.poll_interval_seconds = poll_interval_seconds
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._relayed = 0
+        self._batches = 0
+        self._failures = 0
+        self._busy_seconds = 0.0
+        self._last_delay_ms: Optional[float] = None
+
+    def wake(self) -> None:
+        self._wakeup.set()
+
+    async def relay_batch(self) -> int:
+        """Relays the oldest batch of events; returns how many there were."""
+        started = time.perf_counter()
+        async with self._session_factory() as session:
+            async with session.begin():
+                result = await session.execute(
+                    _CLAIM_BATCH, {"batch_size": self.batch_size}
+                )
+                rows = [dict(row) for row in result.mappings()]
+                if not rows:
+                    return 0
+                rows.sort(key=lambda row: row["id"])
+                await self._dispatch(rows)
+
+        self._relayed += len(rows)
+        self._batches += 1
+        self._busy_seconds += time.perf_counter() - started
+        delay = datetime.now(timezone.utc) - rows[-1]["created_at"]
+        self._last_delay_ms = round(delay.total_seconds() * 1000, 3)
+        return len(rows)
+
+    async def drain(self) -> int:
+        """Relays batches until the outbox is empty."""
+        total = 0
+        while count := await self.relay_batch():
+            total += count
+        return total
+
+    async def _dispatch(self, rows: List[Dict[str, Any]]) -> None:
+        if self.sink == "local":
+            await self._bus.publish(decode_events(rows))
+        else:
+            payload = [
+                {"event_type": row["event_type"], "payload": row["payload"]}
+                for row in rows
+            ]
+            # Publishing to the broker is blocking I/O.
+            await asyncio.to_thread(dispatch_events.apply_async, args=[payload])
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="outbox-relay")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "sink": self.sink,
+            "relayed": self._relayed,
+            "batches": self._batches,
+            "failures": self._failures,
+            "events_per_second": (
+                round(self._relayed / self._busy_seconds)
+                if self._busy_seconds
+                else None
+            ),
+            "last_delay_ms": self._last_delay_ms,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                await self.drain()
+            except Exception:
+                self._failures += 1
+                logger.exception("Outbox relay failed; retrying")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+
+outbox_relay = OutboxRelay(
+    session_factory=AsyncSessionFactory,
+    bus=outbox_bus,
+    sink=settings.OUTBOX_RELAY_SINK,
+    batch_size=settings.OUTBOX_RELAY_BATCH_SIZE,
+    poll_interval_seconds=settings.OUTBOX_RELAY_POLL_SECONDS,
+)
@@ -1,6 +1,8 @@
 import os
 import aiofiles
+import aiofiles.os
 from fastapi import UploadFile
+from app.config import settings
 from .interface import IFileStorage
 
 
@@ -12,25 +14,45 @@ class LocalFileStorage(IFileStorage):
 
     async def save(self, file: UploadFile, path: str, filename: str) -> str:
         full_dir = os.path.join(self.base_path, path)
-        os.makedirs(full_dir, exist_ok=True)
         full_path = os.path.join(full_dir, filename)
 
         try:
-            async with aiofiles.open(full_path, "wb") as f:
+            f = await self._open_for_writing(full_dir, full_path)
+            try:
                 while content := await file.read(1024 * 1024):  # Read in 1MB chunks
                     await f.write(content)
+            finally:
+                await f.close()
         finally:
             await file.close()
 
         relative_path = os.path.join(path, filename)
         return str(relative_path).replace("\\", "/")  # Ensure forward slashes for URLs
 
+    async def _open_for_writing(self, directory: str, full_path: str):
+        # The directory usually exists already (e.g. a replaced avatar); only
+        # create it when opening the file says it does not.
+        try:
+            return await aiofiles.open(full_path, "wb")
+        except FileNotFoundError:
+            await aiofiles.os.makedirs(directory, exist_ok=True)
+            return await aiofiles.open(full_path, "wb")
+
     async def delete(self, file_path: str) -> None:
         if not file_path:
             return
         full_path = os.path.join(self.base_path, file_path)
-        if os.path.exists(full_path):
-            os.remove(full_path)
+        try:
+            await aiofiles.os.remove(full_path)
+        except FileNotFoundError:
+            pass
 
     def get_public_url(self, file_path: str) -> str:
         return f"{self.base_url}/{file_path}"
+
+
+# Created once per process: the base directory exists before the static
+# files are mounted, and requests do not check it again.
+file_storage = LocalFileStorage(
+    base_path=settings.STATIC_FILES_PATH, base_url=settings.STATIC_URL
+)
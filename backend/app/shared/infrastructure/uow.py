@@ -1,6 +1,10 @@
 import abc
-from typing import Self, Type, Dict, TypeVar
+from typing import Awaitable, Callable, List, Optional, Self, Type, Dict, TypeVar
 from sqlmodel.ext.asyncio.session import AsyncSession
+from app.shared.application.event_bus import event_bus, outbox_bus
+from app.shared.domain.event import DomainEvent
+from app.shared.infrastructure.db.replicas import ReadTarget, ReplicaRouter
+from app.shared.infrastructure.messaging.outbox import add_to_outbox, outbox_relay
 
 # Generic TypeVar for repositories
 T = TypeVar("T")
@@ -24,16 +28,39 @@ class IUnitOfWork(abc.ABC):
     def get_repository(self, repo_type: Type[T]) -> T:
         raise NotImplementedError
 
+    @property
+    def reads_primary(self) -> bool:
+        """
+        Whether the unit of work read from the primary, and so saw every
+        committed write. Only such reads may populate shared caches.
+        """
+        return True
+
 
 class UnitOfWork(IUnitOfWork):
     """
     A Unit of Work that manages the database transaction and acts as a factory
     for repository instances. It ensures all repositories within a single
-    unit of work share the same database session.
+    unit of work share the same database session. The session is closed,
+    i.e. its connection returned, when the unit of work ends, so
+    `session_factory` may also return one session for several of them (see
+    `get_uow`).
+
+    Repositories record the aggregates they changed in their `seen` set. The
+    domain events those aggregates raised are dropped on rollback. Otherwise
+    the ones with handlers on the outbox bus are written to the outbox in the
+    same transaction, for the outbox relay, and after the commit all of them
+    are published on the event bus. `after_commit`, if given, is awaited
+    after every successful commit as well.
     """
 
-    def __init__(self, session_factory):
+    def __init__(
+        self,
+        session_factory,
+        after_commit: Optional[Callable[[], Awaitable[None]]] = None,
+    ):
         self._session_factory = session_factory
+        self._after_commit = after_commit
         self._session: AsyncSession | None = None
         self._repositories: Dict[Type, object] = {}
 
@@ -44,11 +71,37 @@ class UnitOfWork(IUnitOfWork):
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         if self.session:
-            if exc_type:
-                await self.session.rollback()
-            else:
+            events = self._collect_events()
+            try:
+                if exc_type:
+                    await self.session.rollback()
+                    return
+                # Stored with the changes that raised them, so they are
+                # relayed if and only if the changes commit.
+                await add_to_outbox(
+                    self.session, [e for e in events if outbox_bus.handles(e)]
+                )
                 await self.session.commit()
-            await self.session.close()
+            finally:
+                await self.session.close()
+            if self._after_commit is not None:
+                await self._after_commit()
+            if events:
+                outbox_relay.wake()
+                await event_bus.publish(events)
+
+    def _collect_events(self) -> List[DomainEvent]:
+        """Takes the pending events of every aggregate the repositories saw."""
+        events: List[DomainEvent] = []
+        for repository in self._repositories.values():
+            seen = getattr(repository, "seen", None)
+            if not seen:
+                continue
+            for aggregate in seen:
+                events.extend(aggregate.domain_events)
+                aggregate.clear_domain_events()
+            seen.clear()
+        return events
 
     def get_repository(self, repo_type: Type[T]) -> T:
         """
@@ -68,3 +121,47 @@ class UnitOfWork(IUnitOfWork):
 
         # We know the type is correct, so we can safely cast it.
         return self._repositories[repo_type]
+
+
+class ReadOnlyUnitOfWork(UnitOfWork):
+    """
+    A Unit of Work for query handlers. Its transaction is READ ONLY and is
+    never committed, only closed, and it runs on the database the replica
+    router picks: a read replica, or the primary when there is none, the
+    reader wrote recently, or no replica is healthy.
+
+    `principal` returns who is reading (None when anonymous); it is called
+    on entry, once the request's dependencies have been resolved. `release`,
+    if given, is awaited on entry too, before the read checks a connection
+    out, e.g. to give back the one the request's own session holds.
+    """
+
+    def __init__(
+        self,
+        router: ReplicaRouter,
+        principal: Callable[[], Optional[str]] = lambda: None,
+        release: Optional[Callable[[], Awaitable[None]]] = None,
+    ):
+        super().__init__(session_factory=None)
+        self._router = router
+        self._principal = principal
+        self._release = release
+        self.target: ReadTarget | None = None
+
+    @property
+    def reads_primary(self) -> bool:
+        # A replica may still return a row the primary already changed.
+        return self.target is self._router.primary
+
+    async def __aenter__(self) -> Self:
+        if self._release is not None:
+            await self._release()
+        self.target, self.session = await self._router.session(self._principal())
+        self._repositories = {}
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self.session:
+            if exc_val is not None:
+                self._router.report_failure(self.target, exc_val)
+            await self.session.close()
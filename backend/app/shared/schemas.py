@@ -1,10 +1,38 @@
-from typing import Generic, TypeVar, List
-from pydantic import BaseModel, Field
+import uuid
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+from pydantic import BaseModel, Field, create_model
+import base64
+import binascii
+import json
 import math
+from app.shared.application.exceptions import InvalidCommandError
 
 DataT = TypeVar("DataT")
 
 
+class CountStrategy(str, Enum):
+    """How the `total` of a paginated response is computed."""
+
+    EXACT = "exact"  # A `count(*)` on every request
+    CACHED = "cached"  # An exact count, reused for a few seconds
+    ESTIMATED = "estimated"  # The query planner's row estimate
+    NONE = "none"  # No total at all; rely on `has_next`
+
+
 class PageParams(BaseModel):
     """
     Pydantic model for pagination query parameters (page and size).
@@ -13,31 +41,171 @@ class PageParams(BaseModel):
 
     page: int = Field(1, ge=1, description="Page number, starting from 1")
     size: int = Field(10, gt=0, le=100, description="Number of items per page")
+    count: CountStrategy = Field(
+        CountStrategy.EXACT, description="How the total number of items is computed"
+    )
+    include_total: bool = Field(
+        True, description="Set to false to skip the total and use `has_next` instead"
+    )
 
     @property
     def offset(self) -> int:
         return (self.page - 1) * self.size
 
+    @property
+    def count_strategy(self) -> CountStrategy:
+        return self.count if self.include_total else CountStrategy.NONE
+
 
 class Paginated(BaseModel, Generic[DataT]):
     """
     A generic paginated response model.
+    `total` and `pages` are None when the total was not requested.
     """
 
     items: List[DataT]
-    total: int
+    total: Optional[int] = None
     page: int
     size: int
-    pages: int
+    pages: Optional[int] = None
+    has_next: bool = False
 
     @classmethod
     def create(
-        cls, items: List[DataT], total: int, params: PageParams
+        cls,
+        items: List[DataT],
+        total: Optional[int],
+        params: PageParams,
+        has_next: Optional[bool] = None,
     ) -> "Paginated[DataT]":
+        if has_next is None:
+            has_next = total is not None and params.offset + len(items) < total
         return cls(
             items=items,
             total=total,
             page=params.page,
             size=params.size,
-            pages=math.ceil(total / params.size) if params.size > 0 else 0,
+            pages=(
+                math.ceil(total / params.size)
+                if total is not None and params.size > 0
+                else None
+            ),
+            has_next=has_next,
+        )
+
+
+class ResourceVersion(NamedTuple):
+    """The version of a single aggregate, for conditional requests."""
+
+    version: int
+    updated_at: datetime
+
+
+class PageVersions(NamedTuple):
+    """
+    What a page of aggregates looks like, without the aggregates themselves:
+    the (id, version) of each item, the total and `has_next`. Two pages with
+    equal PageVersions have equal bodies, so conditional requests can be
+    answered from these alone.
+    """
+
+    versions: List[Tuple[uuid.UUID, int]]
+    total: Optional[int]
+    has_next: bool
+
+
+class CursorParams(BaseModel):
+    """
+    Pydantic model for keyset (cursor) pagination query parameters.
+    The cursor is opaque to clients: pass the `next_cursor` of one page to
+    get the next one, or omit it to get the first page.
+    """
+
+    cursor: Optional[str] = Field(
+        None, description="Cursor returned as `next_cursor` by the previous page"
+    )
+    size: int = Field(10, gt=0, le=100, description="Number of items per page")
+
+
+class CursorPaginated(BaseModel, Generic[DataT]):
+    """
+    A generic keyset-paginated response model.
+    `next_cursor` is None on the last page.
+    """
+
+    items: List[DataT]
+    size: int
+    next_cursor: Optional[str] = None
+
+    @classmethod
+    def create(
+        cls, items: List[DataT], next_cursor: Optional[str], params: CursorParams
+    ) -> "CursorPaginated[DataT]":
+        return cls(items=items, size=params.size, next_cursor=next_cursor)
+
+
+def encode_cursor(*key: Any) -> str:
+    """Encodes the sort key of the last row on a page as an opaque cursor."""
+    payload = json.dumps([str(value) for value in key], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: Callable[[str], Any]) -> tuple:
+    """
+    Decodes a cursor made by `encode_cursor`, converting each key part with
+    the matching callable in `types` (e.g. `uuid.UUID`).
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("Unexpected cursor shape.")
+        return tuple(type_(value) for type_, value in zip(types, values))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise InvalidCommandError("Invalid pagination cursor.")
+
+
+def parse_fields(
+    value: str, model: Type[BaseModel], required: Sequence[str] = ()
+) -> Tuple[str, ...]:
+    """
+    Parses a sparse fieldset, e.g. `id,name`, into the names of the fields
+    of `model` it selects, in the model's field order. The `required` fields
+    are always included.
+    """
+    requested = {name.strip() for name in value.split(",") if name.strip()}
+    unknown = requested - model.model_fields.keys()
+    if unknown:
+        raise InvalidCommandError(
+            f"Unknown fields: {', '.join(sorted(unknown))}. "
+            f"Available fields: {', '.join(model.model_fields)}."
         )
+    requested.update(required)
+    return tuple(name for name in model.model_fields if name in requested)
+
+
+@lru_cache(maxsize=256)
+def partial_model(model: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """
+    A model with only the given `fields` of `model`, with the same types and
+    defaults, to validate and serialize sparse representations with.
+    """
+    return create_model(
+        f"{model.__name__}Partial",
+        **{
+            name: (model.model_fields[name].annotation, model.model_fields[name])
+            for name in fields
+        },
+    )
+
+
+def dto_from(
+    model: Type[BaseModel], source: Any, fields: Optional[Tuple[str, ...]] = None
+) -> BaseModel:
+    """
+    Validates an ORM object into `model` or, for a sparse fieldset, a row of
+    the `fields` columns (in that order) into the partial model of `fields`.
+    """
+    if fields is None:
+        return model.model_validate(source)
+    return partial_model(model, fields).model_validate(dict(zip(fields, source)))
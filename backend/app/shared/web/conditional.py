@@ -0,0 +1,150 @@
+import hashlib
+import uuid
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable, Optional, Sequence, Tuple
+from fastapi import HTTPException, Request, Response, status
+
+# Authenticated responses may be stored by the client only, and must be
+# revalidated (cheaply, with the validators below) before each reuse.
+CACHE_CONTROL = "private, no-cache"
+
+# OpenAPI documentation for routes that support conditional requests.
+NOT_MODIFIED_RESPONSES = {
+    status.HTTP_304_NOT_MODIFIED: {
+        "description": "The representation matching `If-None-Match` or "
+        "`If-Modified-Since` is still current."
+    }
+}
+PRECONDITION_FAILED_RESPONSES = {
+    status.HTTP_412_PRECONDITION_FAILED: {
+        "description": "The resource no longer matches `If-Match`; it was "
+        "changed by someone else. Fetch it again and retry."
+    }
+}
+
+
+def resource_etag(
+    resource_id: uuid.UUID, version: int, fields: Optional[Sequence[str]] = None
+) -> str:
+    """
+    Strong ETag of a single aggregate: its id and row version. A sparse
+    representation (only `fields`) is a different one, and gets a suffix.
+    """
+    if fields is None:
+        return f'"{resource_id.hex}-{version}"'
+    return f'"{resource_id.hex}-{version}.{_fields_digest(fields)}"'
+
+
+def page_etag(
+    versions: Iterable[Tuple[uuid.UUID, int]],
+    total: Optional[int],
+    has_next: bool,
+    fields: Optional[Sequence[str]] = None,
+) -> str:
+    """
+    Strong ETag of a page of aggregates, hashed from the (id, version) of its
+    items and the page metadata that depends on the data. Adding, removing
+    or updating any listed item changes it, as does selecting other `fields`.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{total}:{int(has_next)}:{_fields_digest(fields)}".encode())
+    for resource_id, version in versions:
+        digest.update(resource_id.bytes)
+        digest.update(version.to_bytes(8, "big"))
+    return f'"{digest.hexdigest()}"'
+
+
+def _fields_digest(fields: Optional[Sequence[str]]) -> str:
+    if fields is None:
+        return ""
+    return hashlib.blake2b(",".join(fields).encode(), digest_size=4).hexdigest()
+
+
+def has_preconditions(request: Request) -> bool:
+    """Whether the request is a conditional GET worth checking for a 304."""
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: Optional[datetime] = None
+) -> bool:
+    """
+    Evaluates `If-None-Match` and `If-Modified-Since` as RFC 9110 (13.2.2)
+    prescribes for a GET: `If-Modified-Since` is only considered when there is
+    no `If-None-Match`, and entity tags are compared weakly.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        opaque_tag = etag.removeprefix("W/")
+        return any(
+            tag.strip().removeprefix("W/") == opaque_tag
+            for tag in if_none_match.split(",")
+        )
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        # An invalid date is ignored, as if the header were absent.
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP dates have a resolution of one second.
+    return last_modified.replace(microsecond=0) <= since
+
+
+def if_match_version(request: Request, resource_id: uuid.UUID) -> Optional[int]:
+    """
+    The version of a resource that an `If-Match` header requires for an
+    update, or None when there is no header (or it is `*`).
+
+    If-Match compares entity tags strongly, so when no listed tag is a strong
+    ETag of this resource the precondition cannot hold and 412 is raised
+    right away. The ETag of a sparse representation names the same version.
+    When several versions are listed, only the highest can still be current,
+    as versions only grow.
+    """
+    if_match = request.headers.get("if-match")
+    if if_match is None or if_match.strip() == "*":
+        return None
+
+    prefix = f'"{resource_id.hex}-'
+    versions = []
+    for tag in if_match.split(","):
+        tag = tag.strip()
+        if tag.startswith(prefix) and tag.endswith('"'):
+            try:
+                version, _, _ = tag[len(prefix) : -1].partition(".")
+                versions.append(int(version))
+            except ValueError:
+                pass
+    if not versions:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="Precondition Failed: If-Match does not name this resource.",
+        )
+    return max(versions)
+
+
+def set_validators(
+    response: Response, etag: str, last_modified: Optional[datetime] = None
+) -> None:
+    """Sets the ETag, Last-Modified and Cache-Control headers of a response."""
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_datetime(
+            last_modified.astimezone(timezone.utc), usegmt=True
+        )
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(etag: str, last_modified: Optional[datetime] = None) -> Response:
+    """An empty 304 response carrying the current validators."""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validators(response, etag, last_modified)
+    return response
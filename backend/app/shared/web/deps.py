@@ -1,4 +1,6 @@
-from fastapi import Depends, HTTPException, status
+import inspect
+from typing import Any, Awaitable, Callable, Optional, Type, TypeVar
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -6,10 +8,15 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from app.config import settings
 from app.features.iam.domain.user import User
 from app.features.iam.infra.user_repository import UserRepository
-from app.shared.infrastructure.db.session import AsyncSessionFactory, get_db_session
-from app.shared.infrastructure.uow import IUnitOfWork, UnitOfWork
+from app.features.iam.infra.principal_cache import principal_cache
+from app.shared.infrastructure.db.replicas import replica_router
+from app.shared.infrastructure.db.session import get_db_session
+from app.shared.infrastructure.uow import IUnitOfWork, ReadOnlyUnitOfWork, UnitOfWork
 from app.shared.infrastructure.storage.interface import IFileStorage
-from app.shared.infrastructure.storage.local import LocalFileStorage
+from app.shared.infrastructure.storage.local import file_storage
+from app.shared.schemas import CursorParams, PageParams
+
+ParamsT = TypeVar("ParamsT")
 
 # This points to our login endpoint
 oauth2_scheme = OAuth2PasswordBearer(
@@ -18,7 +25,9 @@ oauth2_scheme = OAuth2PasswordBearer(
 
 
 async def get_current_user(
-    token: str = Depends(oauth2_scheme), session: AsyncSession = Depends(get_db_session)
+    request: Request,
+    token: str = Depends(oauth2_scheme),
+    session: AsyncSession = Depends(get_db_session),
 ) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -35,10 +44,22 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    repo = UserRepository(session)
-    user = await repo.get(user_id)
+    # Serve the principal from the cache when possible. The session is lazy,
+    # so a cache hit never checks out a connection or issues a SELECT.
+    user = principal_cache.get(user_id, token)
     if user is None:
-        raise credentials_exception
+        repo = UserRepository(session)
+        user = await repo.get(user_id)
+        if user is None:
+            raise credentials_exception
+        # The session is the request's (see `get_db_session`), shared with
+        # its unit of work; a cached principal must not be one of the
+        # instances that unit of work loads, changes or expires.
+        session.expunge(user)
+        principal_cache.set(user_id, token, user)
+
+    # Who the request acts for, for the units of work (see `get_uow`).
+    request.state.principal_id = str(user.id)
     return user
 
 
@@ -50,7 +71,7 @@ async def get_current_active_user(
     return current_user
 
 
-def get_current_active_superuser(
+async def get_current_active_superuser(
     current_user: User = Depends(get_current_active_user),
 ) -> User:
     """
@@ -65,15 +86,60 @@ def get_current_active_superuser(
     return current_user
 
 
-def get_uow() -> IUnitOfWork:
+def _principal_id(request: Request) -> Optional[str]:
+    return getattr(request.state, "principal_id", None)
+
+
+async def get_uow(
+    request: Request, session: AsyncSession = Depends(get_db_session)
+) -> IUnitOfWork:
     """
-    FastAPI dependency that provides a Unit of Work instance for a request.
+    FastAPI dependency that provides a Unit of Work instance for a request,
+    on the request's session: it continues the transaction authentication
+    started, if any, on the same connection.
+    A commit keeps the authenticated user's reads on the primary for a
+    while, so that they see their own write (see `ReplicaRouter`).
     """
-    return UnitOfWork(session_factory=AsyncSessionFactory)
+
+    async def record_write() -> None:
+        await replica_router.record_write(_principal_id(request))
+
+    return UnitOfWork(session_factory=lambda: session, after_commit=record_write)
 
 
-def get_file_storage() -> IFileStorage:
-    """Dependency to get a file storage instance."""
-    return LocalFileStorage(
-        base_path=settings.STATIC_FILES_PATH, base_url=settings.STATIC_URL
+async def get_read_uow(
+    request: Request, session: AsyncSession = Depends(get_db_session)
+) -> IUnitOfWork:
+    """
+    FastAPI dependency that provides a read-only Unit of Work for query
+    handlers, which may read from a replica. The request's session gives
+    its connection back first, so the request still holds only one.
+    """
+    return ReadOnlyUnitOfWork(
+        replica_router,
+        principal=lambda: _principal_id(request),
+        release=session.close,
     )
+
+
+async def get_file_storage() -> IFileStorage:
+    """Dependency to get the file storage (one per process)."""
+    return file_storage
+
+
+def _query_params(model: Type[ParamsT]) -> Callable[..., Awaitable[ParamsT]]:
+    """
+    An async dependency taking `model`'s fields as query parameters, like
+    `Depends(model)`, which FastAPI would call in its threadpool since a
+    class is not a coroutine function.
+    """
+
+    async def dependency(**params: Any) -> ParamsT:
+        return model(**params)
+
+    dependency.__signature__ = inspect.signature(model).replace(return_annotation=model)
+    return dependency
+
+
+get_page_params = _query_params(PageParams)
+get_cursor_params = _query_params(CursorParams)
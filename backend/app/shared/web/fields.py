@@ -0,0 +1,41 @@
+from typing import Callable, Optional, Sequence, Tuple, Type
+from fastapi import Query, Response
+from pydantic import BaseModel
+from app.shared.schemas import parse_fields
+
+# Returned with any fieldset: what identifies a resource and its version.
+IDENTITY_FIELDS = ("id", "version")
+
+
+def sparse_fields(
+    model: Type[BaseModel], required: Sequence[str] = IDENTITY_FIELDS
+) -> Callable[..., Optional[Tuple[str, ...]]]:
+    """
+    FastAPI dependency factory for a `?fields=` sparse fieldset of `model`.
+    The dependency yields the selected field names (see `parse_fields`), or
+    None when the parameter is absent and the full representation is wanted.
+    """
+    description = (
+        "Comma-separated fields to return, of: "
+        f"{', '.join(model.model_fields)}. "
+        f"Always returned: {', '.join(f'`{name}`' for name in required)}."
+    )
+
+    async def dependency(
+        fields: Optional[str] = Query(None, description=description),
+    ) -> Optional[Tuple[str, ...]]:
+        return parse_fields(fields, model, required) if fields else None
+
+    return dependency
+
+
+def sparse_response(content: BaseModel, response: Response) -> Response:
+    """
+    A JSON response of a sparse representation, serialized by its own
+    reduced model rather than validated against the route's full
+    `response_model`. Headers already set on the route's `response` (e.g. the
+    ETag) are carried over.
+    """
+    sparse = Response(content.model_dump_json(), media_type="application/json")
+    sparse.raw_headers.extend(response.raw_headers)
+    return sparse
@@ -1,6 +1,9 @@
-from fastapi import Request, Response
+import time
+import uuid
+import structlog
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from app.shared.domain.exceptions import (
     DomainError,
     BusinessRuleViolationError,
@@ -9,77 +12,141 @@ from app.shared.domain.exceptions import (
 from app.shared.application.exceptions import (
     ApplicationError,
     AuthorizationError,
+    ConcurrencyConflictError,
     ResourceNotFoundError,
 )
+from app.config import settings
+from app.shared.infrastructure.concurrency.cpu_executor import ExecutorOverloadedError
+from app.shared.infrastructure.db.instrumentation import QueryStats, track_queries
 
-import uuid
-import time
-import structlog
-from starlette.middleware.base import RequestResponseEndpoint
-
-
-class ExceptionHandlingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next) -> Response:
-        try:
-            response = await call_next(request)
-            return response
-        except BusinessRuleViolationError as e:
-            return JSONResponse(status_code=400, content={"detail": e.message})
-        except (AggregateNotFoundError, ResourceNotFoundError) as e:
-            return JSONResponse(
-                status_code=404, content={"detail": str(e) or "Resource not found"}
-            )
-        except AuthorizationError as e:
-            return JSONResponse(
-                status_code=403, content={"detail": str(e) or "Forbidden"}
-            )
-        except DomainError as e:
-            return JSONResponse(
-                status_code=409, content={"detail": f"Conflict: {e}"}
-            )  # 409 Conflict
-        except ApplicationError as e:
-            return JSONResponse(
-                status_code=422, content={"detail": f"Unprocessable Entity: {e}"}
-            )  # 422 Unprocessable
-        except Exception as e:
-            # Log the full exception traceback here for debugging
-            # logger.exception("An unexpected error occurred")
-            return JSONResponse(
-                status_code=500,
-                content={"detail": f"An internal server error occurred: {e}"},
-            )
-
-
-class LoggingContextMiddleware(BaseHTTPMiddleware):
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        # 清除上一个请求可能残留的上下文
-        structlog.contextvars.clear_contextvars()
+access_logger = structlog.get_logger("api.access")
+error_logger = structlog.get_logger("api.error")
+
+
+class RequestContextMiddleware:
+    """
+    A pure ASGI middleware for every HTTP request: it binds a request id and
+    the client to the log context, turns the exceptions the endpoints raise
+    into error responses (see `error_response`), and writes the access log
+    with the request's duration and SQL statements (see `track_queries`).
 
-        # 为当前请求绑定上下文信息
+    Response bodies are passed on as they are sent, never buffered, so
+    streaming responses reach the client untouched. X-Request-ID and
+    Server-Timing are added to the response headers, so Server-Timing
+    covers the time until the headers; the access log is written once the
+    body is complete and covers the whole response.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # 清除上一个请求可能残留的上下文, 并为当前请求绑定上下文信息
+        structlog.contextvars.clear_contextvars()
         request_id = str(uuid.uuid4())
+        client = scope.get("client")
         structlog.contextvars.bind_contextvars(
             request_id=request_id,
-            path=request.url.path,
-            method=request.method,
-            client_ip=request.client.host if request.client else "unknown",
+            path=scope["path"],
+            method=scope["method"],
+            client_ip=client[0] if client else "unknown",
         )
 
-        start_time = time.time()
+        start_time = time.perf_counter()
+        status_code = 500
+        response_started = False
+
+        async def send_with_context(message: Message) -> None:
+            nonlocal status_code, response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+                # 在返回的响应头中添加 request_id，方便前端或客户端追踪
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                if settings.SERVER_TIMING_ENABLED:
+                    headers.append(
+                        "Server-Timing",
+                        server_timing(queries, time.perf_counter() - start_time),
+                    )
+            await send(message)
 
-        # 在返回的响应头中添加 request_id，方便前端或客户端追踪
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
+        with track_queries() as queries:
+            try:
+                await self.app(scope, receive, send_with_context)
+            except Exception as e:
+                if response_started:
+                    # Failed mid-body: too late for an error response, the
+                    # server aborts it.
+                    error_logger.exception("Response aborted")
+                    raise
+                await error_response(e)(scope, receive, send_with_context)
+            finally:
+                process_time = time.perf_counter() - start_time
+                log_request(queries, status_code, process_time)
 
-        process_time = time.time() - start_time
 
-        # 记录请求完成的日志
-        logger = structlog.get_logger("api.access")
-        logger.info(
-            "Request completed",
-            status_code=response.status_code,
-            process_time=round(process_time, 4),
+def error_response(error: Exception) -> JSONResponse:
+    """The error response for an exception an endpoint did not handle."""
+    if isinstance(error, BusinessRuleViolationError):
+        return JSONResponse(status_code=400, content={"detail": error.message})
+    if isinstance(error, (AggregateNotFoundError, ResourceNotFoundError)):
+        return JSONResponse(
+            status_code=404, content={"detail": str(error) or "Resource not found"}
         )
+    if isinstance(error, AuthorizationError):
+        return JSONResponse(
+            status_code=403, content={"detail": str(error) or "Forbidden"}
+        )
+    if isinstance(error, ConcurrencyConflictError):
+        # The expected version comes from an If-Match precondition.
+        return JSONResponse(
+            status_code=412, content={"detail": f"Precondition Failed: {error}"}
+        )  # 412 Precondition Failed
+    if isinstance(error, DomainError):
+        return JSONResponse(
+            status_code=409, content={"detail": f"Conflict: {error}"}
+        )  # 409 Conflict
+    if isinstance(error, ApplicationError):
+        return JSONResponse(
+            status_code=422, content={"detail": f"Unprocessable Entity: {error}"}
+        )  # 422 Unprocessable
+    if isinstance(error, ExecutorOverloadedError):
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "Server is busy, please try again later."},
+        )  # 503 Service Unavailable
+    error_logger.error("An unexpected error occurred", exc_info=error)
+    return JSONResponse(
+        status_code=500,
+        content={"detail": f"An internal server error occurred: {error}"},
+    )
+
+
+def log_request(queries: QueryStats, status_code: int, process_time: float) -> None:
+    """Writes the access log line of a request, with its SQL metrics."""
+    structlog.contextvars.bind_contextvars(**queries.log_fields())
+    repeated = queries.repeated(settings.DB_N_PLUS_ONE_THRESHOLD)
+    for shape, count in repeated:
+        access_logger.warning("Possible N+1 query", statement=shape, executions=count)
+    access_logger.info(
+        "Request completed",
+        status_code=status_code,
+        process_time=round(process_time, 4),
+        db_repeated_statements=len(repeated),
+    )
+
 
-        return response
+def server_timing(queries: QueryStats, process_time: float) -> str:
+    """
+    A Server-Timing header value with the request's database time and total
+    time, both in milliseconds, which browsers' developer tools display.
+    """
+    return (
+        f'db;dur={queries.milliseconds};desc="statements={queries.statements} '
+        f'rows={queries.rows}", total;dur={round(process_time * 1000, 3)}'
+    )
@@ -0,0 +1,21 @@
+from starlette.responses import StreamingResponse
+from starlette.types import Send
+
+
+class ClosingStreamingResponse(StreamingResponse):
+    """
+    A StreamingResponse that always closes its body iterator when streaming
+    stops, including when the client disconnects mid-stream.
+
+    Starlette only stops iterating in that case; closing the async generator
+    right away lets it release what it holds (e.g. a server-side cursor and
+    its connection) instead of waiting for garbage collection.
+    """
+
+    async def stream_response(self, send: Send) -> None:
+        try:
+            await super().stream_response(send)
+        finally:
+            aclose = getattr(self.body_iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
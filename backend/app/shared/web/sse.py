@@ -0,0 +1,35 @@
+from contextlib import aclosing
+from typing import AsyncIterator, NamedTuple, Optional
+
+MEDIA_TYPE = "text/event-stream"
+
+# Streams must reach the client as they are written: no caching, and no
+# buffering by reverse proxies (nginx honours X-Accel-Buffering).
+HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+# Sent on idle streams so that proxies keep them open and disconnected
+# clients are noticed.
+KEEP_ALIVE = b": keep-alive\n\n"
+
+
+class ServerSentEvent(NamedTuple):
+    event: str
+    data: str  # A single line, e.g. compact JSON
+
+
+def encode(event: ServerSentEvent) -> bytes:
+    return f"event: {event.event}\ndata: {event.data}\n\n".encode("utf-8")
+
+
+async def event_stream(
+    events: AsyncIterator[Optional[ServerSentEvent]], retry_ms: int = 5000
+) -> AsyncIterator[bytes]:
+    """
+    Encodes an iterator of events as a `text/event-stream` body. A `None`
+    from `events` is sent as a keep-alive comment. `retry_ms` tells clients
+    how long to wait before reconnecting after the stream ends.
+    """
+    yield f"retry: {retry_ms}\n\n".encode("utf-8")
+    async with aclosing(events):
+        async for event in events:
+            yield KEEP_ALIVE if event is None else encode(event)
@@ -43,6 +43,8 @@ def import_all_models():
 
 
 import_all_models()
+# Tables of the shared infrastructure, outside the feature modules.
+importlib.import_module("app.shared.infrastructure.messaging.outbox")
 
 target_metadata = SQLModel.metadata
 
@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    # The app (asyncpg, the pools, the background tasks) runs on asyncio.
+    return "asyncio"
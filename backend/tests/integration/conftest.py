@@ -0,0 +1,92 @@
+"""
+Integration tests run the app in-process against the database configured
+by DATABASE_URL (e.g. a throwaway Postgres with the migrations applied),
+and are skipped when it cannot be reached.
+"""
+
+import uuid
+from typing import Any, AsyncIterator, Dict, Iterator, List, NamedTuple
+import httpx
+import pytest
+from sqlalchemy import event, insert, text
+from app.config import settings
+from app.features.item.domain.item import Item
+from app.main import app
+from app.shared.infrastructure.db.replicas import replica_router
+from app.shared.infrastructure.db.session import async_engine
+
+API = settings.API_V1_STR
+
+
+@pytest.fixture
+async def database() -> AsyncIterator[None]:
+    try:
+        async with async_engine.connect():
+            pass
+    except OSError as e:
+        pytest.skip(f"Database not reachable: {e}")
+    yield
+    # Pooled connections belong to this test's event loop.
+    await async_engine.dispose()
+    for replica in replica_router.replicas:
+        await replica.engine.dispose()
+
+
+@pytest.fixture
+def commits() -> Iterator[List[Any]]:
+    """The transactions committed on the primary while the test runs."""
+    committed: List[Any] = []
+
+    def on_commit(connection):
+        committed.append(connection)
+
+    event.listen(async_engine.sync_engine, "commit", on_commit)
+    yield committed
+    event.remove(async_engine.sync_engine, "commit", on_commit)
+
+
+@pytest.fixture
+async def client(database) -> AsyncIterator[httpx.AsyncClient]:
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+class RegisteredUser(NamedTuple):
+    id: str
+    username: str
+    headers: Dict[str, str]
+
+
+async def create_user(
+    client: httpx.AsyncClient, superuser: bool = False
+) -> RegisteredUser:
+    """Registers a new user and logs them in."""
+    name = f"u{uuid.uuid4().hex[:12]}"
+    response = await client.post(
+        f"{API}/register",
+        json={"username": name, "email": f"{name}@example.com", "password": "pw"},
+    )
+    assert response.status_code == 201, response.text
+    user_id = response.json()["id"]
+    if superuser:
+        async with async_engine.begin() as connection:
+            await connection.execute(
+                text('UPDATE "user" SET is_superuser = true WHERE id = :id'),
+                {"id": user_id},
+            )
+    response = await client.post(
+        f"{API}/login/access-token", data={"username": name, "password": "pw"}
+    )
+    assert response.status_code == 200, response.text
+    token = response.json()["access_token"]
+    return RegisteredUser(user_id, name, {"Authorization": f"Bearer {token}"})
+
+
+async def create_items(owner_id: str, count: int) -> None:
+    """Inserts items named "item 0", "item 1", ... for an owner."""
+    async with async_engine.begin() as connection:
+        await connection.execute(
+            insert(Item),
+            [{"name": f"item {n}", "owner_id": owner_id} for n in range(count)],
+        )
@@ -0,0 +1,27 @@
+import pytest
+from tests.integration.conftest import API, create_user
+
+pytestmark = pytest.mark.anyio
+
+
+async def _login(client, username: str, password: str) -> int:
+    response = await client.post(
+        f"{API}/login/access-token", data={"username": username, "password": password}
+    )
+    return response.status_code
+
+
+async def test_admin_password_reset_changes_the_login_password(client):
+    admin = await create_user(client, superuser=True)
+    user = await create_user(client)
+
+    response = await client.put(
+        f"{API}/admin/users/{user.id}",
+        headers=admin.headers,
+        json={"password": "new-password", "is_active": True},
+    )
+
+    assert response.status_code == 200, response.text
+    assert await _login(client, user.username, "new-password") == 200
+    assert await _login(client, f"{user.username}@example.com", "new-password") == 200
+    assert await _login(client, user.username, "pw") == 401
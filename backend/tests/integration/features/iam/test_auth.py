@@ -0,0 +1,39 @@
+import asyncio
+import threading
+import pytest
+from app.shared.infrastructure.concurrency.cpu_executor import cpu_executor
+from tests.integration.conftest import API, create_user
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_login_with_a_wrong_password_is_unauthorized(client):
+    user = await create_user(client)
+
+    response = await client.post(
+        f"{API}/login/access-token",
+        data={"username": user.username, "password": "wrong"},
+    )
+
+    assert response.status_code == 401
+
+
+async def test_login_is_unavailable_while_the_cpu_executor_is_full(client, monkeypatch):
+    user = await create_user(client)
+    monkeypatch.setattr(cpu_executor, "max_queue_size", 0)
+    release = threading.Event()
+    blockers = [
+        asyncio.ensure_future(cpu_executor.run(release.wait))
+        for _ in range(cpu_executor.max_workers)
+    ]
+    try:
+        response = await client.post(
+            f"{API}/login/access-token",
+            data={"username": user.username, "password": "pw"},
+        )
+    finally:
+        release.set()
+        await asyncio.gather(*blockers)
+
+    assert response.status_code == 503
+    assert response.json() == {"detail": "Server is busy, please try again later."}
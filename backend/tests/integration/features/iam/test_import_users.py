@@ -0,0 +1,68 @@
+import json
+import uuid
+import pytest
+from sqlalchemy import text
+from app.shared.infrastructure.db.session import async_engine
+from tests.integration.conftest import API, create_user
+
+pytestmark = pytest.mark.anyio
+
+
+async def _import(client, headers, rows):
+    body = "\n".join(json.dumps(row) for row in rows)
+    response = await client.post(
+        f"{API}/admin/users/import",
+        headers=headers,
+        files={"file": ("users.ndjson", body.encode())},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _row(name, **overrides):
+    return {"username": name, "email": f"{name}@example.com", "password": "pw"} | (
+        overrides
+    )
+
+
+async def test_over_long_fields_fail_only_their_row(client):
+    admin = await create_user(client, superuser=True)
+    name = f"i{uuid.uuid4().hex[:12]}"
+
+    result = await _import(
+        client,
+        admin.headers,
+        [
+            _row(name + "a" * 50),
+            _row(name + "b", email=f"{name}{'b' * 100}@example.com"),
+            _row(name + "c"),
+        ],
+    )
+
+    assert result["created"] == 1
+    assert [error["line"] for error in result["errors"]] == [1, 2]
+
+
+async def test_user_whose_identity_conflicts_is_reported_and_not_created(client):
+    admin = await create_user(client, superuser=True)
+    existing = await create_user(client)
+    name = f"i{uuid.uuid4().hex[:12]}"
+
+    # The username is free as a username, but already another user's
+    # email identity, so the user could not log in with it.
+    result = await _import(
+        client,
+        admin.headers,
+        [_row(f"{existing.username}@example.com", email=f"{name}@example.com")],
+    )
+
+    assert result["created"] == 0
+    assert result["errors"] == [
+        {"line": 1, "detail": "Email or username already exists."}
+    ]
+    async with async_engine.connect() as connection:
+        count = await connection.scalar(
+            text('SELECT count(*) FROM "user" WHERE email = :email'),
+            {"email": f"{name}@example.com"},
+        )
+    assert count == 0
@@ -0,0 +1,29 @@
+import pytest
+from app.shared.infrastructure.db.instrumentation import query_budget
+from tests.integration.conftest import API, create_user
+
+pytestmark = pytest.mark.anyio
+
+# Authenticating may look the principal up; the read itself is one statement.
+BUDGET = 2
+
+ROUTES = [
+    "/users/me",
+    "/admin/users",
+    "/admin/users?fields=username",
+    "/admin/users/cursor",
+    "/admin/users/{user_id}",
+    "/admin/users/{user_id}?fields=username",
+]
+
+
+@pytest.mark.parametrize("route", ROUTES)
+async def test_user_read_stays_within_budget(client, route):
+    admin = await create_user(client, superuser=True)
+
+    with query_budget(BUDGET):
+        response = await client.get(
+            API + route.format(user_id=admin.id), headers=admin.headers
+        )
+
+    assert response.status_code == 200, response.text
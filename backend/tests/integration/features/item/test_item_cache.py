@@ -0,0 +1,126 @@
+import uuid
+import pytest
+from app.features.item.application.user.commands.update_item import (
+    UpdateItemCommand,
+    UpdateItemHandler,
+)
+from app.features.item.infra import item_cache as item_cache_module
+from app.features.item.infra.item_cache import ItemCache, item_cache
+from app.features.item.infra.item_repository import ItemRepository
+from app.features.item.schemas import ItemUpdate
+from app.shared.infrastructure.cache.memory import MemoryCache
+from app.shared.infrastructure.db.replicas import ReadTarget, ReplicaRouter
+from app.shared.infrastructure.db.session import AsyncSessionFactory, async_engine
+from app.shared.infrastructure.uow import UnitOfWork
+from app.shared.web import deps
+from tests.integration.conftest import API, create_user
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def router_with_replica(monkeypatch):
+    """Routes reads to a 'replica' (the same database, for the test)."""
+    router = ReplicaRouter(
+        primary=deps.replica_router.primary,
+        replicas=[ReadTarget("replica", async_engine, healthy=True)],
+        write_marks=MemoryCache(max_size=100, ttl_seconds=60),
+        max_lag_seconds=5,
+        check_interval_seconds=5,
+    )
+    monkeypatch.setattr(deps, "replica_router", router)
+    return router
+
+
+class RecordingCache(MemoryCache):
+    """A memory cache that records how many commits preceded each delete."""
+
+    def __init__(self, commits):
+        super().__init__(max_size=100, ttl_seconds=60)
+        self._commits = commits
+        self.deletes = []
+
+    async def delete(self, *keys: str) -> None:
+        self.deletes.append((keys, len(self._commits)))
+        await super().delete(*keys)
+
+
+@pytest.fixture
+def recording_cache(monkeypatch, commits) -> RecordingCache:
+    """Replaces the item cache with one on a RecordingCache."""
+    backend = RecordingCache(commits)
+    monkeypatch.setattr(
+        item_cache_module, "item_cache", ItemCache(backend, backend_name="memory")
+    )
+    return backend
+
+
+async def _create_item(client, user) -> uuid.UUID:
+    response = await client.post(
+        f"{API}/items", headers=user.headers, json={"name": "a", "description": "d"}
+    )
+    item_id = uuid.UUID(response.json()["id"])
+    await item_cache.invalidate([item_id])
+    return item_id
+
+
+@pytest.mark.skipif(not item_cache.enabled, reason="Item cache disabled")
+async def test_items_read_from_a_replica_are_not_cached(client, router_with_replica):
+    owner = await create_user(client)
+    admin = await create_user(client, superuser=True)
+    item_id = await _create_item(client, owner)
+
+    response = await client.get(f"{API}/admin/items/{item_id}", headers=admin.headers)
+
+    assert response.status_code == 200
+    assert router_with_replica.replicas[0].reads == 1
+    assert await item_cache.get(item_id) is None
+
+
+@pytest.mark.skipif(not item_cache.enabled, reason="Item cache disabled")
+async def test_items_read_from_the_primary_are_cached(client, router_with_replica):
+    owner = await create_user(client)
+    item_id = await _create_item(client, owner)
+    # The owner just wrote, so their reads stick to the primary.
+    await router_with_replica.record_write(owner.id)
+
+    response = await client.get(f"{API}/items/{item_id}", headers=owner.headers)
+
+    assert response.status_code == 200
+    assert router_with_replica.replicas[0].reads == 0
+    assert (await item_cache.get(item_id)).version == 1
+
+
+async def test_updated_items_are_invalidated_after_the_commit(
+    client, commits, recording_cache
+):
+    owner = await create_user(client)
+    item_id = await _create_item(client, owner)
+    await recording_cache.set(str(item_id), "cached")
+
+    commits.clear()
+    await UpdateItemHandler(UnitOfWork(session_factory=AsyncSessionFactory)).handle(
+        UpdateItemCommand(
+            item_id=item_id, item_in=ItemUpdate(name="b"), owner_id=owner.id
+        )
+    )
+
+    assert recording_cache.deletes == [((str(item_id),), 1)]
+    assert await recording_cache.get(str(item_id)) is None
+
+
+async def test_rolled_back_changes_invalidate_nothing(client, recording_cache):
+    owner = await create_user(client)
+    item_id = await _create_item(client, owner)
+    await recording_cache.set(str(item_id), "cached")
+
+    uow = UnitOfWork(session_factory=AsyncSessionFactory)
+    with pytest.raises(RuntimeError):
+        async with uow:
+            repo = uow.get_repository(ItemRepository)
+            assert await repo.update(item_id, ItemUpdate(name="b"), owner.id)
+            await repo.remove(await repo.get(item_id, owner.id))
+            raise RuntimeError("Abort the unit of work.")
+
+    assert recording_cache.deletes == []
+    assert await recording_cache.get(str(item_id)) == "cached"
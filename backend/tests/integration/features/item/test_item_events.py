@@ -0,0 +1,137 @@
+import uuid
+import pytest
+from sqlalchemy import text
+from app.features.item.application.user.commands.delete_item import (
+    DeleteItemCommand,
+    DeleteItemHandler,
+)
+from app.shared.infrastructure.db.session import AsyncSessionFactory, async_engine
+from app.shared.infrastructure.uow import UnitOfWork
+from tests.integration.conftest import API, create_user
+
+pytestmark = pytest.mark.anyio
+
+
+async def _outbox_events(item_id: str):
+    async with async_engine.connect() as connection:
+        result = await connection.execute(
+            text(
+                "SELECT event_type FROM outbox_event"
+                " WHERE payload->>'item_id' = :item_id ORDER BY id"
+            ),
+            {"item_id": item_id},
+        )
+        return result.scalars().all()
+
+
+async def test_creating_an_item_commits_it_with_its_event(client, commits):
+    user = await create_user(client)
+
+    commits.clear()
+    response = await client.post(
+        f"{API}/items", headers=user.headers, json={"name": "a", "description": "d"}
+    )
+
+    assert response.status_code == 201
+    assert len(commits) == 1
+    assert await _outbox_events(response.json()["id"]) == ["ItemCreated"]
+
+
+async def test_deleting_an_item_commits_it_with_its_event(client, commits):
+    admin = await create_user(client, superuser=True)
+    response = await client.post(
+        f"{API}/items", headers=admin.headers, json={"name": "a", "description": "d"}
+    )
+    item_id = response.json()["id"]
+
+    commits.clear()
+    response = await client.delete(
+        f"{API}/admin/items/{item_id}", headers=admin.headers
+    )
+
+    assert response.status_code == 204
+    # The delete and its outbox row are one transaction.
+    assert len(commits) == 1
+    assert await _outbox_events(item_id) == ["ItemCreated", "ItemDeleted"]
+
+
+async def test_owner_delete_handler_commits_the_item_with_its_event(client, commits):
+    user = await create_user(client)
+    response = await client.post(
+        f"{API}/items", headers=user.headers, json={"name": "a", "description": "d"}
+    )
+    item_id = response.json()["id"]
+
+    commits.clear()
+    handler = DeleteItemHandler(UnitOfWork(session_factory=AsyncSessionFactory))
+    result = await handler.handle(
+        DeleteItemCommand(item_id=uuid.UUID(item_id), owner_id=uuid.UUID(user.id))
+    )
+
+    assert result.is_success
+    assert len(commits) == 1
+    assert await _outbox_events(item_id) == ["ItemCreated", "ItemDeleted"]
+
+
+async def _outbox_owners(item_id: str):
+    async with async_engine.connect() as connection:
+        result = await connection.execute(
+            text(
+                "SELECT event_type, payload->>'owner_id' FROM outbox_event"
+                " WHERE payload->>'item_id' = :item_id ORDER BY id"
+            ),
+            {"item_id": item_id},
+        )
+        return [tuple(row) for row in result]
+
+
+@pytest.mark.parametrize("bulk", [False, True])
+async def test_reassigning_an_item_tells_its_previous_owner(client, bulk):
+    admin = await create_user(client, superuser=True)
+    owner = await create_user(client)
+    new_owner = await create_user(client)
+    response = await client.post(
+        f"{API}/items", headers=owner.headers, json={"name": "a", "description": "d"}
+    )
+    item_id = response.json()["id"]
+
+    if bulk:
+        response = await client.patch(
+            f"{API}/admin/items/bulk",
+            headers=admin.headers,
+            json={"items": [{"id": item_id, "owner_id": new_owner.id}]},
+        )
+    else:
+        response = await client.put(
+            f"{API}/admin/items/{item_id}",
+            headers=admin.headers,
+            json={"owner_id": new_owner.id},
+        )
+
+    assert response.status_code == 200, response.text
+    assert await _outbox_owners(item_id) == [
+        ("ItemCreated", owner.id),
+        ("ItemUpdated", new_owner.id),
+        ("ItemMoved", owner.id),
+    ]
+
+
+async def test_updating_an_item_in_place_moves_nothing(client):
+    admin = await create_user(client, superuser=True)
+    owner = await create_user(client)
+    response = await client.post(
+        f"{API}/items", headers=owner.headers, json={"name": "a", "description": "d"}
+    )
+    item_id = response.json()["id"]
+
+    response = await client.put(
+        f"{API}/admin/items/{item_id}",
+        headers=admin.headers,
+        json={"name": "b", "owner_id": owner.id},
+    )
+
+    assert response.status_code == 200, response.text
+    assert [event for event, _ in await _outbox_owners(item_id)] == [
+        "ItemCreated",
+        "ItemUpdated",
+    ]
@@ -0,0 +1,62 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+import pytest
+from sqlalchemy import insert
+from app.features.item.domain.item import Item
+from app.shared.domain.ids import uuid7
+from app.shared.infrastructure.db.session import async_engine
+from tests.integration.conftest import API, create_user
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def owner(client):
+    """
+    A user with an item from before ids were UUIDv7, whose random id sorts
+    above any UUIDv7, and two items created since.
+    """
+    user = await create_user(client)
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "id": uuid.UUID("f" * 8 + str(uuid.uuid4())[8:]),
+            "name": "legacy",
+            "created_at": now - timedelta(days=365),
+        },
+        {"id": uuid7(), "name": "older", "created_at": now - timedelta(minutes=1)},
+        {"id": uuid7(), "name": "newer", "created_at": now},
+    ]
+    async with async_engine.begin() as connection:
+        await connection.execute(
+            insert(Item), [row | {"owner_id": user.id} for row in rows]
+        )
+    return user
+
+
+async def test_page_lists_newest_first(client, owner):
+    response = await client.get(f"{API}/items", headers=owner.headers)
+
+    assert response.status_code == 200, response.text
+    names = [item["name"] for item in response.json()["items"]]
+    assert names == ["newer", "older", "legacy"]
+
+
+@pytest.mark.parametrize("fields", [None, "name"])
+async def test_cursor_pages_list_newest_first(client, owner, fields):
+    names, cursor = [], None
+    while True:
+        params = {"size": 1} | ({"cursor": cursor} if cursor else {})
+        if fields:
+            params["fields"] = fields
+        response = await client.get(
+            f"{API}/items/cursor", headers=owner.headers, params=params
+        )
+        assert response.status_code == 200, response.text
+        page = response.json()
+        names += [item["name"] for item in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert names == ["newer", "older", "legacy"]
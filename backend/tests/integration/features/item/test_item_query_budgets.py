@@ -0,0 +1,41 @@
+import pytest
+from app.shared.infrastructure.db.instrumentation import query_budget
+from tests.integration.conftest import API, create_items, create_user
+
+pytestmark = pytest.mark.anyio
+
+# Authenticating may look the principal up; the read itself is one statement.
+BUDGET = 2
+
+ROUTES = [
+    "/items",
+    "/items?page=99",
+    "/items?fields=name",
+    "/items/cursor",
+    "/items/cursor?fields=name",
+    "/items/{item_id}",
+    "/items/{item_id}?fields=name",
+    "/admin/items",
+    "/admin/items/cursor",
+    "/admin/items/{item_id}",
+]
+
+
+@pytest.fixture
+async def admin(client):
+    admin = await create_user(client, superuser=True)
+    await create_items(admin.id, 3)
+    return admin
+
+
+@pytest.mark.parametrize("route", ROUTES)
+async def test_item_read_stays_within_budget(client, admin, route):
+    response = await client.get(f"{API}/items", headers=admin.headers)
+    item_id = response.json()["items"][0]["id"]
+
+    with query_budget(BUDGET):
+        response = await client.get(
+            API + route.format(item_id=item_id), headers=admin.headers
+        )
+
+    assert response.status_code == 200, response.text
@@ -0,0 +1,97 @@
+"""
+Guards the item queries against losing their indexes: each repository query
+is captured as it runs and EXPLAINed with sequential scans disabled, which
+the planner only falls back to when no index can serve the query. A small
+test database would otherwise be scanned whatever the indexes.
+"""
+
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Iterator, List, Tuple
+import pytest
+from sqlalchemy import event
+from app.features.item.infra.item_repository import ItemRepository
+from app.shared.infrastructure.db.session import AsyncSessionFactory, async_engine
+from app.shared.schemas import CountStrategy
+from tests.integration.conftest import create_items, create_user
+
+pytestmark = pytest.mark.anyio
+
+
+@contextmanager
+def captured_statements() -> Iterator[List[Tuple[str, Any]]]:
+    statements: List[Tuple[str, Any]] = []
+
+    def capture(connection, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    sync_engine = async_engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
+
+
+def _seq_scanned_relations(plan: dict) -> List[str]:
+    relations = []
+    if plan["Node Type"] == "Seq Scan":
+        relations.append(plan["Relation Name"])
+    for child in plan.get("Plans", ()):
+        relations += _seq_scanned_relations(child)
+    return relations
+
+
+async def _explain(statement: str, parameters: Any) -> dict:
+    async with async_engine.connect() as connection:
+        await connection.exec_driver_sql("SET enable_seqscan = off")
+        result = await connection.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {statement}", tuple(parameters)
+        )
+        return result.scalar()[0]["Plan"]
+
+
+@pytest.fixture
+async def owner_id(client) -> uuid.UUID:
+    user = await create_user(client)
+    await create_items(user.id, 3)
+    return uuid.UUID(user.id)
+
+
+QUERIES = {
+    "get": lambda repo, owner_id: repo.get(uuid.uuid4(), owner_id),
+    "owner list": lambda repo, owner_id: repo.get_multi_by_owner_paginated(
+        owner_id, count_strategy=CountStrategy.NONE
+    ),
+    "owner list with count": lambda repo, owner_id: repo.get_multi_by_owner_paginated(
+        owner_id, offset=10
+    ),
+    "owner keyset": lambda repo, owner_id: repo.get_multi_by_owner_keyset(
+        owner_id, after=(datetime.now(timezone.utc), uuid.uuid4())
+    ),
+    "owner versions keyset": lambda repo, owner_id: repo.get_versions_by_owner_keyset(
+        owner_id, after=(datetime.now(timezone.utc), uuid.uuid4())
+    ),
+    "owner search": lambda repo, owner_id: repo.search("item", owner_id),
+    "search": lambda repo, owner_id: repo.search("item", None),
+    "owner autocomplete": lambda repo, owner_id: repo.autocomplete_names(
+        "ite", owner_id
+    ),
+    "autocomplete": lambda repo, owner_id: repo.autocomplete_names("ite", None),
+    "admin keyset": lambda repo, owner_id: repo.get_multi_admin_keyset(
+        after=(datetime.now(timezone.utc), uuid.uuid4())
+    ),
+}
+
+
+@pytest.mark.parametrize("query", QUERIES)
+async def test_query_does_not_scan_the_item_table(owner_id, query):
+    async with AsyncSessionFactory() as session:
+        with captured_statements() as statements:
+            await QUERIES[query](ItemRepository(session), owner_id)
+
+    assert statements
+    for statement, parameters in statements:
+        plan = await _explain(statement, parameters)
+        assert "item" not in _seq_scanned_relations(plan), statement
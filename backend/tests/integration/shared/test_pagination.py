@@ -0,0 +1,72 @@
+import pytest
+from app.features.iam.domain.user import User
+from app.features.iam.infra.user_repository import UserRepository
+from app.features.item.infra.item_repository import ItemRepository
+from app.shared.infrastructure.db.instrumentation import query_budget
+from app.shared.infrastructure.db.session import AsyncSessionFactory
+from tests.integration.conftest import create_items, create_user
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def owner(client):
+    """A user with three items."""
+    user = await create_user(client)
+    await create_items(user.id, 3)
+    return user
+
+
+@pytest.fixture
+async def session(database):
+    async with AsyncSessionFactory() as session:
+        yield session
+
+
+@pytest.mark.parametrize("columns", [None, ("id", "name")])
+async def test_owner_list_page_and_total_in_one_statement(session, owner, columns):
+    repo = ItemRepository(session)
+
+    with query_budget(1):
+        page = await repo.get_multi_by_owner_paginated(
+            owner.id, offset=1, limit=1, columns=columns
+        )
+
+    assert page.total == 3
+    assert page.has_next is True
+    # Sparse pages hold tuples of the columns, in order.
+    names = [item.name if columns is None else item[1] for item in page.items]
+    assert names == ["item 1"]
+
+
+async def test_owner_list_past_the_last_page_in_one_statement(session, owner):
+    repo = ItemRepository(session)
+
+    with query_budget(1):
+        page = await repo.get_multi_by_owner_paginated(owner.id, offset=10)
+
+    assert page == ([], 3, False)
+
+
+async def test_admin_list_page_and_total_in_one_statement(session, owner):
+    repo = ItemRepository(session)
+
+    with query_budget(1):
+        page = await repo.get_multi_admin_paginated(limit=2)
+
+    assert len(page.items) == 2
+    assert page.total >= 3
+    assert page.has_next is True
+
+
+async def test_user_list_pages_in_one_statement(session, owner):
+    repo = UserRepository(session)
+
+    with query_budget(1):
+        page = await repo.get_multi_paginated(limit=1)
+    assert isinstance(page.items[0], User)
+    total = page.total
+
+    with query_budget(1):
+        page = await repo.get_multi_paginated(skip=total, limit=1)
+    assert page == ([], total, False)
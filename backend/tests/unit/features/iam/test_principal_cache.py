@@ -0,0 +1,46 @@
+import time
+import uuid
+from types import SimpleNamespace
+from app.features.iam.infra.principal_cache import PrincipalCache
+
+
+def _user(name: str) -> SimpleNamespace:
+    # Stands in for a User; the cache only keeps a reference to it.
+    return SimpleNamespace(id=uuid.uuid4(), username=name)
+
+
+def test_invalidate_drops_every_token_of_the_user():
+    cache = PrincipalCache(max_size=10, ttl_seconds=60)
+    alice, bob = _user("alice"), _user("bob")
+    cache.set(alice.id, "phone", alice)
+    cache.set(alice.id, "laptop", alice)
+    cache.set(bob.id, "phone", bob)
+
+    cache.invalidate(alice.id)
+
+    assert cache.get(alice.id, "phone") is None
+    assert cache.get(alice.id, "laptop") is None
+    assert cache.get(bob.id, "phone") is bob
+
+
+def test_evicted_entries_leave_the_user_index():
+    cache = PrincipalCache(max_size=1, ttl_seconds=60)
+    alice, bob = _user("alice"), _user("bob")
+    cache.set(alice.id, "token", alice)
+
+    cache.set(bob.id, "token", bob)
+
+    assert cache.get(alice.id, "token") is None
+    assert list(cache._keys_by_user) == [str(bob.id)]
+
+
+def test_expired_entries_are_misses_and_leave_the_user_index(monkeypatch):
+    cache = PrincipalCache(max_size=10, ttl_seconds=60)
+    alice = _user("alice")
+    cache.set(alice.id, "token", alice)
+
+    later = time.monotonic() + 61
+    monkeypatch.setattr(time, "monotonic", lambda: later)
+
+    assert cache.get(alice.id, "token") is None
+    assert cache._keys_by_user == {}
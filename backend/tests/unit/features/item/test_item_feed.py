@@ -0,0 +1,42 @@
+import uuid
+import pytest
+from app.features.item.domain.events import ItemMoved, ItemUpdated
+from app.features.item.infra import item_feed as item_feed_module
+from app.features.item.infra.item_feed import RESYNC, ItemChangeFeed
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def feed(monkeypatch) -> ItemChangeFeed:
+    """A feed that receives notifications directly instead of over Postgres."""
+    feed = ItemChangeFeed(buffer_size=10)
+
+    async def notify(channel, payloads):
+        for payload in payloads:
+            feed.dispatch(payload)
+
+    monkeypatch.setattr(item_feed_module, "notify", notify)
+    return feed
+
+
+async def test_a_reassigned_item_reaches_both_owners(feed):
+    item_id, previous_owner, new_owner = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    with (
+        feed.subscribe(previous_owner) as previous,
+        feed.subscribe(new_owner) as new,
+    ):
+        await item_feed_module.notify_item_changes(
+            [
+                ItemUpdated(item_id=item_id, owner_id=new_owner, version=2),
+                ItemMoved(item_id=item_id, owner_id=previous_owner, version=2),
+            ]
+        )
+
+        assert await previous.next(0.1) == RESYNC
+        assert (await previous.next(0.1)).event == "item.moved"
+        assert await previous.next(0.1) is None
+        assert await new.next(0.1) == RESYNC
+        assert (await new.next(0.1)).event == "item.updated"
+        assert await new.next(0.1) is None
@@ -0,0 +1,69 @@
+import asyncio
+import threading
+import pytest
+from app.shared.infrastructure.concurrency.cpu_executor import (
+    CpuBoundExecutor,
+    ExecutorOverloadedError,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+async def _settle(executor: CpuBoundExecutor) -> None:
+    # The done callbacks reach the loop through call_soon_threadsafe.
+    for _ in range(100):
+        if executor.stats()["in_flight"] == 0:
+            return
+        await asyncio.sleep(0.01)
+
+
+async def test_a_cancelled_wait_stays_in_flight_until_the_worker_is_done():
+    executor = CpuBoundExecutor(max_workers=1, max_queue_size=0)
+    started, release = threading.Event(), threading.Event()
+
+    def work():
+        started.set()
+        release.wait()
+
+    waiter = asyncio.ensure_future(executor.run(work))
+    await asyncio.to_thread(started.wait)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    # The thread is still busy, so the executor is still full.
+    assert executor.stats()["in_flight"] == 1
+    with pytest.raises(ExecutorOverloadedError):
+        await executor.run(work)
+
+    release.set()
+    await _settle(executor)
+    stats = executor.stats()
+    assert stats["in_flight"] == 0
+    assert (stats["completed"], stats["failed"], stats["rejected"]) == (1, 0, 1)
+    executor.shutdown()
+
+
+async def test_failures_and_cancellations_are_not_counted_as_completed():
+    executor = CpuBoundExecutor(max_workers=1, max_queue_size=1)
+    release = threading.Event()
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await executor.run(fail)
+
+    blocker = asyncio.ensure_future(executor.run(release.wait))
+    queued = asyncio.ensure_future(executor.run(release.wait))
+    await asyncio.sleep(0.01)
+    queued.cancel()  # Still queued: it never runs.
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    release.set()
+    await blocker
+
+    await _settle(executor)
+    stats = executor.stats()
+    assert (stats["completed"], stats["failed"], stats["cancelled"]) == (1, 1, 1)
+    executor.shutdown()